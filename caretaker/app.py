@@ -1,15 +1,44 @@
 import os
+import threading
 import jwt
 from functools import wraps
-from flask import Flask, render_template, jsonify, request, g
+from flask import Flask, Response, render_template, jsonify, request, g, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 
 from caretaker.core.config import get_username
-from caretaker.plugins import load_plugins, get_plugin
+from caretaker.plugins import get_plugin
 from caretaker.core.context import build_context
 from caretaker.core.reporting import write_json
+from caretaker.core.records import json_default
+from caretaker.core.lanes import BULK_WRITE, INTERACTIVE, SCHEDULED, request_lane, reset_lane, set_lane
+
+class RecordJSONProvider(DefaultJSONProvider):
+    """Lets plugin results hold RepoRecord/IssueRecord objects directly."""
+    @staticmethod
+    def default(o):
+        # Records serialize as in reports and the CLI; anything else as Flask would
+        try:
+            return json_default(o)
+        except TypeError:
+            return DefaultJSONProvider.default(o)
 
 app = Flask(__name__, template_folder="templates", static_folder="static")
 app.config['SECRET_KEY'] = os.getenv('JWT_SECRET', 'dev-secret-key')
+app.json = RecordJSONProvider(app)
+
+# Routes that sweep the whole fleet; they queue with the scheduler instead of using the interactive reserve
+SWEEP_ENDPOINTS = {"run_plugin", "stream_plugin", "cleanup_duplicates"}
+
+@app.before_request
+def interactive_lane():
+    # Page loads and read-only API calls go ahead of the scheduler's sweeps on the shared client
+    g.lane_token = set_lane(SCHEDULED if request.endpoint in SWEEP_ENDPOINTS else INTERACTIVE)
+
+@app.teardown_request
+def restore_lane(exc=None):
+    token = g.pop("lane_token", None)
+    if token is not None:
+        reset_lane(token)
 
 # Authentication Middleware
 def token_required(f):
@@ -37,25 +66,34 @@ def token_required(f):
         return f(*args, **kwargs)
     return decorated
 
-# Global initialization using shared context factory
+# Shared context, built from config by get_ctx() on the first request rather than at import
 # We don't pass an owner yet, will rely on config
 # Ideally, owner should be per-request or from config
-ctx = build_context()
+ctx = None
+_ctx_lock = threading.Lock()
 
-# Ensure MonitorAgent is attached to context
-if not ctx.monitor:
-    monitor_agent = get_plugin('monitor')
-    ctx.monitor = monitor_agent
-    # Note: monitor_agent is not started here, just attached.
-    # If run_plugin('monitor') is called, it will run.
+def get_ctx():
+    global ctx
+    with _ctx_lock:
+        if ctx is None:
+            built = build_context()
+            # Ensure MonitorAgent is attached to context
+            if not built.monitor:
+                # Note: monitor_agent is not started here, just attached.
+                # If run_plugin('monitor') is called, it will run.
+                built.monitor = get_plugin('monitor')
+            ctx = built
+    return ctx
 
-# Pre-load plugins for the API availability
-plugins = load_plugins()
+def dashboard_repos():
+    ctx = get_ctx()
+    # Dashboards read the local mirror, which refreshes itself once stale
+    return ctx.store.repos(ctx.owner)
 
 @app.route("/")
 @token_required
 def index():
-    repos = ctx.client.list_user_repos(ctx.owner)
+    repos = dashboard_repos()
     return render_template("index.html", repos=repos)
 
 @app.route("/run/<name>")
@@ -65,15 +103,43 @@ def run_plugin(name):
     # But for simplicity we can iterate the loaded list or use get_plugin
     p = get_plugin(name)
     if p:
+        ctx = get_ctx()
+        if ctx.client.cache:
+            ctx.client.cache.reset_stats()
+        before = ctx.client.api_profile()
         result = p.run(ctx)
-        write_json(os.path.join(os.getcwd(), "reports"), f"{name}", result)
+        write_json(os.path.join(os.getcwd(), "reports"), f"{name}", result, api=ctx.client.api_profile(since=before))
         return jsonify(result)
     return jsonify({"error": "plugin not found"}), 404
 
+@app.route("/stream/<name>")
+@token_required
+def stream_plugin(name):
+    """Relay a plugin's records as server-sent events as it produces them, ending with a ``done`` event."""
+    p = get_plugin(name)
+    if not p:
+        return jsonify({"error": "plugin not found"}), 404
+    ctx = get_ctx()
+
+    def events():
+        count = 0
+        try:
+            for record in p.stream(ctx):
+                count += 1
+                yield f"data: {app.json.dumps(record)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {app.json.dumps({'error': str(e), 'records': count})}\n\n"
+            return
+        yield f"event: done\ndata: {app.json.dumps({'records': count})}\n\n"
+
+    # Records are small and per repo; nothing is held back for the whole fleet
+    return Response(stream_with_context(events()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
 @app.route("/repos")
 @token_required
 def repos():
-    repos = ctx.client.list_user_repos(ctx.owner)
+    repos = dashboard_repos()
     return render_template("repos.html", repos=repos)
 
 @app.route("/reports")
@@ -88,8 +154,11 @@ def cleanup_duplicates():
     if not p:
          return jsonify({"error": "duplicates plugin not found"}), 500
          
+    ctx = get_ctx()
+    before = ctx.client.api_profile()
     result = p.run(ctx)
-    archived = []
+    # Every non-hero repo is archived through one batched GraphQL mutation rather than a PATCH each
+    batch = ctx.client.batch_writes()
     groups = result.get("groups", {})
     for _, items in groups.items():
         if len(items) <= 1:
@@ -98,9 +167,11 @@ def cleanup_duplicates():
         for r in items:
             if r["name"] == hero["name"]:
                 continue
-            ok = ctx.client.archive_repo(ctx.owner, r["name"])
-            archived.append({"repo": r["name"], "archived": ok})
-    write_json(os.path.join(os.getcwd(), "reports"), "cleanup_duplicates", {"archived": archived})
+            batch.archive_repo(ctx.owner, r["name"], node_id=r.get("node_id"))
+    with request_lane(BULK_WRITE):
+        archived = [{"repo": op.repo, "archived": op.ok} for op in batch.flush()]
+    write_json(os.path.join(os.getcwd(), "reports"), "cleanup_duplicates", {"archived": archived},
+               api=ctx.client.api_profile(since=before))
     return jsonify({"archived": archived})
 
 def create_app():
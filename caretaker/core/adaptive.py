@@ -0,0 +1,150 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Dict
+
+class AIMDLimiter:
+    """Concurrency limit that adapts to how GitHub is coping.
+
+    Additive increase: after ``limit`` consecutive healthy responses (no
+    throttling, latency under ``latency_target``) one more request may be
+    in flight. Multiplicative decrease: a throttling or overload signal
+    scales the limit by ``decrease``, at most once per ``cooldown`` seconds
+    so one burst of rejections counts as a single congestion event.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 20, decrease: float = 0.5,
+                 latency_target: float = 5.0, cooldown: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self.clock = clock
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self._healthy = 0
+        self._decreased_at = float("-inf")
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+
+    def on_success(self, latency: float):
+        with self._cond:
+            if latency > self.latency_target:
+                self._healthy = 0
+                return
+            self._healthy += 1
+            if self._healthy >= int(self.limit) and self.limit < self.maximum:
+                self._healthy = 0
+                self.limit = min(self.maximum, self.limit + 1)
+                self.increases += 1
+                self._cond.notify()
+
+    def on_congestion(self):
+        with self._cond:
+            self._healthy = 0
+            now = self.clock()
+            if now - self._decreased_at < self.cooldown:
+                return
+            self._decreased_at = now
+            self.limit = max(float(self.minimum), self.limit * self.decrease)
+            self.decreases += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {"limit": int(self.limit), "in_flight": self.in_flight,
+                    "increases": self.increases, "decreases": self.decreases}
+
+class CircuitBreaker:
+    """Fails fast while a host is down instead of queueing requests into an outage.
+
+    Opens after ``failure_threshold`` consecutive failures (5xx or connection
+    errors). After ``reset_timeout`` seconds one probe request is let through;
+    its success closes the circuit, its failure reopens it for twice as long
+    (up to ``max_timeout``).
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, max_timeout: float = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.base_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.max_timeout = max_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.reset_timeout = self.base_timeout
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN:
+                self.reset_timeout = min(self.max_timeout, self.reset_timeout * 2)
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+            self._probing = False
+
+    def retry_in(self) -> float:
+        with self._lock:
+            return max(0.0, self.opened_at + self.reset_timeout - self.clock()) if self.state == self.OPEN else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self.state, "failures": self.failures, "reset_timeout": self.reset_timeout}
+
+def backoff(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Full-jitter exponential backoff, so parallel workers don't retry in lockstep."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+_LIMITERS: Dict[str, AIMDLimiter] = {}
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+def get_limiter(host: str) -> AIMDLimiter:
+    """Process-wide concurrency controller for an API host."""
+    with _REGISTRY_LOCK:
+        if host not in _LIMITERS:
+            _LIMITERS[host] = AIMDLimiter()
+        return _LIMITERS[host]
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """Process-wide circuit breaker for an API host."""
+    with _REGISTRY_LOCK:
+        if host not in _BREAKERS:
+            _BREAKERS[host] = CircuitBreaker()
+        return _BREAKERS[host]
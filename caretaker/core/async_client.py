@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.records import IssueRecord, RepoRecord
+
+def last_page(resp: requests.Response) -> Optional[int]:
+    """Page number advertised by the ``Link: rel="last"`` header, if any."""
+    url = resp.links.get("last", {}).get("url")
+    if not url:
+        return None
+    try:
+        return int(parse_qs(urlparse(url).query)["page"][0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+class AsyncGitHubClient:
+    """Asyncio variant of GitHubClient with bounded concurrency.
+
+    Requests are executed on worker threads through the wrapped synchronous
+    client, so the response cache and rate-limit handling are shared with
+    every other user of that client. Paginated listings read the first page,
+    then fetch the remaining pages concurrently; every other method is the
+    client's own, with the same signature, awaited on a worker thread.
+    """
+
+    def __init__(self, client: GitHubClient, max_concurrency: int = 8):
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        for prefix in ("https://", "http://"):
+            # Only resize the default transport; leave record/replay or other custom adapters in place
+            if type(self.client.session.adapters.get(prefix)) is HTTPAdapter:
+                self.client.session.mount(prefix, adapter)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop_id = id(asyncio.get_running_loop())
+        if loop_id not in self._semaphores:
+            self._semaphores = {loop_id: asyncio.Semaphore(self.max_concurrency)}
+        return self._semaphores[loop_id]
+
+    async def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None,
+                       cost: Optional[int] = None) -> requests.Response:
+        async with self._semaphore():
+            return await asyncio.to_thread(self.client._request, method, path, params, json, cost)
+
+    async def _call(self, name: str, *args, **kwargs):
+        async with self._semaphore():
+            return await asyncio.to_thread(getattr(self.client, name), *args, **kwargs)
+
+    def __getattr__(self, name: str):
+        # Any client method without a native coroutine (mostly writes) runs on a worker thread.
+        attr = getattr(self.client, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return await self._call(name, *args, **kwargs)
+        return call
+
+    async def paginate(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        def page_params(page: int) -> Dict[str, Any]:
+            p = dict(params or {})
+            p.update({"per_page": 100, "page": page})
+            return p
+
+        first = await self._request("GET", path, params=page_params(1))
+        if first.status_code != 200:
+            return []
+        items: List[Dict[str, Any]] = list(first.json())
+        last = last_page(first)
+        if last and last > 1:
+            pages = await asyncio.gather(*(self._request("GET", path, params=page_params(n)) for n in range(2, last + 1)))
+            for resp in pages:
+                if resp.status_code != 200:
+                    break
+                items.extend(resp.json())
+            return items
+
+        # No Link header: fall back to walking pages until one comes back short.
+        page = 1
+        batch = items
+        while len(batch) >= 100:
+            page += 1
+            resp = await self._request("GET", path, params=page_params(page))
+            if resp.status_code != 200:
+                break
+            batch = resp.json()
+            items.extend(batch)
+        return items
+
+    async def list_user_repos(self, username: str, raw: bool = False) -> List[RepoRecord]:
+        items = await self.paginate(f"/users/{username}/repos")
+        return items if raw else [RepoRecord(r) for r in items]
+
+    async def list_issues(self, owner: str, repo: str, state: str = "open", since: Optional[str] = None,
+                          until: Optional[str] = None, raw: bool = False) -> List[IssueRecord]:
+        """Issues (and PRs) of ``repo``, as ``GitHubClient.list_issues`` but with the pages fetched concurrently."""
+        items = await self.paginate(f"/repos/{owner}/{repo}/issues", params=self.client._issue_params(state, since))
+        return self.client._updated_until(items if raw else [IssueRecord(i) for i in items], until)
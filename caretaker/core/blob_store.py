@@ -0,0 +1,82 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+def git_blob_sha(data: bytes) -> str:
+    """The sha git (and the GitHub API) gives a file with this content."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+class BlobStore:
+    """Content-addressed file contents keyed by git blob sha.
+
+    A blob's sha is known from a tree listing before its content is
+    fetched, so a file whose sha is already here (the same LICENSE or CI
+    workflow in dozens of repos) is never downloaded again. Contents are
+    verified against their sha on the way in. Without ``blob_dir`` blobs
+    are kept in memory, least recently used first out once they exceed
+    ``max_bytes``.
+    """
+
+    def __init__(self, blob_dir: Optional[str] = None, max_bytes: int = 32 * 1024 * 1024):
+        self.blob_dir = blob_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, sha: str) -> str:
+        return os.path.join(self.blob_dir, sha[:2], sha)
+
+    def get(self, sha: str) -> Optional[bytes]:
+        if self.blob_dir is None:
+            with self._lock:
+                data = self._memory.get(sha)
+                if data is not None:
+                    self._memory.move_to_end(sha)
+        else:
+            try:
+                with open(self._path(sha), "rb") as f:
+                    data = f.read()
+            except OSError:
+                data = None
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.bytes_saved += len(data)
+        return data
+
+    def put(self, data: bytes, sha: Optional[str] = None) -> Optional[str]:
+        """Store ``data``; returns its sha, or None if it does not match the expected ``sha``."""
+        actual = git_blob_sha(data)
+        if sha and sha != actual:
+            return None
+        if self.blob_dir is None:
+            if len(data) > self.max_bytes:
+                return actual
+            with self._lock:
+                if actual not in self._memory:
+                    self._memory_bytes += len(data)
+                self._memory[actual] = data
+                self._memory.move_to_end(actual)
+                while self._memory_bytes > self.max_bytes:
+                    _, evicted = self._memory.popitem(last=False)
+                    self._memory_bytes -= len(evicted)
+            return actual
+        path = self._path(actual)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        return actual
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "bytes_saved": self.bytes_saved}
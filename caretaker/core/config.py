@@ -20,9 +20,21 @@ class Config:
             if not os.getenv("CI") and not os.getenv("TEST_MODE"):
                  print("⚠️  WARNING: GH_TOKEN or GITHUB_TOKEN is missing. API calls will fail.")
 
+        # Extra read tokens (comma separated) pooled with the main one; writes use GH_WRITE_TOKEN or GH_TOKEN
+        extra = [t.strip() for t in os.getenv("GH_TOKENS", "").split(",") if t.strip()]
+        self.write_token = os.getenv("GH_WRITE_TOKEN", "") or self.github_token
+        self.github_tokens = [t for t in dict.fromkeys([self.github_token] + extra) if t]
+
         self.username = os.getenv("GH_USERNAME", "welshDog")
         self.base_url = os.getenv("GH_API", "https://api.github.com")
         self.schedule_cron = os.getenv("GH_SCHEDULE_CRON", "0 3 * * *")
+        self.cache_dir = os.getenv("GH_CACHE_DIR", ".caretaker")
+        self.http_cache = os.getenv("GH_HTTP_CACHE", "1") != "0"
+        self.incremental = os.getenv("GH_INCREMENTAL", "1") != "0"
+        self.mirror = os.getenv("GH_MIRROR", "1") != "0"
+        self.mirror_max_age = float(os.getenv("GH_MIRROR_MAX_AGE", "900"))
+        self.include_private = os.getenv("GH_INCLUDE_PRIVATE", "0") == "1"
+        self.max_concurrency = int(os.getenv("GH_MAX_CONCURRENCY", "8"))
 
 def load_config() -> Config:
     return Config()
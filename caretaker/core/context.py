@@ -1,20 +1,131 @@
-from typing import Optional
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from caretaker.core.config import load_config
 from caretaker.core.github_client import GitHubClient
+from caretaker.core.async_client import AsyncGitHubClient
+from caretaker.core.blob_store import BlobStore
+from caretaker.core.fanout import ItemResult, fan_out
+from caretaker.core.http_cache import ResponseCache
+from caretaker.core.journal import Journal
+from caretaker.core.mirror import Mirror
+from caretaker.core.records import RepoRecord
+from caretaker.core.results import ResultCache, fingerprint
+from caretaker.core.token_pool import TokenPool
 
 class CareContext:
-    def __init__(self, owner: str, client: GitHubClient, monitor=None):
+    def __init__(self, owner: str, client: GitHubClient, monitor=None, max_concurrency: int = 8,
+                 store: Optional[Mirror] = None, result_cache: Optional[ResultCache] = None,
+                 journal: Optional[Journal] = None):
         self.owner = owner
         self.client = client
         self.monitor = monitor
+        self.max_concurrency = max_concurrency
+        self._store = store
+        self._aclient: Optional[AsyncGitHubClient] = None
+        # Latest result of each plugin run through caretaker.core.runner, for plugins that depend on it
+        self.results: Dict[str, Any] = {}
+        # Set when a sweep is interrupted; map_repos then stops starting new repos
+        self.cancel = threading.Event()
+        # Per-repo results kept between runs by map_changed_repos, and how many it reused per plugin
+        self.result_cache = result_cache or ResultCache()
+        self.reuse: Dict[str, Dict[str, int]] = {}
+        # Per-repo checkpoints, written only while the runner has ``checkpoint`` set (it clears them when a
+        # plugin completes); with ``resume`` set, units an interrupted sweep finished are kept
+        self.journal = journal
+        self.checkpoint = False
+        self.resume = False
+
+    @property
+    def store(self) -> Mirror:
+        """Local metadata mirror; without a configured one, an in-memory mirror that always refreshes."""
+        if self._store is None:
+            self._store = Mirror(":memory:", self.client, max_age=0)
+        return self._store
+
+    def repos(self) -> List[RepoRecord]:
+        return self.store.repos(self.owner)
+
+    def map_repos(self, fn: Callable[[Any], Any], repos: Optional[Iterable[Any]] = None, max_workers: Optional[int] = None,
+                  ordered: bool = True, cancel: Optional[threading.Event] = None) -> Iterator[ItemResult]:
+        """Run ``fn(repo)`` for each repo (default: all of the owner's) on a bounded thread pool.
+
+        Yields an ItemResult per repo, in input order or, with ``ordered=False``,
+        as they finish; errors are captured per repo. Set ``cancel`` (by
+        default ``self.cancel``) to stop starting new repos. See
+        ``caretaker.core.fanout.fan_out``.
+        """
+        repos = self.repos() if repos is None else repos
+        return fan_out(fn, repos, max_workers or self.max_concurrency, ordered=ordered, cancel=cancel or self.cancel)
+
+    def map_changed_repos(self, plugin: Any, fn: Callable[[Any], Any], repos: Optional[Iterable[Any]] = None,
+                          params: Optional[Dict[str, Any]] = None, extra: Optional[Callable[[Any], Any]] = None,
+                          max_workers: Optional[int] = None) -> Iterator[ItemResult]:
+        """``map_repos`` that reuses ``plugin``'s last result for repos that haven't changed.
+
+        A repo's result is recomputed only when its fingerprint (push/update
+        timestamps, ``plugin.version``, ``params`` and ``extra(repo)``) differs
+        from the one stored with its cached value. Values must be JSON
+        serializable; errors are not cached. Counts land in ``self.reuse``.
+
+        Inside a runner sweep (``checkpoint`` set) each computed repo is also
+        written to ``journal`` as it finishes. When ``resume`` is set, repos the interrupted run already finished are
+        taken from the journal (if their fingerprint still matches) instead of
+        being recomputed; otherwise the plugin's journal starts over.
+        """
+        cached = self.result_cache.load(self.owner, plugin.name)
+        journal = self.journal if self.checkpoint else None
+        resumed = journal.completed(self.owner, plugin.name) if journal and self.resume else {}
+        if journal and not self.resume:
+            journal.clear(self.owner, plugin.name)
+        counts = {"reused": 0, "resumed": 0, "computed": 0}
+        lock = threading.Lock()
+
+        def call(repo):
+            fp = fingerprint(repo, plugin, params, extra(repo) if extra else None)
+            for source, entries in (("resumed", resumed), ("reused", cached)):
+                entry = entries.get(repo["name"])
+                if entry and entry["fingerprint"] == fp:
+                    break
+            else:
+                source, entry = "computed", {"fingerprint": fp, "value": fn(repo)}
+                if journal:
+                    journal.record(self.owner, plugin.name, repo["name"], entry["value"], fp)
+            # New values go straight into the loaded cache, so each is held once however big the fleet
+            cached[repo["name"]] = entry
+            with lock:
+                counts[source] += 1
+            return entry["value"]
+
+        try:
+            yield from self.map_repos(call, repos, max_workers)
+        finally:
+            self.reuse[plugin.name] = counts
+            if counts["resumed"] or counts["computed"]:
+                self.result_cache.save(self.owner, plugin.name, cached)
+
+    @property
+    def aclient(self) -> AsyncGitHubClient:
+        """Async view of ``client`` for plugins that await many repos at once."""
+        if self._aclient is None:
+            self._aclient = AsyncGitHubClient(self.client, self.max_concurrency)
+        return self._aclient
 
 def build_context(owner: Optional[str] = None) -> CareContext:
     """Factory to create a fully initialized CareContext"""
     cfg = load_config()
-    client = GitHubClient(cfg.github_token, cfg.base_url)
+    cache = ResponseCache(os.path.join(cfg.cache_dir, "http")) if cfg.http_cache else None
+    pool = TokenPool(cfg.github_tokens, write_token=cfg.write_token) if cfg.github_tokens else None
+    client = GitHubClient(cfg.write_token, cfg.base_url, cache=cache, pool=pool,
+                          blobs=BlobStore(os.path.join(cfg.cache_dir, "blobs")), include_private=cfg.include_private)
+    
+    store = Mirror(os.path.join(cfg.cache_dir, "mirror.sqlite3"), client, max_age=cfg.mirror_max_age) if cfg.mirror else None
+    result_cache = ResultCache(os.path.join(cfg.cache_dir, "results")) if cfg.incremental else None
+    journal = Journal(os.path.join(cfg.cache_dir, "journal"))
     
     # If owner is not provided, try to get from config
     if not owner:
         owner = cfg.username
         
-    return CareContext(owner=owner, client=client)
+    return CareContext(owner=owner, client=client, max_concurrency=cfg.max_concurrency, store=store,
+                       result_cache=result_cache, journal=journal)
@@ -0,0 +1,708 @@
+"""
+Local stand-in for the GitHub API.
+
+Serves the REST and GraphQL endpoints GitHubClient uses from seeded synthetic
+fixtures, with pagination Link headers, ETag revalidation and rate-limit
+headers, so plugins can be run and benchmarked offline:
+
+    python -m caretaker.core.fake_github --repos 10000 --port 8765
+    GH_API=http://127.0.0.1:8765 GH_TOKEN=fake python caretaker_cli.py recover-links --owner octocat
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+WORDS = ["hyper", "code", "agent", "focus", "flow", "care", "taker", "brain", "arcade", "web3",
+         "shop", "ide", "map", "bot", "hub", "lab", "core", "kit", "docs", "site"]
+LANGUAGES = ["Python", "TypeScript", "JavaScript", "HTML", "Rust", "Go"]
+EPOCH = datetime(2025, 1, 1)
+
+def iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def blob_sha(content: bytes) -> str:
+    """Git blob object id, as reported in the contents API ``sha`` field."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+class FakeGitHub:
+    """In-memory GitHub state served by FakeGitHubServer."""
+
+    def __init__(self, owner: str = "octocat", repos: int = 10, issues_per_repo: int = 5,
+                 commits_per_repo: int = 20, seed: int = 0, rate_limit: int = 5000):
+        self.owner = owner
+        self.rate_limit = rate_limit
+        self.remaining: Dict[str, int] = {"core": rate_limit, "graphql": rate_limit}
+        self.reset_at = int(time.time()) + 3600
+        self.requests: Counter = Counter()
+        self.lock = threading.RLock()
+        self.repos: Dict[str, Dict[str, Any]] = {}
+        self.issues: Dict[str, List[Dict[str, Any]]] = {}
+        self.comments: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+        self.commits: Dict[str, List[Dict[str, Any]]] = {}
+        self.files: Dict[str, Dict[str, bytes]] = {}
+        self.pages: set = set()
+        self.heads: Dict[str, str] = {}
+        self.trees: Dict[str, Dict[str, bytes]] = {}
+        self.git_commits: Dict[str, Dict[str, Any]] = {}
+        self.blobs: Dict[str, bytes] = {}
+        rng = random.Random(seed)
+        for i in range(repos):
+            self._seed_repo(rng, i, issues_per_repo, commits_per_repo)
+
+    def _seed_repo(self, rng: random.Random, i: int, issues: int, commits: int):
+        name = f"{rng.choice(WORDS)}-{rng.choice(WORDS)}-{i}"
+        created = EPOCH - timedelta(days=rng.randint(30, 1500))
+        pushed = created + timedelta(days=rng.randint(0, (EPOCH - created).days))
+        language = rng.choice(LANGUAGES)
+        self.repos[name] = {
+            "id": 1000 + i,
+            "node_id": f"R_{i:06d}",
+            "name": name,
+            "full_name": f"{self.owner}/{name}",
+            "owner": {"login": self.owner, "id": 1, "type": "User"},
+            "private": False,
+            "visibility": "public",
+            "description": f"{name.replace('-', ' ').title()} project",
+            "html_url": f"https://github.com/{self.owner}/{name}",
+            "homepage": None,
+            "fork": rng.random() < 0.1,
+            "archived": rng.random() < 0.05,
+            "created_at": iso(created),
+            "updated_at": iso(pushed + timedelta(hours=rng.randint(0, 48))),
+            "pushed_at": iso(pushed),
+            "size": rng.randint(10, 50000),
+            "stargazers_count": rng.randint(0, 20),
+            "forks_count": rng.randint(0, 5),
+            "language": language,
+            "topics": sorted(rng.sample(WORDS, 2)),
+            "default_branch": "main" if rng.random() < 0.8 else "master",
+            "open_issues_count": 0,
+        }
+        files = {"README.md": f"# {name}\n\nGenerated fixture.\n".encode("utf-8")}
+        if rng.random() < 0.6:
+            files["LICENSE"] = b"MIT License\n\nCopyright (c) fixture\n"
+        if language == "Python" or rng.random() < 0.2:
+            files["requirements.txt"] = b"requests\nflask\n"
+        if language in ("TypeScript", "JavaScript"):
+            files["package.json"] = json.dumps({"name": name, "version": "1.0.0"}).encode("utf-8")
+        self.files[name] = files
+
+        repo_issues = []
+        for n in range(1, issues + 1):
+            opened = created + timedelta(days=rng.randint(0, max((EPOCH - created).days, 1)))
+            state = "open" if rng.random() < 0.6 else "closed"
+            repo_issues.append({
+                "id": (1000 + i) * 10000 + n,
+                "node_id": f"I_{i:06d}_{n}",
+                "number": n,
+                "title": f"{rng.choice(WORDS).title()} {rng.choice(['bug', 'crash', 'docs', 'feature'])} in {rng.choice(WORDS)}",
+                "body": "Steps to reproduce the problem.",
+                "state": state,
+                "user": {"login": self.owner},
+                "comments": 0,
+                "created_at": iso(opened),
+                "updated_at": iso(opened + timedelta(days=rng.randint(0, 90))),
+                "closed_at": None,
+                "html_url": f"https://github.com/{self.owner}/{name}/issues/{n}",
+            })
+        self.issues[name] = repo_issues
+        self.repos[name]["open_issues_count"] = sum(1 for x in repo_issues if x["state"] == "open")
+
+        repo_commits = []
+        for c in range(commits):
+            date = pushed - timedelta(hours=c * rng.randint(1, 72))
+            ref = f" (fixes #{rng.randint(1, issues)})" if issues and rng.random() < 0.3 else ""
+            repo_commits.append({
+                "sha": hashlib.sha1(f"{name}:{c}".encode("utf-8")).hexdigest(),
+                "commit": {"message": f"{rng.choice(['Fix', 'Add', 'Update'])} {rng.choice(WORDS)}{ref}",
+                           "author": {"name": self.owner, "date": iso(date)}},
+                "html_url": f"https://github.com/{self.owner}/{name}/commit/{c}",
+            })
+        self.commits[name] = repo_commits
+
+    # --- rate limiting -------------------------------------------------
+
+    def spend(self, resource: str) -> bool:
+        with self.lock:
+            if self.remaining[resource] <= 0:
+                return False
+            self.remaining[resource] -= 1
+            return True
+
+    def rate_headers(self, resource: str) -> Dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(self.remaining[resource]),
+            "X-RateLimit-Reset": str(self.reset_at),
+            "X-RateLimit-Resource": resource,
+        }
+
+    # --- helpers -------------------------------------------------------
+
+    def repo(self, owner: str, name: str) -> Optional[Dict[str, Any]]:
+        if owner != self.owner:
+            return None
+        return self.repos.get(name)
+
+    def store_tree(self, files: Dict[str, bytes]) -> str:
+        listing = json.dumps(sorted((p, blob_sha(c)) for p, c in files.items()))
+        sha = hashlib.sha1(listing.encode("utf-8")).hexdigest()
+        self.trees[sha] = dict(files)
+        for content in files.values():
+            self.blobs[blob_sha(content)] = content
+        return sha
+
+    def store_commit(self, tree: str, parents: List[str], message: str) -> str:
+        sha = hashlib.sha1(json.dumps([tree, parents, message, len(self.git_commits)]).encode("utf-8")).hexdigest()
+        self.git_commits[sha] = {"sha": sha, "tree": {"sha": tree}, "parents": [{"sha": p} for p in parents], "message": message}
+        return sha
+
+    def head(self, repo: str) -> str:
+        """Head commit of the default branch, created lazily from the fixture files."""
+        if repo not in self.heads:
+            self.heads[repo] = self.store_commit(self.store_tree(self.files[repo]), [], "Initial commit")
+        return self.heads[repo]
+
+    def advance(self, repo: str, message: str):
+        """Record a commit for a change made through the contents API."""
+        self.heads[repo] = self.store_commit(self.store_tree(self.files[repo]), [self.head(repo)], message)
+        self.repos[repo]["pushed_at"] = iso(datetime.utcnow())
+
+    def node(self, node_id: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """``(repo name, issue or None)`` for a repository or issue node id."""
+        for name, repo in self.repos.items():
+            if repo["node_id"] == node_id:
+                return name, None
+            for issue in self.issues.get(name, []):
+                if issue["node_id"] == node_id:
+                    return name, issue
+        return None, None
+
+    def mutate(self, mutation: str, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply one GraphQL mutation; None when its node does not exist."""
+        name, issue = self.node(args.get("issueId") or args.get("subjectId") or args.get("repositoryId") or "")
+        if name is None or (("issueId" in args or "subjectId" in args) and issue is None):
+            return None
+        repo = self.repos[name]
+        now = iso(datetime.utcnow())
+        if mutation == "addComment":
+            self.comments.setdefault((name, issue["number"]), []).append(
+                {"id": issue["comments"] + 1, "body": args.get("body", ""), "created_at": now})
+            issue["comments"] += 1
+            return {"clientMutationId": None}
+        if mutation == "closeIssue":
+            issue.update(state="closed", updated_at=now, closed_at=now)
+            return {"issue": {"id": issue["node_id"]}}
+        if mutation in ("archiveRepository", "unarchiveRepository"):
+            repo["archived"] = mutation == "archiveRepository"
+        elif mutation == "updateRepository":
+            fields = {"name": "name", "description": "description", "homepageUrl": "homepage",
+                      "hasIssuesEnabled": "has_issues", "hasWikiEnabled": "has_wiki"}
+            new_name = args.get("name")
+            repo.update({fields[k]: v for k, v in args.items() if k in fields})
+            if new_name and new_name != name:
+                for table in (self.repos, self.files, self.issues, self.commits, self.heads):
+                    if name in table:
+                        table[new_name] = table.pop(name)
+                repo["full_name"] = f"{self.owner}/{new_name}"
+        elif mutation == "updateTopics":
+            repo["topics"] = list(args.get("topicNames", []))
+            return {"invalidTopicNames": []}
+        else:
+            return None
+        return {"repository": {"id": repo["node_id"]}}
+
+    def contents_payload(self, repo: str, path: str) -> Dict[str, Any]:
+        content = self.files[repo][path]
+        return {
+            "type": "file",
+            "name": path.rsplit("/", 1)[-1],
+            "path": path,
+            "sha": blob_sha(content),
+            "size": len(content),
+            "encoding": "base64",
+            "content": base64.b64encode(content).decode("ascii"),
+        }
+
+    def inventory_node(self, repo: Dict[str, Any]) -> Dict[str, Any]:
+        name = repo["name"]
+        issues = self.issues.get(name, [])
+        last_commit = self.commits[name][0]["commit"]["author"]["date"] if self.commits.get(name) else None
+        return {
+            "id": repo["node_id"], "name": name, "nameWithOwner": repo["full_name"],
+            "description": repo["description"], "url": repo["html_url"], "homepageUrl": repo["homepage"],
+            "isArchived": repo["archived"], "isFork": repo["fork"], "isPrivate": repo["private"],
+            "createdAt": repo["created_at"], "updatedAt": repo["updated_at"], "pushedAt": repo["pushed_at"],
+            "diskUsage": repo["size"], "stargazerCount": repo["stargazers_count"], "forkCount": repo["forks_count"],
+            "primaryLanguage": {"name": repo["language"]},
+            "defaultBranchRef": {"name": repo["default_branch"], "target": {"committedDate": last_commit}},
+            "repositoryTopics": {"nodes": [{"topic": {"name": t}} for t in repo["topics"]]},
+            "languages": {"edges": [{"size": repo["size"] * 1024, "node": {"name": repo["language"]}}]},
+            "issues": {"totalCount": sum(1 for i in issues if i["state"] == "open" and "pull_request" not in i)},
+            "pullRequests": {"totalCount": 0},
+        }
+
+def _page(items: List[Any], query: Dict[str, str], path: str, base: str) -> Tuple[List[Any], Dict[str, str]]:
+    per_page = min(int(query.get("per_page", 30)), 100)
+    page = max(int(query.get("page", 1)), 1)
+    last = max((len(items) + per_page - 1) // per_page, 1)
+    chunk = items[(page - 1) * per_page: page * per_page]
+    links = []
+
+    def link(n: int, rel: str):
+        q = dict(query, per_page=per_page, page=n)
+        links.append(f'<{base}{path}?{urlencode(q)}>; rel="{rel}"')
+    if page < last:
+        link(page + 1, "next")
+        link(last, "last")
+    if page > 1:
+        link(1, "first")
+        link(page - 1, "prev")
+    return chunk, ({"Link": ", ".join(links)} if links else {})
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "FakeGitHub/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        gh: FakeGitHub = self.server.github
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        body = json.loads(raw) if raw else {}
+
+        if path == "/rate_limit":
+            core = gh.rate_headers("core")
+            resources = {r: {"limit": gh.rate_limit, "remaining": gh.remaining[r], "reset": gh.reset_at, "used": gh.rate_limit - gh.remaining[r]}
+                         for r in gh.remaining}
+            return self._send(200, {"resources": resources, "rate": resources["core"]}, core)
+
+        resource = "graphql" if path == "/graphql" else "core"
+        for route_method, pattern, name in ROUTES:
+            match = pattern.match(path)
+            if route_method == method and match:
+                break
+        else:
+            return self._send(404, {"message": "Not Found"}, gh.rate_headers(resource))
+
+        with gh.lock:
+            gh.requests[(method, pattern.pattern)] += 1
+            if gh.remaining[resource] <= 0:
+                return self._send(403, {"message": "API rate limit exceeded"}, gh.rate_headers(resource))
+            status, payload, headers = getattr(self, name)(gh, match, query, body)
+            data = json.dumps(payload).encode("utf-8")
+            etag = f'W/"{hashlib.md5(data).hexdigest()}"'
+            if method == "GET" and status == 200 and self.headers.get("If-None-Match") == etag:
+                # Conditional hits are free, as on api.github.com
+                return self._send(304, None, dict(gh.rate_headers(resource), ETag=etag))
+            gh.spend(resource)
+            headers = dict(headers, **gh.rate_headers(resource))
+        if method == "GET" and status == 200:
+            headers["ETag"] = etag
+        self._send(status, payload, headers, data)
+
+    def _send(self, status: int, payload: Any, headers: Dict[str, str], data: Optional[bytes] = None):
+        if data is None:
+            data = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        if data:
+            self.wfile.write(data)
+
+    @property
+    def base(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # --- REST routes ---------------------------------------------------
+
+    def list_repos(self, gh, m, q, body):
+        if m.group(1) != gh.owner:
+            return 404, {"message": "Not Found"}, {}
+        items, headers = _page(list(gh.repos.values()), q, f"/users/{gh.owner}/repos", self.base)
+        return 200, items, headers
+
+    def get_user(self, gh, m, q, body):
+        return 200, {"login": gh.owner, "id": 1, "type": "User"}, {}
+
+    def patch_user(self, gh, m, q, body):
+        return 200, dict({"login": gh.owner}, **body), {}
+
+    def create_repo(self, gh, m, q, body):
+        name = body.get("name")
+        if not name or name in gh.repos:
+            return 422, {"message": "Validation Failed"}, {}
+        index = len(gh.repos)
+        gh.repos[name] = dict(next(iter(gh.repos.values()), {}), id=1000 + index, node_id=f"R_{index:06d}",
+                              name=name, full_name=f"{gh.owner}/{name}", topics=[], archived=False,
+                              created_at=iso(EPOCH), updated_at=iso(EPOCH), pushed_at=iso(EPOCH),
+                              default_branch="main", open_issues_count=0)
+        gh.repos[name].update({k: v for k, v in body.items() if k in ("description", "homepage", "private")})
+        gh.files[name] = {"README.md": f"# {name}\n".encode("utf-8")} if body.get("auto_init") else {}
+        gh.issues[name], gh.commits[name] = [], []
+        return 201, gh.repos[name], {}
+
+    def get_repo(self, gh, m, q, body):
+        repo = gh.repo(m.group(1), m.group(2))
+        return (200, repo, {}) if repo else (404, {"message": "Not Found"}, {})
+
+    def patch_repo(self, gh, m, q, body):
+        repo = gh.repo(m.group(1), m.group(2))
+        if not repo:
+            return 404, {"message": "Not Found"}, {}
+        new_name = body.get("name")
+        repo.update(body)
+        if new_name and new_name != m.group(2):
+            for table in (gh.repos, gh.files, gh.issues, gh.commits, gh.heads):
+                if m.group(2) in table:
+                    table[new_name] = table.pop(m.group(2))
+            repo["full_name"] = f"{gh.owner}/{new_name}"
+        return 200, repo, {}
+
+    def put_topics(self, gh, m, q, body):
+        repo = gh.repo(m.group(1), m.group(2))
+        if not repo:
+            return 404, {"message": "Not Found"}, {}
+        repo["topics"] = list(body.get("names", []))
+        return 200, {"names": repo["topics"]}, {}
+
+    def list_issues(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)):
+            return 404, {"message": "Not Found"}, {}
+        state = q.get("state", "open")
+        items = [i for i in gh.issues[m.group(2)] if state == "all" or i["state"] == state]
+        if "since" in q:
+            items = [i for i in items if i["updated_at"] >= q["since"]]
+        sort = {"created": "created_at", "updated": "updated_at"}.get(q.get("sort", "created"), "created_at")
+        items.sort(key=lambda i: (i[sort], i["number"]), reverse=q.get("direction", "desc") == "desc")
+        items, headers = _page(items, q, f"/repos/{m.group(1)}/{m.group(2)}/issues", self.base)
+        return 200, items, headers
+
+    def create_issue(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)):
+            return 404, {"message": "Not Found"}, {}
+        issues = gh.issues[m.group(2)]
+        number = max((i["number"] for i in issues), default=0) + 1
+        now = iso(datetime.utcnow())
+        issue = {"id": len(issues) + 1, "node_id": f"I_{m.group(2)}_{number}", "number": number,
+                 "title": body.get("title", ""), "body": body.get("body", ""), "state": "open",
+                 "user": {"login": gh.owner}, "comments": 0, "created_at": now, "updated_at": now, "closed_at": None}
+        issues.append(issue)
+        return 201, issue, {}
+
+    def _issue(self, gh, m) -> Optional[Dict[str, Any]]:
+        if not gh.repo(m.group(1), m.group(2)):
+            return None
+        number = int(m.group(3))
+        return next((i for i in gh.issues[m.group(2)] if i["number"] == number), None)
+
+    def patch_issue(self, gh, m, q, body):
+        issue = self._issue(gh, m)
+        if not issue:
+            return 404, {"message": "Not Found"}, {}
+        issue.update({k: v for k, v in body.items() if k in ("state", "title", "body")})
+        issue["updated_at"] = iso(datetime.utcnow())
+        if issue["state"] == "closed":
+            issue["closed_at"] = issue["updated_at"]
+        return 200, issue, {}
+
+    def create_comment(self, gh, m, q, body):
+        issue = self._issue(gh, m)
+        if not issue:
+            return 404, {"message": "Not Found"}, {}
+        comment = {"id": issue["comments"] + 1, "body": body.get("body", ""), "created_at": iso(datetime.utcnow())}
+        gh.comments.setdefault((m.group(2), issue["number"]), []).append(comment)
+        issue["comments"] += 1
+        return 201, comment, {}
+
+    def list_commits(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)):
+            return 404, {"message": "Not Found"}, {}
+        items = gh.commits[m.group(2)]
+        if not items:
+            return 409, {"message": "Git Repository is empty."}, {}
+        if "since" in q:
+            items = [c for c in items if c["commit"]["author"]["date"] >= q["since"]]
+        if "until" in q:
+            items = [c for c in items if c["commit"]["author"]["date"] <= q["until"]]
+        items, headers = _page(items, q, f"/repos/{m.group(1)}/{m.group(2)}/commits", self.base)
+        return 200, items, headers
+
+    def get_contents(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)) or m.group(3) not in gh.files[m.group(2)]:
+            return 404, {"message": "Not Found"}, {}
+        return 200, gh.contents_payload(m.group(2), m.group(3)), {}
+
+    def put_contents(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)):
+            return 404, {"message": "Not Found"}, {}
+        files = gh.files[m.group(2)]
+        path = m.group(3)
+        if path in files and body.get("sha") != blob_sha(files[path]):
+            return 409, {"message": "sha does not match"}, {}
+        created = path not in files
+        files[path] = base64.b64decode(body.get("content", ""))
+        gh.advance(m.group(2), body.get("message", ""))
+        payload = gh.contents_payload(m.group(2), path)
+        payload.pop("content")
+        return (201 if created else 200), {"content": payload, "commit": {"message": body.get("message")}}, {}
+
+    def get_branch(self, gh, m, q, body):
+        repo = gh.repo(m.group(1), m.group(2))
+        if not repo or m.group(3) != repo["default_branch"]:
+            return 404, {"message": "Branch not found"}, {}
+        head = gh.head(m.group(2))
+        commit = gh.git_commits[head]
+        return 200, {"name": m.group(3), "commit": {"sha": head, "commit": {"tree": commit["tree"], "message": commit["message"]}}}, {}
+
+    def get_tree(self, gh, m, q, body):
+        repo = gh.repo(m.group(1), m.group(2))
+        if not repo:
+            return 404, {"message": "Not Found"}, {}
+        ref = m.group(3)
+        if ref in ("HEAD", repo["default_branch"], f"heads/{repo['default_branch']}"):
+            ref = gh.head(m.group(2))
+        if ref in gh.git_commits:
+            ref = gh.git_commits[ref]["tree"]["sha"]
+        if ref not in gh.trees:
+            return 404, {"message": "Not Found"}, {}
+        recursive = q.get("recursive") not in (None, "", "0", "false")
+        entries, dirs = [], set()
+        for path, content in sorted(gh.trees[ref].items()):
+            parts = path.split("/")
+            for depth in range(1, len(parts)):
+                dirs.add("/".join(parts[:depth]))
+            if recursive or len(parts) == 1:
+                entries.append({"path": path, "mode": "100644", "type": "blob", "sha": blob_sha(content), "size": len(content)})
+        for d in sorted(dirs):
+            if recursive or "/" not in d:
+                entries.append({"path": d, "mode": "040000", "type": "tree", "sha": hashlib.sha1(f"{ref}:{d}".encode("utf-8")).hexdigest()})
+        return 200, {"sha": ref, "tree": entries, "truncated": False}, {}
+
+    def get_blob(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)) or m.group(3) not in gh.blobs:
+            return 404, {"message": "Not Found"}, {}
+        content = gh.blobs[m.group(3)]
+        return 200, {"sha": m.group(3), "size": len(content), "encoding": "base64",
+                     "content": base64.b64encode(content).decode("ascii")}, {}
+
+    def create_blob(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)):
+            return 404, {"message": "Not Found"}, {}
+        content = body.get("content", "")
+        data = base64.b64decode(content) if body.get("encoding") == "base64" else content.encode("utf-8")
+        sha = blob_sha(data)
+        gh.blobs[sha] = data
+        return 201, {"sha": sha}, {}
+
+    def create_tree(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)):
+            return 404, {"message": "Not Found"}, {}
+        files = dict(gh.trees.get(body.get("base_tree"), {}))
+        for entry in body.get("tree", []):
+            if "content" in entry:
+                files[entry["path"]] = entry["content"].encode("utf-8")
+            elif entry.get("sha") is None:
+                files.pop(entry["path"], None)
+            elif entry["sha"] in gh.blobs:
+                files[entry["path"]] = gh.blobs[entry["sha"]]
+            else:
+                return 422, {"message": f"Unknown blob {entry['sha']}"}, {}
+        return 201, {"sha": gh.store_tree(files)}, {}
+
+    def create_commit(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)) or body.get("tree") not in gh.trees:
+            return 422, {"message": "Invalid tree"}, {}
+        return 201, gh.git_commits[gh.store_commit(body["tree"], body.get("parents", []), body.get("message", ""))], {}
+
+    def update_ref(self, gh, m, q, body):
+        repo = gh.repo(m.group(1), m.group(2))
+        commit = gh.git_commits.get(body.get("sha"))
+        if not repo or m.group(3) != repo["default_branch"] or not commit:
+            return 422, {"message": "Reference update failed"}, {}
+        if not body.get("force") and gh.head(m.group(2)) not in [p["sha"] for p in commit["parents"]]:
+            return 422, {"message": "Update is not a fast forward"}, {}
+        gh.heads[m.group(2)] = commit["sha"]
+        gh.files[m.group(2)] = dict(gh.trees[commit["tree"]["sha"]])
+        repo["pushed_at"] = iso(datetime.utcnow())
+        return 200, {"ref": f"refs/heads/{m.group(3)}", "object": {"sha": commit["sha"], "type": "commit"}}, {}
+
+    def get_pages(self, gh, m, q, body):
+        if m.group(2) not in gh.pages:
+            return 404, {"message": "Not Found"}, {}
+        return 200, {"url": f"https://{gh.owner}.github.io/{m.group(2)}", "source": {"branch": "main", "path": "/"}}, {}
+
+    def create_pages(self, gh, m, q, body):
+        if not gh.repo(m.group(1), m.group(2)):
+            return 404, {"message": "Not Found"}, {}
+        gh.pages.add(m.group(2))
+        return 201, {"url": f"https://{gh.owner}.github.io/{m.group(2)}", "source": body.get("source")}, {}
+
+    # --- GraphQL -------------------------------------------------------
+
+    def graphql(self, gh, m, q, body):
+        query = body.get("query", "")
+        variables = body.get("variables") or {}
+        if "repositoryOwner" in query:
+            if variables.get("owner") != gh.owner:
+                return 200, {"data": {"repositoryOwner": None}, "errors": [{"message": "Could not resolve to a RepositoryOwner"}]}, {}
+            repos = sorted(gh.repos.values(), key=lambda r: r["name"].lower())
+            if variables.get("privacy"):
+                repos = [r for r in repos if r["private"] == (variables["privacy"] == "PRIVATE")]
+            start = int(variables.get("cursor") or 0)
+            chunk = repos[start:start + 100]
+            end = start + len(chunk)
+            return 200, {"data": {"repositoryOwner": {"repositories": {
+                "pageInfo": {"hasNextPage": end < len(repos), "endCursor": str(end)},
+                "nodes": [gh.inventory_node(r) for r in chunk],
+            }}}}, {}
+        if query.lstrip().startswith("mutation"):
+            return self.graphql_mutations(gh, query, variables)
+        lookups = LOOKUP_FIELD.findall(query)
+        if lookups:
+            data, errors = {}, []
+            for alias, owner, name, number in lookups:
+                repo = gh.repo(variables[owner], variables[name])
+                node = None
+                if repo and number:
+                    issue = next((i for i in gh.issues[repo["name"]] if i["number"] == variables[number]), None)
+                    node = {"issue": {"id": issue["node_id"]} if issue else None}
+                elif repo:
+                    node = {"id": repo["node_id"]}
+                else:
+                    errors.append({"path": [alias], "type": "NOT_FOUND", "message": "Could not resolve to a Repository"})
+                data[alias] = node
+            return 200, dict({"data": data}, **({"errors": errors} if errors else {})), {}
+        return 200, {"errors": [{"message": "Query not supported by the fake server"}]}, {}
+
+    def graphql_mutations(self, gh, query, variables):
+        """Run aliased mutations in document order, as GitHub does, reporting failures per alias."""
+        data, errors = {}, []
+        for alias, mutation, var in MUTATION_FIELD.findall(query):
+            args = variables.get(var) or {}
+            result = gh.mutate(mutation, args)
+            if result is None:
+                errors.append({"path": [alias], "type": "NOT_FOUND",
+                               "message": f"Could not resolve to a node with the global id of '{next(iter(args.values()), '')}'"})
+            data[alias] = result
+        return 200, dict({"data": data}, **({"errors": errors} if errors else {})), {}
+
+LOOKUP_FIELD = re.compile(r"(\w+): repository\(owner: \$(\w+), name: \$(\w+)\) \{ (?:issue\(number: \$(\w+)\))?")
+MUTATION_FIELD = re.compile(r"(\w+): (\w+)\(input: \$(\w+)\)")
+
+REPO = r"/repos/([^/]+)/([^/]+)"
+ROUTES = [
+    ("GET", re.compile(r"^/users/([^/]+)/repos$"), "list_repos"),
+    ("GET", re.compile(r"^/user$"), "get_user"),
+    ("PATCH", re.compile(r"^/user$"), "patch_user"),
+    ("POST", re.compile(r"^/user/repos$"), "create_repo"),
+    ("GET", re.compile(rf"^{REPO}$"), "get_repo"),
+    ("PATCH", re.compile(rf"^{REPO}$"), "patch_repo"),
+    ("PUT", re.compile(rf"^{REPO}/topics$"), "put_topics"),
+    ("GET", re.compile(rf"^{REPO}/issues$"), "list_issues"),
+    ("POST", re.compile(rf"^{REPO}/issues$"), "create_issue"),
+    ("PATCH", re.compile(rf"^{REPO}/issues/(\d+)$"), "patch_issue"),
+    ("POST", re.compile(rf"^{REPO}/issues/(\d+)/comments$"), "create_comment"),
+    ("GET", re.compile(rf"^{REPO}/commits$"), "list_commits"),
+    ("GET", re.compile(rf"^{REPO}/contents/(.+)$"), "get_contents"),
+    ("PUT", re.compile(rf"^{REPO}/contents/(.+)$"), "put_contents"),
+    ("GET", re.compile(rf"^{REPO}/branches/([^/]+)$"), "get_branch"),
+    ("GET", re.compile(rf"^{REPO}/git/trees/(.+)$"), "get_tree"),
+    ("GET", re.compile(rf"^{REPO}/git/blobs/([0-9a-f]{{40}})$"), "get_blob"),
+    ("POST", re.compile(rf"^{REPO}/git/blobs$"), "create_blob"),
+    ("POST", re.compile(rf"^{REPO}/git/trees$"), "create_tree"),
+    ("POST", re.compile(rf"^{REPO}/git/commits$"), "create_commit"),
+    ("PATCH", re.compile(rf"^{REPO}/git/refs/heads/(.+)$"), "update_ref"),
+    ("GET", re.compile(rf"^{REPO}/pages$"), "get_pages"),
+    ("POST", re.compile(rf"^{REPO}/pages$"), "create_pages"),
+    ("POST", re.compile(r"^/graphql$"), "graphql"),
+]
+
+class FakeGitHubServer:
+    """Runs a FakeGitHub on a local port in a background thread."""
+
+    def __init__(self, github: Optional[FakeGitHub] = None, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0):
+        self.github = github or FakeGitHub()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.github = self.github
+        self.httpd.latency = latency
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeGitHubServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a fake GitHub API seeded with synthetic fixtures")
+    parser.add_argument("--owner", default="octocat")
+    parser.add_argument("--repos", type=int, default=100)
+    parser.add_argument("--issues", type=int, default=5, help="issues per repo")
+    parser.add_argument("--commits", type=int, default=20, help="commits per repo")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    github = FakeGitHub(args.owner, args.repos, args.issues, args.commits, args.seed)
+    server = FakeGitHubServer(github, port=args.port, latency=args.latency)
+    print(f"Fake GitHub for {args.owner} ({args.repos} repos) on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import contextvars
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional
+
+class ItemResult:
+    """Outcome of one item of a fan-out: its ``value``, or the ``error`` it raised."""
+
+    __slots__ = ("item", "value", "error")
+
+    def __init__(self, item: Any, value: Any = None, error: Optional[BaseException] = None):
+        self.item = item
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return f"ItemResult({self.item!r}, {'ok' if self.ok else repr(self.error)})"
+
+def fan_out(fn: Callable[[Any], Any], items: Iterable[Any], max_workers: int = 8, ordered: bool = True,
+            cancel: Optional[threading.Event] = None) -> Iterator[ItemResult]:
+    """Apply ``fn`` to ``items`` on up to ``max_workers`` threads, yielding an ItemResult per item.
+
+    With ``ordered`` results come back in input order, otherwise as they
+    complete. Exceptions are captured per item instead of aborting the rest.
+    At most ``max_workers`` items are in flight, so setting ``cancel`` (or
+    abandoning the iterator) stops new items from starting; running ones
+    finish. Workers run in the caller's context, so requests keep its lane.
+    """
+    cancel = cancel or threading.Event()
+    source = iter(items)
+    window: Dict[Future, int] = {}
+    buffered: Dict[int, ItemResult] = {}
+    order: Deque[int] = deque()
+    position = 0
+
+    def call(item):
+        try:
+            return ItemResult(item, fn(item))
+        except Exception as e:
+            return ItemResult(item, error=e)
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            while len(window) < max_workers and not cancel.is_set():
+                item = next(source, _END)
+                if item is _END:
+                    break
+                window[pool.submit(contextvars.copy_context().run, call, item)] = position
+                if ordered:
+                    order.append(position)
+                position += 1
+            if not window:
+                return
+            done, _ = wait(window, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = window.pop(future)
+                if ordered:
+                    buffered[index] = future.result()
+                else:
+                    yield future.result()
+            while order and order[0] in buffered:
+                yield buffered.pop(order.popleft())
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+_END = object()
@@ -1,60 +1,420 @@
+import base64
+import re
 import time
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+from urllib.parse import urlparse
 import requests
 
+from caretaker.core.adaptive import AIMDLimiter, CircuitBreaker, backoff, get_breaker, get_limiter
+from caretaker.core.blob_store import BlobStore
+from caretaker.core.http_cache import ResponseCache
+from caretaker.core.lanes import BULK_WRITE, INTERACTIVE, current_lane
+from caretaker.core.memo import SingleFlight, TTLCache
+from caretaker.core.metrics import RequestMetrics
+from caretaker.core.mutations import MutationBatcher
+from caretaker.core.rate_limit import RateLimitGovernor, get_governor, resource_for
+from caretaker.core.records import IssueRecord, Record, RepoRecord
+from caretaker.core.token_pool import TokenPool
+
+# Seconds a GET response may be reused within this process; first match wins, 0 disables.
+MEMO_TTLS = [
+    (re.compile(r"^/rate_limit"), 0),
+    (re.compile(r"^/repos/[^/]+/[^/]+/contents/"), 300),
+    # Blobs are content-addressed and never change
+    (re.compile(r"^/repos/[^/]+/[^/]+/git/blobs/"), 3600),
+    (re.compile(r"^/repos/[^/]+/[^/]+$"), 300),
+    (re.compile(r"^/(users|orgs)/[^/]+/repos$"), 120),
+    (re.compile(r"^/repos/[^/]+/[^/]+/(issues|commits)"), 60),
+]
+DEFAULT_MEMO_TTL = 60
+
+REPO_INVENTORY_QUERY = """
+query($owner: String!, $cursor: String, $privacy: RepositoryPrivacy) {
+  repositoryOwner(login: $owner) {
+    repositories(first: 100, after: $cursor, privacy: $privacy, ownerAffiliations: OWNER, orderBy: {field: NAME, direction: ASC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id name nameWithOwner description url homepageUrl
+        isArchived isFork isPrivate
+        createdAt updatedAt pushedAt diskUsage stargazerCount forkCount
+        primaryLanguage { name }
+        defaultBranchRef { name target { ... on Commit { committedDate } } }
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        languages(first: 10, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+        issues(states: OPEN) { totalCount }
+        pullRequests(states: OPEN) { totalCount }
+      }
+    }
+  }
+}
+"""
+
+def normalize_inventory_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a GraphQL repository node into REST-style keys plugins already read."""
+    branch = node.get("defaultBranchRef") or {}
+    target = branch.get("target") or {}
+    open_issues = (node.get("issues") or {}).get("totalCount", 0)
+    open_prs = (node.get("pullRequests") or {}).get("totalCount", 0)
+    return {
+        "node_id": node.get("id"),
+        "name": node.get("name"),
+        "full_name": node.get("nameWithOwner"),
+        "description": node.get("description"),
+        "html_url": node.get("url"),
+        "homepage": node.get("homepageUrl"),
+        "archived": node.get("isArchived", False),
+        "fork": node.get("isFork", False),
+        "private": node.get("isPrivate", False),
+        "created_at": node.get("createdAt"),
+        "updated_at": node.get("updatedAt"),
+        "pushed_at": node.get("pushedAt"),
+        "size": node.get("diskUsage") or 0,
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        "language": (node.get("primaryLanguage") or {}).get("name"),
+        "default_branch": branch.get("name"),
+        "last_commit_at": target.get("committedDate"),
+        "topics": [t["topic"]["name"] for t in (node.get("repositoryTopics") or {}).get("nodes", [])],
+        "languages": {e["node"]["name"]: e["size"] for e in (node.get("languages") or {}).get("edges", [])},
+        "open_issues": open_issues,
+        "open_pull_requests": open_prs,
+        # REST counts pull requests as issues
+        "open_issues_count": open_issues + open_prs,
+    }
+
+class GitHubAPIError(Exception):
+    """Raised when a streaming call gets a response it cannot continue from."""
+    def __init__(self, status_code: int, path: str, message: str = ""):
+        super().__init__(f"GitHub API {status_code} for {path}: {message}".rstrip(": "))
+        self.status_code = status_code
+        self.path = path
+
+class CircuitOpenError(GitHubAPIError):
+    """Raised without sending while the API host's circuit breaker is open."""
+    def __init__(self, path: str, retry_in: float):
+        super().__init__(503, path, f"circuit open, retry in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+def older_than(cutoff: datetime, field: str = "updated_at") -> Callable[[Dict[str, Any]], bool]:
+    """``stop_when`` predicate for listings sorted newest first."""
+    def check(item: Dict[str, Any]) -> bool:
+        value = item.get(field)
+        if not value:
+            return False
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ") < cutoff
+    return check
+
 class GitHubClient:
-    def __init__(self, token: str, base_url: str = "https://api.github.com"):
+    def __init__(self, token: str, base_url: str = "https://api.github.com", cache: Optional[ResponseCache] = None,
+                 governor: Optional[RateLimitGovernor] = None, memo_size: int = 1024,
+                 pool: Optional[TokenPool] = None, limiter: Optional[AIMDLimiter] = None,
+                 breaker: Optional[CircuitBreaker] = None, blobs: Optional[BlobStore] = None,
+                 include_private: bool = False):
         self.base_url = base_url.rstrip("/")
+        # Private repos join the inventory only when asked for, like the public-only REST listing
+        self.include_private = include_private
+        self.blobs = blobs or BlobStore()
+        # Shared by every client talking to the same host, like the per-token governors
+        host = urlparse(self.base_url).netloc
+        self.limiter = limiter or get_limiter(host)
+        self.breaker = breaker or get_breaker(host)
+        self.cache = cache
+        self.memo = TTLCache(memo_size) if memo_size else None
+        self.metrics = RequestMetrics()
+        self._inflight = SingleFlight()
+        # Requests are spread over the pool; a single token is a pool of one
+        self.pool = pool or (TokenPool([token]) if token else None)
+        # Clients sharing a token share one governor, so the app, scheduler and scripts draw on one budget
+        self.governor = governor or get_governor(self.pool.write_token if self.pool else token)
         self.session = requests.Session()
-        if token:
-            self.session.headers.update({"Authorization": f"Bearer {token}"})
+        if self.pool and len(self.pool) == 1:
+            self.session.headers.update({"Authorization": f"Bearer {self.pool.write_token}"})
         self.session.headers.update({"Accept": "application/vnd.github+json"})
 
-    def _handle_rate(self, resp: requests.Response):
-        remaining = int(resp.headers.get("X-RateLimit-Remaining", "1"))
-        reset = int(resp.headers.get("X-RateLimit-Reset", "0"))
-        if remaining <= 1:
-            now = int(time.time())
-            delay = max(reset - now, 1)
-            time.sleep(delay)
+    def _handle_rate(self, resp: requests.Response, governor: Optional[RateLimitGovernor] = None) -> bool:
+        """Feed rate-limit headers to the governor. True means retry; the next acquire waits as needed."""
+        body = resp.text if resp.status_code in (403, 429) else ""
+        return (governor or self.governor).observe(resp.status_code, resp.headers, body)
+
+    @staticmethod
+    def _is_write(method: str, path: str, json: Optional[Dict[str, Any]]) -> bool:
+        if path == "/graphql":
+            return (json or {}).get("query", "").lstrip().startswith("mutation")
+        return method not in ("GET", "HEAD")
+
+    def _lane(self, method: str, path: str, json: Optional[Dict[str, Any]]) -> str:
+        lane = current_lane()
+        # Background writes queue behind background reads; interactive ones keep their priority
+        if lane != INTERACTIVE and self._is_write(method, path, json):
+            return BULK_WRITE
+        return lane
 
-    def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None) -> requests.Response:
+    def _pick_token(self, method: str, path: str, json: Optional[Dict[str, Any]]) -> Tuple[Optional[str], RateLimitGovernor]:
+        if self.pool is None or len(self.pool) == 1:
+            return None, self.governor
+        token = self.pool.select(self._is_write(method, path, json), resource_for(path))
+        # An explicitly supplied governor stands in for the pinned write token's
+        if token == self.pool.write_token:
+            return token, self.governor
+        return token, self.pool.governor(token)
+
+    @staticmethod
+    def memo_ttl(path: str) -> float:
+        for pattern, ttl in MEMO_TTLS:
+            if pattern.search(path):
+                return ttl
+        return DEFAULT_MEMO_TTL
+
+    def _request(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None,
+                 cost: Optional[int] = None) -> requests.Response:
+        if self.memo is None:
+            return self._send(method, path, params, json, cost)
+        if method == "GET":
+            ttl = self.memo_ttl(path)
+            if ttl:
+                key = (path, tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())))
+                resp = self.memo.get(key)
+                if resp is not None:
+                    self.metrics.record_memo_hit(method, path)
+                    return resp
+                return self._inflight.do(key, lambda: self._fetch_memoized(key, ttl, path, params, cost))
+            return self._send(method, path, params, json, cost)
+        resp = self._send(method, path, params, json, cost)
+        if method != "HEAD":
+            self.invalidate(path)
+        return resp
+
+    def _fetch_memoized(self, key: Tuple, ttl: float, path: str, params: Optional[Dict[str, Any]],
+                        cost: Optional[int] = None) -> requests.Response:
+        resp = self._send("GET", path, params, cost=cost)
+        # 404s are kept too: "does this file exist" probes repeat across steps
+        if resp.status_code in (200, 404):
+            self.memo.set(key, resp, ttl)
+        return resp
+
+    def invalidate(self, path: str):
+        """Drop memoized reads a write to ``path`` may have changed."""
+        if self.memo is None:
+            return
+        parts = path.split("?")[0].strip("/").split("/")
+        scope = "/" + "/".join(parts[:3]) if parts[0] == "repos" and len(parts) >= 3 else "/" + parts[0]
+
+        def affected(key) -> bool:
+            key_path = key[0]
+            return (key_path == scope or key_path.startswith(scope + "/") or key_path.endswith("/repos")
+                    or key_path.startswith("/user"))
+        self.memo.invalidate(affected)
+
+    def _send(self, method: str, path: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None,
+              cost: Optional[int] = None) -> requests.Response:
         url = f"{self.base_url}{path}"
+        cache_key = None
+        entry = None
+        headers: Dict[str, str] = {}
+        if method == "GET" and self.cache is not None and self.cache.cacheable(path, params):
+            cache_key = self.cache.key(method, url, params)
+            entry = self.cache.get(cache_key)
+            if entry:
+                headers.update(self.cache.conditional_headers(entry))
+        resource = resource_for(path)
+        if cost is None:
+            cost = 1 if method in ("GET", "HEAD") else 5
+        lane = self._lane(method, path, json)
+        # Interactive requests are few and already have reserved governor slots; only background work adapts
+        adaptive = lane != INTERACTIVE
         for attempt in range(3):
-            resp = self.session.request(method, url, params=params, json=json, timeout=30)
-            self._handle_rate(resp)
+            if not self.breaker.allow():
+                raise CircuitOpenError(path, self.breaker.retry_in())
+            # Re-picked every attempt so a throttled token hands over to one with headroom
+            token, governor = self._pick_token(method, path, json)
+            if token:
+                headers["Authorization"] = f"Bearer {token}"
+            if adaptive:
+                self.limiter.acquire()
+            try:
+                self.metrics.record_sleep(method, path, governor.acquire(resource, cost, lane))
+                started = time.monotonic()
+                try:
+                    resp = self.session.request(method, url, params=params, json=json, headers=headers or None, timeout=30)
+                finally:
+                    governor.release(lane)
+            except requests.RequestException:
+                self.breaker.record_failure()
+                if adaptive:
+                    self.limiter.on_congestion()
+                if attempt == 2:
+                    raise
+                self._backoff(method, path, attempt)
+                continue
+            finally:
+                if adaptive:
+                    self.limiter.release()
+            latency = time.monotonic() - started
+            self.metrics.record(method, path, resp.status_code, latency, len(resp.content), retry=attempt > 0)
+            throttled = self._handle_rate(resp, governor)
+            overloaded = resp.status_code in (502, 503, 504)
+            if resp.status_code >= 500:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            if adaptive:
+                if throttled or overloaded:
+                    self.limiter.on_congestion()
+                else:
+                    self.limiter.on_success(latency)
+            if resp.status_code == 304 and entry is not None:
+                return self.cache.replay(entry, resp)
+            if cache_key and resp.status_code == 200:
+                self.cache.store(cache_key, resp)
             if resp.status_code in (200, 201, 202, 204):
                 return resp
-            if resp.status_code in (429, 503):
-                time.sleep(2 ** attempt)
+            if throttled:
                 continue
-            if resp.status_code == 403 and "rate limit" in resp.text.lower():
-                time.sleep(10)
+            if overloaded:
+                self._backoff(method, path, attempt)
                 continue
             break
         return resp
 
-    def paginate(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        items: List[Dict[str, Any]] = []
-        page = 1
+    def _backoff(self, method: str, path: str, attempt: int):
+        delay = backoff(attempt)
+        time.sleep(delay)
+        self.metrics.record_sleep(method, path, delay)
+
+    def blob_stats(self) -> Dict[str, int]:
+        return self.blobs.stats()
+
+    def adaptive_stats(self) -> Dict[str, Any]:
+        return {"concurrency": self.limiter.snapshot(), "circuit": self.breaker.snapshot()}
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Conditional-request cache hit/miss counters (empty when caching is off)."""
+        return self.cache.stats() if self.cache else {}
+
+    def api_profile(self, since: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Per-route request metrics plus cache counters; pass an earlier profile to get the delta."""
+        profile = self.metrics.snapshot(since=since)
+        profile["http_cache"] = self.cache_stats()
+        profile["rate_limit"] = self.pool.snapshot() if self.pool else self.governor.snapshot()
+        profile["adaptive"] = self.adaptive_stats()
+        profile["blobs"] = self.blob_stats()
+        return profile
+
+    def iter_pages(self, path: str, params: Optional[Dict[str, Any]] = None, start_page: int = 1,
+                   per_page: int = 100, strict: bool = True) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Yield ``(page, items)`` as each page arrives.
+
+        The page number is the resume token: pass ``start_page=page + 1`` to
+        continue an interrupted walk. With ``strict`` a non-200 response raises
+        GitHubAPIError instead of ending the iteration silently.
+        """
+        page = start_page
         while True:
             p = dict(params or {})
-            p.update({"per_page": 100, "page": page})
+            p.update({"per_page": per_page, "page": page})
             resp = self._request("GET", path, params=p)
             if resp.status_code != 200:
-                break
+                if strict:
+                    raise GitHubAPIError(resp.status_code, path, resp.text[:200])
+                return
             batch = resp.json()
             if not batch:
-                break
-            items.extend(batch)
+                return
+            yield page, batch
+            if len(batch) < per_page:
+                return
             page += 1
+
+    def iter_items(self, path: str, params: Optional[Dict[str, Any]] = None, limit: Optional[int] = None,
+                   stop_when: Optional[Callable[[Dict[str, Any]], bool]] = None, start_page: int = 1,
+                   per_page: int = 100) -> Iterator[Dict[str, Any]]:
+        """Yield items one at a time, stopping after ``limit`` items or at the first item matching ``stop_when``."""
+        count = 0
+        for _, batch in self.iter_pages(path, params, start_page=start_page, per_page=per_page):
+            for item in batch:
+                if stop_when and stop_when(item):
+                    return
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def paginate(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        items: List[Dict[str, Any]] = []
+        for _, batch in self.iter_pages(path, params, strict=False):
+            items.extend(batch)
+        return items
+
+    def _records(self, path: str, record: Type[Record], params: Optional[Dict[str, Any]] = None, raw: bool = False) -> List[Any]:
+        # Converted page by page so the full raw listing is never held at once
+        items: List[Any] = []
+        for _, batch in self.iter_pages(path, params, strict=False):
+            items.extend(batch if raw else map(record, batch))
         return items
 
-    def list_user_repos(self, username: str) -> List[Dict[str, Any]]:
-        return self.paginate(f"/users/{username}/repos")
+    def list_user_repos(self, username: str, raw: bool = False) -> List[RepoRecord]:
+        """Repos as compact RepoRecords; ``raw=True`` returns the full REST payloads."""
+        return self._records(f"/users/{username}/repos", RepoRecord, raw=raw)
+
+    @staticmethod
+    def _issue_params(state: str, since: Optional[str]) -> Dict[str, Any]:
+        return {"state": state, "since": since} if since else {"state": state}
 
-    def list_issues(self, owner: str, repo: str, state: str = "open") -> List[Dict[str, Any]]:
-        return self.paginate(f"/repos/{owner}/{repo}/issues", params={"state": state})
+    @staticmethod
+    def _updated_until(items: List[Any], until: Optional[str]) -> List[Any]:
+        # The issues API only filters by ``since``; ``until`` is applied here
+        return [i for i in items if (i.get("updated_at") or "") <= until] if until else items
+
+    def list_issues(self, owner: str, repo: str, state: str = "open", since: Optional[str] = None,
+                    until: Optional[str] = None, raw: bool = False) -> List[IssueRecord]:
+        """Issues (and PRs) of ``repo``; ``since``/``until`` bound ``updated_at`` (ISO 8601)."""
+        items = self._records(f"/repos/{owner}/{repo}/issues", IssueRecord, params=self._issue_params(state, since), raw=raw)
+        return self._updated_until(items, until)
+
+    def iter_issues(self, owner: str, repo: str, state: str = "open", sort: str = "created", direction: str = "desc",
+                    limit: Optional[int] = None, stop_when: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                    since: Optional[str] = None, raw: bool = False) -> Iterator[IssueRecord]:
+        params = {"state": state, "sort": sort, "direction": direction}
+        if since:
+            params["since"] = since
+        items = self.iter_items(f"/repos/{owner}/{repo}/issues", params=params, limit=limit, stop_when=stop_when)
+        return items if raw else map(IssueRecord, items)
+
+    def issue_changes(self, owner: str, repo: str, since: Optional[str] = None) -> Iterator[IssueRecord]:
+        """Issues of ``repo`` (any state) updated since ``since``, oldest update first."""
+        return self.iter_issues(owner, repo, state="all", sort="updated", direction="asc", since=since)
+
+    def list_commits(self, owner: str, repo: str, page: int = 1, per_page: int = 30, sha: Optional[str] = None,
+                     since: Optional[str] = None, until: Optional[str] = None) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"page": page, "per_page": per_page}
+        for name, value in (("sha", sha), ("since", since), ("until", until)):
+            if value:
+                params[name] = value
+        resp = self._request("GET", f"/repos/{owner}/{repo}/commits", params=params)
+        if resp.status_code == 200:
+            return resp.json()
+        return []
+
+    def iter_commits(self, owner: str, repo: str, sha: Optional[str] = None, limit: Optional[int] = None,
+                     stop_when: Optional[Callable[[Dict[str, Any]], bool]] = None, since: Optional[str] = None,
+                     until: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        params = {name: value for name, value in (("sha", sha), ("since", since), ("until", until)) if value}
+        return self.iter_items(f"/repos/{owner}/{repo}/commits", params=params or None, limit=limit, stop_when=stop_when)
+
+    def commit_changes(self, owner: str, repo: str, since: Optional[str] = None,
+                       limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Default-branch commits since ``since`` (or the newest ``limit`` without one), keeping only sha, URL, message and dates."""
+        fresh = self.iter_commits(owner, repo, since=since) if since else self.iter_commits(owner, repo, limit=limit)
+        for c in fresh:
+            commit = c.get("commit") or {}
+            author = commit.get("author") or {}
+            yield {
+                "sha": c["sha"],
+                "html_url": c.get("html_url"),
+                "commit": {"message": commit.get("message", ""),
+                           "author": {"name": author.get("name"), "date": author.get("date")}},
+            }
 
     def create_issue(self, owner: str, repo: str, title: str, body: str) -> Dict[str, Any]:
         resp = self._request("POST", f"/repos/{owner}/{repo}/issues", json={"title": title, "body": body})
@@ -70,9 +430,66 @@ class GitHubClient:
         params = {"ref": ref} if ref else None
         resp = self._request("GET", f"/repos/{owner}/{repo}/contents/{path}", params=params)
         if resp.status_code == 200:
-            return resp.json()
+            data = resp.json()
+            if isinstance(data, dict) and data.get("sha"):
+                self._remember_sha(owner, repo, path, ref, data["sha"])
+                if data.get("encoding") == "base64" and data.get("content"):
+                    self.blobs.put(base64.b64decode(data["content"]), data["sha"])
+            return data
         return None
 
+    def list_paths(self, owner: str, repo: str, ref: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """``{path: blob sha}`` for every file on ``ref`` (default branch) from one tree call.
+
+        None when the tree cannot be read or GitHub truncated it.
+        """
+        key = (f"/repos/{owner}/{repo}/git/trees/{ref or 'HEAD'}", ("paths",))
+        paths = self.memo.get(key) if self.memo is not None else None
+        if paths is not None:
+            return paths
+        tree = self.get_tree(owner, repo, ref or "HEAD")
+        if not tree or tree.get("truncated"):
+            return None
+        paths = {e["path"]: e["sha"] for e in tree.get("tree", []) if e.get("type") == "blob"}
+        if self.memo is not None:
+            self.memo.set(key, paths, self.memo_ttl(key[0]))
+        return paths
+
+    def get_file_bytes(self, owner: str, repo: str, path: str, ref: Optional[str] = None) -> Optional[bytes]:
+        """Decoded contents of ``path``, downloaded only if its blob is not already in ``self.blobs``."""
+        paths = self.list_paths(owner, repo, ref)
+        if paths is None:
+            # Unreadable or truncated tree: ask the contents API directly
+            data = self.get_repo_file(owner, repo, path, ref=ref)
+            if not isinstance(data, dict) or data.get("encoding") != "base64":
+                return None
+            return base64.b64decode(data.get("content", ""))
+        sha = paths.get(path)
+        if sha is None:
+            return None
+        content = self.blobs.get(sha)
+        if content is not None:
+            return content
+        resp = self._request("GET", f"/repos/{owner}/{repo}/git/blobs/{sha}")
+        if resp.status_code != 200:
+            return None
+        content = base64.b64decode(resp.json().get("content", ""))
+        self.blobs.put(content, sha)
+        return content
+
+    def file_exists(self, owner: str, repo: str, path: str, ref: Optional[str] = None) -> bool:
+        paths = self.list_paths(owner, repo, ref)
+        if paths is None:
+            return self.get_repo_file(owner, repo, path, ref=ref) is not None
+        return path in paths
+
+    def _sha_key(self, owner: str, repo: str, path: str, ref: Optional[str]) -> Tuple:
+        return (f"/repos/{owner}/{repo}/contents/{path}", ("sha", ref or ""))
+
+    def _remember_sha(self, owner: str, repo: str, path: str, ref: Optional[str], sha: str):
+        if self.memo is not None:
+            self.memo.set(self._sha_key(owner, repo, path, ref), sha, 300)
+
     def get_default_branch(self, owner: str, repo: str) -> Optional[str]:
         resp = self._request("GET", f"/repos/{owner}/{repo}")
         if resp.status_code == 200:
@@ -103,6 +520,10 @@ class GitHubClient:
     def archive_repo(self, owner: str, repo: str) -> bool:
         return self.update_repo(owner, repo, archived=True)
 
+    def batch_writes(self, batch_size: int = 50) -> MutationBatcher:
+        """Queue issue and repo writes to send as aliased GraphQL mutations (see MutationBatcher)."""
+        return MutationBatcher(self, batch_size=batch_size)
+
     def create_repo(self, name: str, **kwargs) -> Optional[Dict[str, Any]]:
         resp = self._request("POST", "/user/repos", json={"name": name, **kwargs})
         if resp.status_code in (200, 201):
@@ -110,10 +531,11 @@ class GitHubClient:
         return None
 
     def create_or_update_file(self, owner: str, repo: str, path: str, content: str, message: str, branch: str = "main") -> bool:
-        import base64
-        # Check if file exists to get sha
-        current_file = self.get_repo_file(owner, repo, path, ref=branch)
-        sha = current_file["sha"] if current_file else None
+        # Reuse a sha learned from an earlier read or write; otherwise check if the file exists
+        sha = self.memo.get(self._sha_key(owner, repo, path, branch)) if self.memo is not None else None
+        if sha is None:
+            current_file = self.get_repo_file(owner, repo, path, ref=branch)
+            sha = current_file["sha"] if current_file else None
         
         encoded_content = base64.b64encode(content.encode("utf-8")).decode("utf-8")
         data = {
@@ -125,14 +547,117 @@ class GitHubClient:
             data["sha"] = sha
             
         resp = self._request("PUT", f"/repos/{owner}/{repo}/contents/{path}", json=data)
-        return resp.status_code in (200, 201)
+        if resp.status_code in (409, 422) and sha:
+            # Remembered sha went stale (changed outside this client): refetch once
+            current_file = self.get_repo_file(owner, repo, path, ref=branch)
+            data["sha"] = current_file["sha"] if current_file else None
+            if not data["sha"]:
+                del data["sha"]
+            resp = self._request("PUT", f"/repos/{owner}/{repo}/contents/{path}", json=data)
+        if resp.status_code in (200, 201):
+            new_sha = (resp.json().get("content") or {}).get("sha")
+            if new_sha:
+                self._remember_sha(owner, repo, path, branch, new_sha)
+            return True
+        return False
+
+    def commit_files(self, owner: str, repo: str, branch: str, files: Dict[str, Optional[Union[str, bytes]]],
+                     message: str) -> Optional[str]:
+        """Write several files to ``branch`` as a single commit through the Git Data API.
+
+        ``files`` maps paths to new contents; ``None`` deletes the path. Costs
+        four requests however many files change (plus one blob upload per
+        binary file). Returns the new head sha, or None on failure.
+        """
+        tree = []
+        for path, content in files.items():
+            entry: Dict[str, Any] = {"path": path, "mode": "100644", "type": "blob"}
+            if content is None:
+                entry["sha"] = None
+            elif isinstance(content, bytes):
+                try:
+                    entry["content"] = content.decode("utf-8")
+                except UnicodeDecodeError:
+                    resp = self._request("POST", f"/repos/{owner}/{repo}/git/blobs",
+                                         json={"content": base64.b64encode(content).decode("ascii"), "encoding": "base64"})
+                    if resp.status_code != 201:
+                        return None
+                    entry["sha"] = resp.json()["sha"]
+            else:
+                entry["content"] = content
+            tree.append(entry)
 
-    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        resp = self._request("POST", "/graphql", json={"query": query, "variables": variables or {}})
+        for attempt in range(2):
+            # Branch lookup returns both the head commit and its tree, saving a separate commit read
+            resp = self._request("GET", f"/repos/{owner}/{repo}/branches/{branch}")
+            if resp.status_code != 200:
+                return None
+            head = resp.json()["commit"]
+            resp = self._request("POST", f"/repos/{owner}/{repo}/git/trees",
+                                 json={"base_tree": head["commit"]["tree"]["sha"], "tree": tree})
+            if resp.status_code != 201:
+                return None
+            tree_sha = resp.json()["sha"]
+            if tree_sha == head["commit"]["tree"]["sha"]:
+                return head["sha"]
+            resp = self._request("POST", f"/repos/{owner}/{repo}/git/commits",
+                                 json={"message": message, "tree": tree_sha, "parents": [head["sha"]]})
+            if resp.status_code != 201:
+                return None
+            commit_sha = resp.json()["sha"]
+            resp = self._request("PATCH", f"/repos/{owner}/{repo}/git/refs/heads/{branch}", json={"sha": commit_sha})
+            if resp.status_code == 200:
+                return commit_sha
+            # 422: the branch moved underneath us; the write above invalidated the memoized head, so retry once
+        return None
+
+    def get_tree(self, owner: str, repo: str, ref: str, recursive: bool = True) -> Optional[Dict[str, Any]]:
+        """Git tree of ``ref`` (branch, commit or tree sha): every path with its blob sha and size in one call."""
+        params = {"recursive": 1} if recursive else None
+        resp = self._request("GET", f"/repos/{owner}/{repo}/git/trees/{ref}", params=params)
         if resp.status_code == 200:
             return resp.json()
         return None
 
+    def rate_limit(self) -> Dict[str, Dict[str, int]]:
+        """Live budget per resource (``core``, ``graphql``, ...); this call itself is free."""
+        resp = self._request("GET", "/rate_limit")
+        if resp.status_code == 200:
+            return resp.json().get("resources", {})
+        return {}
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None, cost: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """POST a GraphQL document; ``cost`` overrides the secondary-limit points charged for it."""
+        resp = self._request("POST", "/graphql", json={"query": query, "variables": variables or {}}, cost=cost)
+        if resp.status_code == 200:
+            return resp.json()
+        return None
+
+    def repo_inventory(self, owner: str, raw: bool = False, include_private: Optional[bool] = None) -> List[RepoRecord]:
+        """Public repositories of ``owner`` with branch, activity, topic, language and count metadata.
+
+        One GraphQL request per 100 repos replaces the REST listing plus the
+        per-repo ``get_repo`` / ``get_default_branch`` lookups. Private repos
+        are included with ``include_private`` (default ``self.include_private``).
+        ``raw=True`` returns the flattened dicts instead of RepoRecords.
+        """
+        include_private = self.include_private if include_private is None else include_private
+        repos: List[Dict[str, Any]] = []
+        cursor = None
+        while True:
+            variables = {"owner": owner, "cursor": cursor, "privacy": None if include_private else "PUBLIC"}
+            result = self.graphql(REPO_INVENTORY_QUERY, variables)
+            data = (result or {}).get("data") or {}
+            if not data.get("repositoryOwner"):
+                errors = (result or {}).get("errors") or "no response"
+                raise GitHubAPIError(200 if result else 0, "/graphql", str(errors))
+            connection = data["repositoryOwner"]["repositories"]
+            nodes = map(normalize_inventory_node, connection["nodes"])
+            repos.extend(nodes if raw else map(RepoRecord, nodes))
+            if not connection["pageInfo"]["hasNextPage"]:
+                return repos
+            cursor = connection["pageInfo"]["endCursor"]
+
     def enable_pages(self, owner: str, repo: str, branch: str = "main", path: str = "/") -> bool:
         # Check if already enabled
         resp = self._request("GET", f"/repos/{owner}/{repo}/pages")
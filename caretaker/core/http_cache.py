@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+
+# Listings filtered by these change with every run, so their entries would never be revalidated
+VOLATILE_PARAMS = frozenset({"since", "until"})
+# Content-addressed responses already kept by the client's BlobStore
+UNCACHED_PATHS = re.compile(r"/git/blobs/")
+
+class ResponseCache:
+    """Persistent ETag / Last-Modified cache for GET responses.
+
+    Entries are keyed by method + URL + params and stored as JSON files under
+    ``cache_dir``. The client sends conditional headers for cached entries and
+    replays the stored body when GitHub answers 304 (which is not counted
+    against the rate limit). Once the files exceed ``max_bytes`` the least
+    recently used are removed. Requests filtered by ``since``/``until`` and
+    blob downloads are not stored (see ``cacheable``).
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 128 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Bytes on disk; counted on the first store and recounted whenever entries are pruned
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cacheable(path: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """Whether a GET of ``path`` is worth keeping on disk."""
+        if params and VOLATILE_PARAMS & set(params):
+            return False
+        return not UNCACHED_PATHS.search(path)
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+        raw = json.dumps([method.upper(), url, items])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            # The modification time doubles as the last use, for pruning
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, key: str, resp: requests.Response) -> bool:
+        """Persist a 200 response if it carries a validator. Counts as a miss."""
+        with self._lock:
+            self.misses += 1
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return False
+        entry = {
+            "url": resp.url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {k: v for k, v in resp.headers.items() if k.lower() in ("content-type", "link")},
+            "body": resp.content.decode(resp.encoding or "utf-8", errors="replace"),
+        }
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        previous = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp, path)
+        with self._lock:
+            if self._size is None:
+                self._size = self._disk_usage()
+            else:
+                self._size += os.path.getsize(path) - previous
+            if self._size > self.max_bytes:
+                self._prune()
+        return True
+
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield st.st_mtime, st.st_size, path
+
+    def _disk_usage(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _prune(self):
+        """Remove least recently used entries until the cache is back under 90% of ``max_bytes``."""
+        entries = sorted(self._entries())
+        size = sum(e[1] for e in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+    def replay(self, entry: Dict[str, Any], not_modified: requests.Response) -> requests.Response:
+        """Build a 200 response from a cached entry after a 304. Counts as a hit."""
+        with self._lock:
+            self.hits += 1
+        resp = requests.Response()
+        resp.status_code = 200
+        resp.url = entry.get("url") or not_modified.url
+        resp.headers.update(not_modified.headers)
+        resp.headers.update(entry.get("headers") or {})
+        resp.encoding = "utf-8"
+        resp._content = entry.get("body", "").encode("utf-8")
+        resp.request = not_modified.request
+        return resp
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,73 @@
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+class Journal:
+    """Per-repo checkpoints of plugin runs, so an interrupted sweep can resume.
+
+    Each completed unit of ``(owner, plugin)`` is appended as one JSON line
+    (``unit``, ``fingerprint``, ``value``) as soon as it finishes; the runner
+    clears a plugin's journal once the plugin completes. With
+    ``journal_dir`` the lines are files that survive crashes and Ctrl-C;
+    without it they live in memory.
+    """
+
+    def __init__(self, journal_dir: Optional[str] = None):
+        self.journal_dir = journal_dir
+        self._memory: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, owner: str, plugin: str) -> str:
+        return os.path.join(self.journal_dir, owner, f"{plugin}.ndjson")
+
+    def completed(self, owner: str, plugin: str) -> Dict[str, Dict[str, Any]]:
+        """``{unit: {"fingerprint", "value"}}`` for units checkpointed since the plugin last completed."""
+        if self.journal_dir is None:
+            with self._lock:
+                entries = list(self._memory.get((owner, plugin)) or [])
+        else:
+            entries = []
+            try:
+                with open(self._path(owner, plugin), "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            entries.append(json.loads(line))
+                        except ValueError:
+                            # A line cut short by the interruption
+                            continue
+            except OSError:
+                pass
+        return {e["unit"]: {"fingerprint": e.get("fingerprint"), "value": e.get("value")} for e in entries}
+
+    def record(self, owner: str, plugin: str, unit: str, value: Any, fingerprint: Optional[str] = None):
+        entry = {"unit": unit, "fingerprint": fingerprint, "value": value}
+        with self._lock:
+            if self.journal_dir is None:
+                self._memory.setdefault((owner, plugin), []).append(entry)
+                return
+            path = self._path(owner, plugin)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+
+    def clear(self, owner: str, plugin: str):
+        with self._lock:
+            if self.journal_dir is None:
+                self._memory.pop((owner, plugin), None)
+                return
+            try:
+                os.remove(self._path(owner, plugin))
+            except OSError:
+                pass
+
+    def pending(self, owner: str) -> List[str]:
+        """Plugins with checkpoints left by a run that did not complete."""
+        if self.journal_dir is None:
+            with self._lock:
+                return sorted(plugin for (o, plugin), entries in self._memory.items() if o == owner and entries)
+        try:
+            names = os.listdir(os.path.join(self.journal_dir, owner))
+        except OSError:
+            return []
+        return sorted(name[:-len(".ndjson")] for name in names if name.endswith(".ndjson"))
@@ -0,0 +1,32 @@
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator
+
+# Request classes, highest priority first
+INTERACTIVE = "interactive"
+SCHEDULED = "scheduled"
+BULK_WRITE = "bulk_write"
+LANES = (INTERACTIVE, SCHEDULED, BULK_WRITE)
+
+# A context variable rather than a thread-local so asyncio.to_thread workers inherit the caller's lane
+_lane: contextvars.ContextVar = contextvars.ContextVar("caretaker_lane", default=SCHEDULED)
+
+def current_lane() -> str:
+    return _lane.get()
+
+def set_lane(name: str) -> contextvars.Token:
+    if name not in LANES:
+        raise ValueError(f"Unknown lane {name!r}")
+    return _lane.set(name)
+
+def reset_lane(token: contextvars.Token):
+    _lane.reset(token)
+
+@contextmanager
+def request_lane(name: str) -> Iterator[str]:
+    """Run the enclosed GitHub calls in lane ``name``."""
+    token = set_lane(name)
+    try:
+        yield name
+    finally:
+        reset_lane(token)
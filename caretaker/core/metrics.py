@@ -0,0 +1,119 @@
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+# Upper bounds (seconds) of the latency histogram buckets; the last one catches everything
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+_SHA = re.compile(r"^[0-9a-f]{40}$")
+
+def route_template(path: str) -> str:
+    """Collapse a concrete API path into its route, e.g. ``/repos/{o}/{r}/issues/{n}``."""
+    parts = [p for p in path.split("?")[0].split("/") if p]
+    if not parts:
+        return "/"
+    out: List[str] = [parts[0]]
+    rest = parts[1:]
+    if parts[0] == "repos" and len(parts) >= 3:
+        out += ["{o}", "{r}"]
+        rest = parts[3:]
+        if rest and rest[0] == "contents":
+            return "/" + "/".join(out + ["contents", "{path}"])
+        if rest[:2] in (["git", "refs"], ["git", "trees"]) and len(rest) > 2:
+            return "/" + "/".join(out + rest[:2] + ["{ref}"])
+        if rest and rest[0] in ("branches", "labels") and len(rest) > 1:
+            return "/" + "/".join(out + [rest[0], "{name}"])
+    elif parts[0] in ("users", "orgs") and len(parts) >= 2:
+        out.append("{u}" if parts[0] == "users" else "{org}")
+        rest = parts[2:]
+    for p in rest:
+        out.append("{n}" if p.isdigit() else "{sha}" if _SHA.match(p) else p)
+    return "/" + "/".join(out)
+
+def _percentile(buckets: List[int], q: float, ceiling: float) -> Optional[float]:
+    """Upper bound of the bucket holding the q-th quantile; the open bucket reports ``ceiling``."""
+    total = sum(buckets)
+    if not total:
+        return None
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS, buckets):
+        seen += count
+        if seen >= q * total:
+            return min(bound, ceiling)
+    return ceiling
+
+class RequestMetrics:
+    """Per-route counters for calls, statuses, retries, throttling sleep, bytes and latency."""
+
+    def __init__(self):
+        self._routes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _route(self, method: str, route: str) -> Dict[str, Any]:
+        key = f"{method} {route}"
+        if key not in self._routes:
+            self._routes[key] = {
+                "calls": 0, "memo_hits": 0, "retries": 0, "rate_sleep": 0.0, "bytes": 0,
+                "latency_total": 0.0, "latency_max": 0.0, "statuses": Counter(),
+                "latency_buckets": [0] * len(LATENCY_BUCKETS),
+            }
+        return self._routes[key]
+
+    def record(self, method: str, path: str, status: int, latency: float, nbytes: int, retry: bool = False):
+        with self._lock:
+            r = self._route(method, route_template(path))
+            r["calls"] += 1
+            r["statuses"][str(status)] += 1
+            r["bytes"] += nbytes
+            r["latency_total"] += latency
+            r["latency_max"] = max(r["latency_max"], latency)
+            r["latency_buckets"][next(i for i, b in enumerate(LATENCY_BUCKETS) if latency <= b)] += 1
+            if retry:
+                r["retries"] += 1
+
+    def record_sleep(self, method: str, path: str, seconds: float):
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._route(method, route_template(path))["rate_sleep"] += seconds
+
+    def record_memo_hit(self, method: str, path: str):
+        with self._lock:
+            self._route(method, route_template(path))["memo_hits"] += 1
+
+    def snapshot(self, since: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """JSON-ready view of all routes; with ``since`` only the activity after that snapshot."""
+        with self._lock:
+            routes = {}
+            for key, r in self._routes.items():
+                routes[key] = dict(r, statuses=dict(r["statuses"]), latency_buckets=list(r["latency_buckets"]))
+        if since:
+            routes = {k: _subtract(r, since.get("routes", {}).get(k)) for k, r in routes.items()}
+            routes = {k: r for k, r in routes.items() if r["calls"] or r["memo_hits"]}
+        for r in routes.values():
+            # 304 revalidations are free; everything else draws on the rate limit
+            r["cost"] = r["calls"] - r["statuses"].get("304", 0)
+            r["latency_avg"] = round(r["latency_total"] / r["calls"], 4) if r["calls"] else 0.0
+            r["latency_p50"] = _percentile(r["latency_buckets"], 0.5, r["latency_max"])
+            r["latency_p95"] = _percentile(r["latency_buckets"], 0.95, r["latency_max"])
+        totals = {
+            name: sum(r[name] for r in routes.values())
+            for name in ("calls", "cost", "memo_hits", "retries", "rate_sleep", "bytes", "latency_total")
+        }
+        return {"routes": routes, "totals": totals, "latency_buckets": list(LATENCY_BUCKETS[:-1])}
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+def _subtract(now: Dict[str, Any], before: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    if not before:
+        return now
+    out = dict(now)
+    for name in ("calls", "memo_hits", "retries", "rate_sleep", "bytes", "latency_total"):
+        out[name] = now[name] - before.get(name, 0)
+    out["statuses"] = {s: n - before.get("statuses", {}).get(s, 0) for s, n in now["statuses"].items()}
+    out["statuses"] = {s: n for s, n in out["statuses"].items() if n}
+    out["latency_buckets"] = [a - b for a, b in zip(now["latency_buckets"], before.get("latency_buckets", [0] * len(LATENCY_BUCKETS)))]
+    return out
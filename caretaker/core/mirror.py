@@ -0,0 +1,232 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from caretaker.core.github_client import GitHubAPIError
+from caretaker.core.records import IssueRecord, RepoRecord
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS repos (
+    owner TEXT NOT NULL, name TEXT NOT NULL, archived INTEGER, private INTEGER, fork INTEGER,
+    default_branch TEXT, pushed_at TEXT, updated_at TEXT, data TEXT NOT NULL,
+    PRIMARY KEY (owner, name)
+);
+CREATE INDEX IF NOT EXISTS repos_owner_updated ON repos (owner, updated_at);
+CREATE TABLE IF NOT EXISTS issues (
+    owner TEXT NOT NULL, repo TEXT NOT NULL, number INTEGER NOT NULL, state TEXT, is_pr INTEGER,
+    created_at TEXT, updated_at TEXT, data TEXT NOT NULL,
+    PRIMARY KEY (owner, repo, number)
+);
+CREATE INDEX IF NOT EXISTS issues_owner_repo_updated ON issues (owner, repo, updated_at);
+CREATE TABLE IF NOT EXISTS commits (
+    owner TEXT NOT NULL, repo TEXT NOT NULL, sha TEXT NOT NULL, date TEXT, data TEXT NOT NULL,
+    PRIMARY KEY (owner, repo, sha)
+);
+CREATE INDEX IF NOT EXISTS commits_owner_repo_date ON commits (owner, repo, date);
+CREATE TABLE IF NOT EXISTS files (
+    owner TEXT NOT NULL, repo TEXT NOT NULL, path TEXT NOT NULL, sha TEXT, size INTEGER,
+    PRIMARY KEY (owner, repo, path)
+);
+CREATE TABLE IF NOT EXISTS trees (
+    owner TEXT NOT NULL, repo TEXT NOT NULL, pushed_at TEXT,
+    PRIMARY KEY (owner, repo)
+);
+CREATE TABLE IF NOT EXISTS synced (
+    owner TEXT NOT NULL, scope TEXT NOT NULL, at REAL NOT NULL,
+    PRIMARY KEY (owner, scope)
+);
+"""
+
+class Mirror:
+    """Local SQLite copy of repo, issue, commit and file metadata.
+
+    Reads (``repos``, ``issues``, ``commits``, ``files``) are served from the
+    database and refresh their scope through the client first when it was
+    last synced more than ``max_age`` seconds ago, so dashboards and re-runs
+    with new thresholds are local queries. Refreshes use the cheapest source
+    available: the GraphQL inventory for repos, ``since`` deltas for issues
+    and commits (from the newest row stored, upserting only what changed), one recursive tree call for files (skipped while the repo's
+    ``pushed_at`` is where it was when the tree was stored).
+    """
+
+    def __init__(self, path: str, client=None, max_age: float = 900, clock: Callable[[], float] = time.time):
+        self.path = path
+        self.client = client
+        self.max_age = max_age
+        self.clock = clock
+        self.pinned_since: Optional[float] = None
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # One connection shared by the Flask threads and the scheduler, serialized by a lock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
+        with self._lock:
+            if path != ":memory:":
+                self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(SCHEMA)
+
+    @contextmanager
+    def pinned(self) -> Iterator[None]:
+        """Within the block a scope synced once stays fresh, whatever ``max_age`` says.
+
+        A run of several plugins thereby reads each scope from GitHub at most
+        once, even with ``max_age=0``.
+        """
+        previous = self.pinned_since
+        if previous is None:
+            self.pinned_since = self.clock()
+        try:
+            yield
+        finally:
+            self.pinned_since = previous
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # --- freshness -------------------------------------------------------
+
+    def synced_at(self, owner: str, scope: str) -> Optional[float]:
+        with self._lock:
+            row = self._db.execute("SELECT at FROM synced WHERE owner = ? AND scope = ?", (owner, scope)).fetchone()
+        return row["at"] if row else None
+
+    def is_stale(self, owner: str, scope: str, max_age: Optional[float] = None) -> bool:
+        """Whether reading ``scope`` (``repos``, ``issues:<repo>``, ...) would refresh it from GitHub first."""
+        if self.client is None:
+            return False
+        at = self.synced_at(owner, scope)
+        if at is not None and self.pinned_since is not None and at >= self.pinned_since:
+            return False
+        return at is None or self.clock() - at > (self.max_age if max_age is None else max_age)
+
+    def _mark(self, owner: str, scope: str):
+        self._db.execute("INSERT OR REPLACE INTO synced (owner, scope, at) VALUES (?, ?, ?)", (owner, scope, self.clock()))
+
+    # --- sync ------------------------------------------------------------
+
+    def sync_repos(self, owner: str) -> int:
+        """Replace the owner's repos with the current inventory. Returns the repo count."""
+        repos = self.client.repo_inventory(owner)
+        rows = [(owner, r.name, int(bool(r.archived)), int(bool(r.private)), int(bool(r.fork)), r.default_branch,
+                 r.pushed_at, r.updated_at, json.dumps(r.to_dict())) for r in repos]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM repos WHERE owner = ?", (owner,))
+            self._db.executemany("INSERT INTO repos VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._mark(owner, "repos")
+        return len(rows)
+
+    def sync_issues(self, owner: str, repo: str) -> int:
+        """Upsert the issues updated since the newest one stored. Returns how many were fetched."""
+        since = self.query("SELECT MAX(updated_at) AS at FROM issues WHERE owner = ? AND repo = ?", (owner, repo))[0]["at"]
+        rows = [(owner, repo, i.number, i.state, int(bool(i.pull_request)), i.created_at, i.updated_at,
+                 json.dumps(i.to_dict())) for i in self.client.issue_changes(owner, repo, since=since)]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._mark(owner, f"issues:{repo}")
+        return len(rows)
+
+    def sync_commits(self, owner: str, repo: str, limit: Optional[int] = None) -> int:
+        """Upsert commits since the newest one stored (the newest ``limit`` on a first sync). Returns how many were fetched."""
+        since = self.query("SELECT MAX(date) AS at FROM commits WHERE owner = ? AND repo = ?", (owner, repo))[0]["at"]
+        rows = [(owner, repo, c["sha"], c["commit"]["author"]["date"], json.dumps(c))
+                for c in self.client.commit_changes(owner, repo, since=since, limit=limit)]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR REPLACE INTO commits VALUES (?, ?, ?, ?, ?)", rows)
+            self._mark(owner, f"commits:{repo}")
+        return len(rows)
+
+    def sync_files(self, owner: str, repo: str, ref: Optional[str] = None) -> int:
+        """Store path, blob sha and size of every file on ``ref`` (default branch) from one tree call.
+
+        Raises GitHubAPIError, leaving the stored files as they were, when the
+        tree cannot be read or GitHub truncated it.
+        """
+        default = self._default_branch(owner, repo)
+        pushed_at = self._pushed_at(owner, repo) if ref is None or ref == default else None
+        ref = ref or default or self.client.get_default_branch(owner, repo) or "main"
+        tree = self.client.get_tree(owner, repo, ref)
+        if not tree or tree.get("truncated"):
+            # Keep the stored listing and its watermark rather than replacing them with a partial one
+            raise GitHubAPIError(200 if tree else 0, f"/repos/{owner}/{repo}/git/trees/{ref}",
+                                 "truncated tree" if tree else "tree unavailable")
+        rows = [(owner, repo, e["path"], e["sha"], e.get("size")) for e in tree.get("tree", []) if e.get("type") == "blob"]
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM files WHERE owner = ? AND repo = ?", (owner, repo))
+            self._db.executemany("INSERT INTO files VALUES (?, ?, ?, ?, ?)", rows)
+            self._db.execute("INSERT OR REPLACE INTO trees VALUES (?, ?, ?)", (owner, repo, pushed_at))
+            self._mark(owner, f"files:{repo}")
+        return len(rows)
+
+    def files_unchanged(self, owner: str, repo: str) -> bool:
+        """Whether the stored tree is still current: no push since it was listed, per a fresh inventory."""
+        if self.is_stale(owner, "repos"):
+            return False
+        with self._lock:
+            row = self._db.execute("SELECT pushed_at FROM trees WHERE owner = ? AND repo = ?", (owner, repo)).fetchone()
+        return bool(row and row["pushed_at"]) and row["pushed_at"] == self._pushed_at(owner, repo)
+
+    def _pushed_at(self, owner: str, repo: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT pushed_at FROM repos WHERE owner = ? AND name = ?", (owner, repo)).fetchone()
+        return row["pushed_at"] if row else None
+
+    def _default_branch(self, owner: str, repo: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT default_branch FROM repos WHERE owner = ? AND name = ?", (owner, repo)).fetchone()
+        return row["default_branch"] if row else None
+
+    # --- queries ---------------------------------------------------------
+
+    def repos(self, owner: str, include_archived: bool = True, max_age: Optional[float] = None) -> List[RepoRecord]:
+        if self.is_stale(owner, "repos", max_age):
+            self.sync_repos(owner)
+        sql = "SELECT data FROM repos WHERE owner = ?" + ("" if include_archived else " AND archived = 0")
+        return [RepoRecord(json.loads(row["data"])) for row in self.query(sql + " ORDER BY name COLLATE NOCASE", (owner,))]
+
+    def issues(self, owner: str, repo: str, state: Optional[str] = None, updated_before: Optional[str] = None,
+               max_age: Optional[float] = None) -> List[IssueRecord]:
+        if self.is_stale(owner, f"issues:{repo}", max_age):
+            self.sync_issues(owner, repo)
+        sql, params = "SELECT data FROM issues WHERE owner = ? AND repo = ?", [owner, repo]
+        if state:
+            sql += " AND state = ?"
+            params.append(state)
+        if updated_before:
+            sql += " AND updated_at < ?"
+            params.append(updated_before)
+        return [IssueRecord(json.loads(row["data"])) for row in self.query(sql + " ORDER BY number DESC", params)]
+
+    def issues_updated_at(self, owner: str, repo: str, max_age: Optional[float] = None) -> Optional[str]:
+        """Newest ``updated_at`` among the repo's issues, to tell whether any of them changed."""
+        if self.is_stale(owner, f"issues:{repo}", max_age):
+            self.sync_issues(owner, repo)
+        return self.query("SELECT MAX(updated_at) AS at FROM issues WHERE owner = ? AND repo = ?", (owner, repo))[0]["at"]
+
+    def commits(self, owner: str, repo: str, limit: Optional[int] = None, max_age: Optional[float] = None) -> List[Dict[str, Any]]:
+        if self.is_stale(owner, f"commits:{repo}", max_age):
+            self.sync_commits(owner, repo, limit=limit)
+        sql = "SELECT data FROM commits WHERE owner = ? AND repo = ? ORDER BY date DESC"
+        rows = self.query(sql + (" LIMIT ?" if limit else ""), (owner, repo, limit) if limit else (owner, repo))
+        return [json.loads(row["data"]) for row in rows]
+
+    def files(self, owner: str, repo: str, max_age: Optional[float] = None) -> Dict[str, str]:
+        """``{path: blob sha}`` for the default branch; see ``sync_files`` for unreadable trees."""
+        if self.is_stale(owner, f"files:{repo}", max_age):
+            if self.files_unchanged(owner, repo):
+                with self._lock, self._db:
+                    self._mark(owner, f"files:{repo}")
+            else:
+                self.sync_files(owner, repo)
+        rows = self.query("SELECT path, sha FROM files WHERE owner = ? AND repo = ?", (owner, repo))
+        return {row["path"]: row["sha"] for row in rows}
+
+    def query(self, sql: str, params: Any = ()) -> List[sqlite3.Row]:
+        """Run a read-only query against the mirror, e.g. for dashboards or ad-hoc analyses."""
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
@@ -0,0 +1,222 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from caretaker.core.lanes import BULK_WRITE
+
+# GraphQL mutation -> (input type, selection returned per alias)
+MUTATIONS: Dict[str, Tuple[str, str]] = {
+    "addComment": ("AddCommentInput", "clientMutationId"),
+    "closeIssue": ("CloseIssueInput", "issue { id }"),
+    "updateRepository": ("UpdateRepositoryInput", "repository { id }"),
+    "archiveRepository": ("ArchiveRepositoryInput", "repository { id }"),
+    "unarchiveRepository": ("UnarchiveRepositoryInput", "repository { id }"),
+    "updateTopics": ("UpdateTopicsInput", "invalidTopicNames"),
+}
+
+# Fields of PATCH /repos/{owner}/{repo} that UpdateRepositoryInput also accepts
+REPO_FIELDS = {
+    "name": "name",
+    "description": "description",
+    "homepage": "homepageUrl",
+    "has_issues": "hasIssuesEnabled",
+    "has_wiki": "hasWikiEnabled",
+    "has_projects": "hasProjectsEnabled",
+    "is_template": "template",
+}
+
+# Points GitHub's secondary limit charges per mutation, as _send charges a REST write
+MUTATION_COST = 5
+
+class Operation:
+    """One queued write; ``ok`` and ``error`` are filled in by ``MutationBatcher.flush``."""
+
+    __slots__ = ("owner", "repo", "number", "node_id", "steps", "rest", "ok", "error")
+
+    def __init__(self, owner: str, repo: str, number: Optional[int] = None, node_id: Optional[str] = None):
+        self.owner = owner
+        self.repo = repo
+        self.number = number
+        self.node_id = node_id
+        # (mutation, input without the node id, name of the node id field)
+        self.steps: List[Tuple[str, Dict[str, Any], str]] = []
+        # REST fields the GraphQL API cannot set; the op is sent through update_repo instead
+        self.rest: Optional[Dict[str, Any]] = None
+        self.ok: Optional[bool] = None
+        self.error: Optional[str] = None
+
+    def _fail(self, error: str):
+        self.ok = False
+        self.error = self.error or error
+
+    def __repr__(self) -> str:
+        target = f"{self.owner}/{self.repo}" + (f"#{self.number}" if self.number else "")
+        return f"Operation({target!r}, ok={self.ok!r})"
+
+class MutationBatcher:
+    """Packs many repo and issue writes into aliased GraphQL mutations.
+
+    Writes are queued (``close_issue``, ``add_comment``, ``update_repo``,
+    ``archive_repo``, ``update_topics``) and sent by ``flush`` as documents of
+    up to ``batch_size`` mutations (fewer if the client's governor could not
+    admit that many in one request), so closing 300 issues takes a handful of
+    requests instead of 600. Node ids not passed in are looked up with
+    aliased queries of up to ``lookup_size`` nodes. GitHub runs the
+    mutations of a document in order and reports failures per alias, which
+    are mapped back onto each queued Operation. Used as a context manager it
+    flushes on exit.
+    """
+
+    def __init__(self, client, batch_size: int = 50, lookup_size: int = 100):
+        self.client = client
+        self.batch_size = batch_size
+        self.lookup_size = lookup_size
+        self.requests = 0
+        self._pending: List[Operation] = []
+        self._ids: Dict[Tuple, Optional[str]] = {}
+
+    def __enter__(self) -> "MutationBatcher":
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _queue(self, op: Operation) -> Operation:
+        self._pending.append(op)
+        return op
+
+    # --- queueing --------------------------------------------------------
+
+    def add_comment(self, owner: str, repo: str, number: int, body: str, node_id: Optional[str] = None) -> Operation:
+        op = Operation(owner, repo, number, node_id)
+        op.steps.append(("addComment", {"body": body}, "subjectId"))
+        return self._queue(op)
+
+    def close_issue(self, owner: str, repo: str, number: int, comment: Optional[str] = None,
+                    node_id: Optional[str] = None) -> Operation:
+        op = Operation(owner, repo, number, node_id)
+        if comment:
+            op.steps.append(("addComment", {"body": comment}, "subjectId"))
+        op.steps.append(("closeIssue", {}, "issueId"))
+        return self._queue(op)
+
+    def update_repo(self, owner: str, repo: str, node_id: Optional[str] = None, **fields) -> Operation:
+        op = Operation(owner, repo, node_id=node_id)
+        archived = fields.pop("archived", None)
+        if any(field not in REPO_FIELDS for field in fields):
+            op.rest = dict(fields, **({"archived": archived} if archived is not None else {}))
+            return self._queue(op)
+        # An archived repository is read-only: unarchive before editing, archive after
+        if archived is False:
+            op.steps.append(("unarchiveRepository", {}, "repositoryId"))
+        if fields:
+            op.steps.append(("updateRepository", {REPO_FIELDS[k]: v for k, v in fields.items()}, "repositoryId"))
+        if archived:
+            op.steps.append(("archiveRepository", {}, "repositoryId"))
+        return self._queue(op)
+
+    def archive_repo(self, owner: str, repo: str, node_id: Optional[str] = None) -> Operation:
+        return self.update_repo(owner, repo, node_id=node_id, archived=True)
+
+    def update_topics(self, owner: str, repo: str, topics: List[str], node_id: Optional[str] = None) -> Operation:
+        op = Operation(owner, repo, node_id=node_id)
+        op.steps.append(("updateTopics", {"topicNames": list(topics)}, "repositoryId"))
+        return self._queue(op)
+
+    # --- sending ---------------------------------------------------------
+
+    def flush(self) -> List[Operation]:
+        """Send everything queued; returns the operations with ``ok`` / ``error`` set."""
+        ops, self._pending = self._pending, []
+        for op in ops:
+            if op.rest is not None:
+                op.ok = self.client.update_repo(op.owner, op.repo, **op.rest)
+                if not op.ok:
+                    op.error = "REST update failed"
+        graph = [op for op in ops if op.rest is None and op.steps]
+        self._resolve(graph)
+        # Each document is charged MUTATION_COST per mutation, which must fit the governor's minute budget
+        limit = max(1, min(self.batch_size, self.client.governor.max_cost(BULK_WRITE) // MUTATION_COST))
+        batch: List[Operation] = []
+        size = 0
+        for op in graph:
+            if op.ok is False:
+                continue
+            if batch and size + len(op.steps) > limit:
+                self._send(batch)
+                batch, size = [], 0
+            batch.append(op)
+            size += len(op.steps)
+        if batch:
+            self._send(batch)
+        for op in ops:
+            if op.ok is None:
+                op.ok = True
+        return ops
+
+    def _resolve(self, ops: List[Operation]):
+        """Fill in missing node ids with aliased repository/issue lookups."""
+        wanted: List[Tuple] = []
+        for op in ops:
+            key = (op.owner, op.repo, op.number)
+            if op.node_id is None and key not in self._ids and key not in wanted:
+                wanted.append(key)
+        for start in range(0, len(wanted), self.lookup_size):
+            chunk = wanted[start:start + self.lookup_size]
+            declarations, fields, variables = [], [], {}
+            for i, (owner, repo, number) in enumerate(chunk):
+                declarations += [f"$o{i}: String!", f"$r{i}: String!"]
+                variables[f"o{i}"], variables[f"r{i}"] = owner, repo
+                if number is None:
+                    fields.append(f"n{i}: repository(owner: $o{i}, name: $r{i}) {{ id }}")
+                else:
+                    declarations.append(f"$i{i}: Int!")
+                    variables[f"i{i}"] = number
+                    fields.append(f"n{i}: repository(owner: $o{i}, name: $r{i}) {{ issue(number: $i{i}) {{ id }} }}")
+            query = f"query({', '.join(declarations)}) {{\n  " + "\n  ".join(fields) + "\n}"
+            self.requests += 1
+            data = (self.client.graphql(query, variables) or {}).get("data") or {}
+            for i, key in enumerate(chunk):
+                node = data.get(f"n{i}") or {}
+                if key[2] is not None:
+                    node = node.get("issue") or {}
+                self._ids[key] = node.get("id")
+        for op in ops:
+            if op.node_id is None:
+                op.node_id = self._ids.get((op.owner, op.repo, op.number))
+            if op.node_id is None:
+                op._fail("Could not resolve " + (f"issue #{op.number}" if op.number else "repository"))
+
+    def _send(self, ops: List[Operation]):
+        declarations, fields, variables = [], [], {}
+        aliases: List[Tuple[Operation, str, str]] = []
+        for op in ops:
+            for mutation, values, id_field in op.steps:
+                alias = f"m{len(aliases)}"
+                input_type, selection = MUTATIONS[mutation]
+                declarations.append(f"${alias}: {input_type}!")
+                fields.append(f"{alias}: {mutation}(input: ${alias}) {{ {selection} }}")
+                variables[alias] = dict(values, **{id_field: op.node_id})
+                aliases.append((op, alias, mutation))
+        query = f"mutation({', '.join(declarations)}) {{\n  " + "\n  ".join(fields) + "\n}"
+        self.requests += 1
+        result = self.client.graphql(query, variables, cost=MUTATION_COST * len(aliases))
+        if result is None:
+            for op in ops:
+                op._fail("GraphQL request failed")
+            return
+        data = result.get("data") or {}
+        errors: Dict[str, str] = {}
+        for error in result.get("errors") or []:
+            path = error.get("path") or [None]
+            errors.setdefault(path[0], error.get("message", "error"))
+        for op, alias, mutation in aliases:
+            payload = data.get(alias)
+            if alias in errors or payload is None:
+                op._fail(errors.get(alias) or errors.get(None) or f"{mutation} failed")
+            elif mutation == "updateTopics" and payload.get("invalidTopicNames"):
+                op._fail("Invalid topics: " + ", ".join(payload["invalidTopicNames"]))
+        # Cached reads of the touched repos are stale now
+        for owner, repo in {(op.owner, op.repo) for op in ops}:
+            self.client.invalidate(f"/repos/{owner}/{repo}")
@@ -0,0 +1,177 @@
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from caretaker.core.github_client import GitHubAPIError
+from caretaker.core.rate_limit import INTERACTIVE_BUDGET, resource_for
+from caretaker.core.runner import run_plugins, topological_order
+
+# Routes as RequestMetrics names them, so estimates line up with api_profile()
+REPOS_GRAPHQL = "POST /graphql"
+ISSUES = "GET /repos/{o}/{r}/issues"
+COMMITS = "GET /repos/{o}/{r}/commits"
+TREES = "GET /repos/{o}/{r}/git/trees/{ref}"
+
+def pages(items: int, per_page: int = 100) -> int:
+    return max(1, -(-items // per_page))
+
+class Estimate:
+    """Predicted GitHub requests per route for one plugin run.
+
+    The ``mirror_*`` helpers charge what reading a mirror scope will cost:
+    nothing while it is fresh, one delta page once it has been synced
+    before, and the full listing (sized from the inventory's counts) the
+    first time. Commit histories are charged up to their ``limit``; trees
+    nothing while the repo has not been pushed to since they were listed.
+    """
+
+    def __init__(self):
+        self.routes: Counter = Counter()
+
+    def add(self, route: str, requests: int = 1) -> "Estimate":
+        if requests:
+            self.routes[route] += requests
+        return self
+
+    @property
+    def total(self) -> int:
+        return sum(self.routes.values())
+
+    def by_resource(self) -> Dict[str, int]:
+        out: Counter = Counter()
+        for route, n in self.routes.items():
+            out[resource_for(route.split(" ", 1)[1])] += n
+        return dict(out)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"requests": dict(self.routes), "total": self.total, "by_resource": self.by_resource()}
+
+    def mirror_repos(self, ctx) -> "Estimate":
+        if ctx.store.is_stale(ctx.owner, "repos"):
+            known = ctx.store.query("SELECT COUNT(*) AS n FROM repos WHERE owner = ?", (ctx.owner,))[0]["n"]
+            self.add(REPOS_GRAPHQL, pages(known))
+        return self
+
+    def mirror_issues(self, ctx, repo: Dict[str, Any]) -> "Estimate":
+        scope = f"issues:{repo['name']}"
+        if ctx.store.is_stale(ctx.owner, scope):
+            if ctx.store.synced_at(ctx.owner, scope) is not None:
+                self.add(ISSUES)
+            else:
+                # Closed issues are not counted anywhere cheap, so a first sync may take more pages
+                count = repo.get("open_issues_count") or (repo.get("open_issues", 0) + repo.get("open_pull_requests", 0))
+                self.add(ISSUES, pages(count))
+        return self
+
+    def mirror_commits(self, ctx, repo: Dict[str, Any], limit: int) -> "Estimate":
+        scope = f"commits:{repo['name']}"
+        if ctx.store.is_stale(ctx.owner, scope):
+            self.add(COMMITS, 1 if ctx.store.synced_at(ctx.owner, scope) is not None else pages(limit))
+        return self
+
+    def mirror_files(self, ctx, repo: Dict[str, Any]) -> "Estimate":
+        if ctx.store.is_stale(ctx.owner, f"files:{repo['name']}") and not ctx.store.files_unchanged(ctx.owner, repo["name"]):
+            self.add(TREES)
+        return self
+
+def plan_run(ctx, plugins: List[Any], budget: Optional[Dict[str, Dict[str, int]]] = None,
+             reserve: float = INTERACTIVE_BUDGET) -> Dict[str, Any]:
+    """Estimate ``plugins`` against the live budget and split them into reset windows.
+
+    Background requests leave ``reserve`` of each budget to interactive
+    ones, so a window holds what fits in the rest. The first window starts
+    from what is left now; later ones start from a full budget after a
+    reset. A plugin needing more than a full window cannot be split and is
+    refused. The live budget is only looked up when the plugins will make
+    API calls; if GitHub can't be reached, they run unplanned.
+    """
+    # Dependencies first, so a plugin never lands in an earlier window than its inputs
+    estimates = {p.name: p.estimate(ctx) for p in topological_order(plugins)}
+    total = Estimate()
+    for estimate in estimates.values():
+        total.routes.update(estimate.routes)
+    if budget is None:
+        budget = {}
+        if total.total:
+            try:
+                budget = ctx.client.rate_limit()
+            except (requests.RequestException, GitHubAPIError) as e:
+                print(f"⚠️  Could not read the rate limit ({e}); running without a budget plan")
+    windows: List[List[str]] = [[]]
+    used: Counter = Counter()
+    refused: List[Dict[str, Any]] = []
+
+    def capacity(resource: str, first: bool) -> float:
+        info = budget.get(resource)
+        if not info:
+            return float("inf")
+        usable = info["limit"] * (1 - reserve)
+        return info["remaining"] - info["limit"] * reserve if first else usable
+
+    for name, estimate in estimates.items():
+        needs = estimate.by_resource()
+        too_big = {r: n for r, n in needs.items() if n > capacity(r, first=False)}
+        if too_big:
+            refused.append({"plugin": name, "needs": needs,
+                            "window": {r: int(capacity(r, first=False)) for r in too_big}})
+            continue
+        first = len(windows) == 1
+        if any(used[r] + n > capacity(r, first) for r, n in needs.items()):
+            windows.append([])
+            used = Counter()
+        windows[-1].append(name)
+        used.update(needs)
+
+    return {
+        "plugins": {name: e.to_dict() for name, e in estimates.items()},
+        "total": total.to_dict(),
+        "budget": {r: {k: info.get(k) for k in ("limit", "remaining", "reset")} for r, info in budget.items()},
+        "windows": windows,
+        "refused": refused,
+        "reserve": reserve,
+        "fits_now": not refused and len(windows) == 1,
+    }
+
+def format_plan(plan: Dict[str, Any]) -> List[str]:
+    """Human-readable lines for a plan, as the CLI prints it."""
+    lines = []
+    for name, estimate in plan["plugins"].items():
+        routes = ", ".join(f"{route} x{n}" for route, n in sorted(estimate["requests"].items())) or "no API calls"
+        lines.append(f"{name}: ~{estimate['total']} requests ({routes})")
+    for resource, info in sorted(plan["budget"].items()):
+        if resource in plan["total"]["by_resource"]:
+            lines.append(f"{resource}: need ~{plan['total']['by_resource'][resource]}, "
+                         f"{info['remaining']}/{info['limit']} left, resets {time.strftime('%H:%M:%S', time.localtime(info['reset']))}")
+    for entry in plan["refused"]:
+        lines.append(f"refused {entry['plugin']}: needs {entry['needs']}, one reset window allows {entry['window']}")
+    if len(plan["windows"]) > 1:
+        lines.append("split across reset windows: " + " | ".join(", ".join(w) or "(wait)" for w in plan["windows"]))
+    return lines
+
+def run_plan(ctx, plan: Dict[str, Any], plugins: List[Any], sleep: Callable[[float], None] = time.sleep,
+             clock: Callable[[], float] = time.time, timings: Optional[Dict[str, Dict[str, Any]]] = None,
+             resume: bool = False) -> Dict[str, Any]:
+    """Run the planned plugins window by window, sleeping until the budget resets in between.
+
+    Each window is one ``run_plugins`` sweep, so its plugins share prefetched
+    data and run in parallel as their dependencies allow. ``resume`` is
+    passed to each sweep.
+    """
+    by_name = {p.name: p for p in plugins}
+    results: Dict[str, Any] = {}
+    for i, window in enumerate(plan["windows"]):
+        if i:
+            budget = ctx.client.rate_limit()
+            needed: Counter = Counter()
+            for name in window:
+                needed.update(plan["plugins"][name]["by_resource"])
+            short = [r for r, n in needed.items()
+                     if r in budget and budget[r]["remaining"] - budget[r]["limit"] * plan["reserve"] < n]
+            wait = max([budget[r]["reset"] - clock() for r in short] + [0.0])
+            if wait:
+                print(f"⏳ Waiting {wait:.0f}s for the rate limit to reset before running {', '.join(window)}")
+                sleep(wait)
+        results.update(run_plugins(ctx, [by_name[name] for name in window], timings, resume=resume))
+    return results
@@ -0,0 +1,223 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, Mapping, Optional
+
+from caretaker.core.lanes import BULK_WRITE, INTERACTIVE, SCHEDULED
+
+# Policy for the process-wide governors: slots and budget share kept back for interactive requests,
+# and bulk writes made one at a time as GitHub asks for content-creating requests.
+INTERACTIVE_SLOTS = 4
+INTERACTIVE_BUDGET = 0.1
+BULK_WRITE_SLOTS = 1
+
+class _Budget:
+    __slots__ = ("limit", "remaining", "reset_at")
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.remaining = limit
+        self.reset_at = 0.0
+
+class RateLimitGovernor:
+    """Thread-safe pacing for every request made with one token.
+
+    Tracks the primary hourly budget per resource (``core``, ``graphql``,
+    ``search``) from ``X-RateLimit-*`` headers, a per-minute token bucket for
+    GitHub's secondary limit, and a cap on concurrent requests. Once a
+    budget falls below ``pace_below`` of its limit, requests are spread
+    evenly over the time left until reset instead of running into the wall.
+    ``Retry-After`` and secondary-limit rejections block all callers.
+
+    Requests run in lanes (see ``caretaker.core.lanes``). Interactive
+    requests go first, skip pacing and may use ``reserved_slots`` and the
+    last ``reserve_budget`` share of each budget, which background lanes
+    leave alone; scheduled requests go before bulk writes, which are capped
+    at ``bulk_write_slots`` in flight.
+    """
+
+    def __init__(self, limit: int = 5000, per_minute: int = 900, max_concurrent: int = 20,
+                 pace_below: float = 0.2, clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep, reserved_slots: int = 0,
+                 reserve_budget: float = 0.0, bulk_write_slots: Optional[int] = None):
+        self.default_limit = limit
+        self.per_minute = per_minute
+        self.pace_below = pace_below
+        self.max_concurrent = max_concurrent
+        self.reserved_slots = min(reserved_slots, max_concurrent - 1)
+        self.reserve_budget = reserve_budget
+        self.bulk_write_slots = bulk_write_slots
+        self.clock = clock
+        self.sleep = sleep
+        self.waited = 0.0
+        self._budgets: Dict[str, _Budget] = {}
+        self._minute_tokens = float(per_minute)
+        self._refilled_at = clock()
+        self._next_slot = 0.0
+        self._blocked_until = 0.0
+        self._strikes = 0
+        self._lock = threading.Lock()
+        self._active: Counter = Counter()
+        self._waiting: Counter = Counter()
+        self._turn = threading.Condition()
+
+    def _budget(self, resource: str) -> _Budget:
+        if resource not in self._budgets:
+            self._budgets[resource] = _Budget(self.default_limit)
+        return self._budgets[resource]
+
+    def _refill(self, now: float):
+        rate = self.per_minute / 60.0
+        self._minute_tokens = min(float(self.per_minute), self._minute_tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+
+    def _interval(self, budget: _Budget, now: float, reserve: float = 0.0) -> float:
+        window = budget.reset_at - now
+        available = budget.remaining - reserve
+        if window <= 0 or available > (budget.limit - reserve) * self.pace_below:
+            return 0.0
+        if available <= 0:
+            return window
+        return window / available
+
+    def _wait_time(self, budget: _Budget, cost: int, now: float, lane: str) -> float:
+        if self._blocked_until > now:
+            return self._blocked_until - now
+        interactive = lane == INTERACTIVE
+        reserve = 0.0 if interactive else budget.limit * self.reserve_budget
+        if budget.remaining <= reserve and budget.reset_at > now:
+            return budget.reset_at - now
+        minute_reserve = 0.0 if interactive else self.per_minute * self.reserve_budget
+        if self._minute_tokens - minute_reserve < cost:
+            return (cost + minute_reserve - self._minute_tokens) / (self.per_minute / 60.0)
+        return 0.0 if interactive else max(self._next_slot - now, 0.0)
+
+    def max_cost(self, lane: str = SCHEDULED) -> int:
+        """Largest cost one request in ``lane`` can be charged: the minute bucket less the interactive reserve."""
+        if lane == INTERACTIVE:
+            return self.per_minute
+        return int(self.per_minute * (1 - self.reserve_budget))
+
+    def _may_enter(self, lane: str) -> bool:
+        total = sum(self._active.values())
+        if total >= self.max_concurrent:
+            return False
+        if lane == INTERACTIVE:
+            return True
+        if self._waiting[INTERACTIVE]:
+            return False
+        if total - self._active[INTERACTIVE] >= self.max_concurrent - self.reserved_slots:
+            return False
+        if lane == BULK_WRITE:
+            if self._waiting[SCHEDULED]:
+                return False
+            if self.bulk_write_slots and self._active[BULK_WRITE] >= self.bulk_write_slots:
+                return False
+        return True
+
+    def _enter(self, lane: str):
+        with self._turn:
+            self._waiting[lane] += 1
+            while not self._may_enter(lane):
+                self._turn.wait()
+            self._waiting[lane] -= 1
+            self._active[lane] += 1
+            # Fewer waiters ahead may unblock lower lanes
+            self._turn.notify_all()
+
+    def acquire(self, resource: str = "core", cost: int = 1, lane: str = SCHEDULED) -> float:
+        """Block until a request in ``lane`` may be sent. Returns the seconds spent waiting.
+
+        Raises ValueError for a cost above ``max_cost(lane)``, which the bucket could never cover.
+        """
+        if cost > self.max_cost(lane):
+            raise ValueError(f"Request cost {cost} exceeds the {lane} lane's per-minute budget of {self.max_cost(lane)}")
+        self._enter(lane)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._refill(now)
+                budget = self._budget(resource)
+                wait = self._wait_time(budget, cost, now, lane)
+                if wait <= 0:
+                    self._minute_tokens -= cost
+                    if budget.reset_at > now:
+                        budget.remaining -= 1
+                    if lane != INTERACTIVE:
+                        reserve = budget.limit * self.reserve_budget
+                        self._next_slot = max(now, self._next_slot) + self._interval(budget, now, reserve)
+                    self.waited += waited
+                    return waited
+            self.sleep(wait)
+            waited += wait
+
+    def release(self, lane: str = SCHEDULED):
+        with self._turn:
+            self._active[lane] -= 1
+            self._turn.notify_all()
+
+    def observe(self, status_code: int, headers: Mapping[str, str], body: str = "") -> bool:
+        """Update budgets from response headers. Returns True if the request was throttled."""
+        with self._lock:
+            now = self.clock()
+            resource = headers.get("X-RateLimit-Resource", "core")
+            budget = self._budget(resource)
+            if "X-RateLimit-Remaining" in headers:
+                budget.limit = int(headers.get("X-RateLimit-Limit", budget.limit))
+                budget.remaining = int(headers["X-RateLimit-Remaining"])
+                budget.reset_at = float(headers.get("X-RateLimit-Reset", 0))
+
+            throttled = status_code == 429 or (status_code == 403 and (
+                "Retry-After" in headers or budget.remaining <= 0 or "rate limit" in body.lower()))
+            if not throttled:
+                self._strikes = 0
+                return False
+
+            retry_after = headers.get("Retry-After")
+            if retry_after is not None:
+                until = now + float(retry_after)
+            elif budget.remaining <= 0 and budget.reset_at > now:
+                until = budget.reset_at
+            else:
+                # Secondary limit without guidance: wait at least a minute, doubling on repeats.
+                until = now + 60 * (2 ** min(self._strikes, 4))
+                self._strikes += 1
+            self._blocked_until = max(self._blocked_until, until)
+            return True
+
+    def headroom(self, resource: str = "core") -> float:
+        """Requests left in the current window; -1 while blocked. Unknown windows count as full."""
+        with self._lock:
+            now = self.clock()
+            if self._blocked_until > now:
+                return -1
+            budget = self._budgets.get(resource)
+            if budget is None or budget.reset_at <= now:
+                return budget.limit if budget else self.default_limit
+            return budget.remaining
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {name: {"limit": b.limit, "remaining": b.remaining, "reset": b.reset_at}
+                    for name, b in self._budgets.items()}
+
+_GOVERNORS: Dict[str, RateLimitGovernor] = {}
+_GOVERNORS_LOCK = threading.Lock()
+
+def get_governor(token: Optional[str]) -> RateLimitGovernor:
+    """Process-wide governor for a token, shared by every client using it."""
+    key = hashlib.sha256((token or "").encode("utf-8")).hexdigest()
+    with _GOVERNORS_LOCK:
+        if key not in _GOVERNORS:
+            _GOVERNORS[key] = RateLimitGovernor(reserved_slots=INTERACTIVE_SLOTS, reserve_budget=INTERACTIVE_BUDGET,
+                                                bulk_write_slots=BULK_WRITE_SLOTS)
+        return _GOVERNORS[key]
+
+def resource_for(path: str) -> str:
+    if path.startswith("/graphql"):
+        return "graphql"
+    if path.startswith("/search"):
+        return "search"
+    return "core"
@@ -0,0 +1,93 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Optional, Tuple
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _login(value: Any) -> Optional[str]:
+    # REST nests users as objects with ~20 URL fields; only the login is kept
+    if isinstance(value, dict):
+        value = value.get("login")
+    return _intern(value)
+
+def _names(values: Any) -> list:
+    return [_intern(v.get("name") if isinstance(v, dict) else v) for v in values or []]
+
+class Record(Mapping):
+    """Compact, read-only view of an API object that keeps only ``FIELDS``.
+
+    Fields read as attributes (``r.name``) or like the raw dict
+    (``r["name"]``, ``r.get("name")``), so plugins and templates written
+    against REST payloads keep working. Repeated strings are interned.
+    """
+
+    __slots__ = ()
+    FIELDS: Tuple[str, ...] = ()
+    INTERNED: FrozenSet[str] = frozenset()
+    CONVERT: Dict[str, Callable[[Any], Any]] = {}
+    _KEYS: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._KEYS = frozenset(cls.FIELDS)
+
+    def __init__(self, data: Dict[str, Any]):
+        for field in self.FIELDS:
+            value = data.get(field)
+            convert = self.CONVERT.get(field)
+            if convert:
+                value = convert(value)
+            elif field in self.INTERNED:
+                value = _intern(value)
+            setattr(self, field, value)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in self._KEYS else None
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self) -> str:
+        ident = getattr(self, "full_name", None) or getattr(self, "name", None) or getattr(self, "number", None)
+        return f"{type(self).__name__}({ident!r})"
+
+class RepoRecord(Record):
+    FIELDS = (
+        "id", "node_id", "name", "full_name", "owner", "description", "html_url", "homepage",
+        "private", "visibility", "archived", "fork", "disabled", "created_at", "updated_at", "pushed_at",
+        "size", "stargazers_count", "forks_count", "open_issues_count", "language", "default_branch",
+        "topics", "has_pages", "has_issues",
+        # Only filled by repo_inventory
+        "last_commit_at", "languages", "open_issues", "open_pull_requests",
+    )
+    __slots__ = FIELDS
+    INTERNED = frozenset({"visibility", "language", "default_branch"})
+    CONVERT = {"owner": _login, "topics": _names}
+
+class IssueRecord(Record):
+    FIELDS = (
+        "id", "node_id", "number", "title", "body", "state", "user", "labels", "comments",
+        "created_at", "updated_at", "closed_at", "html_url", "pull_request",
+    )
+    __slots__ = FIELDS
+    INTERNED = frozenset({"state"})
+    CONVERT = {"user": _login, "labels": _names, "pull_request": lambda v: True if v else None}
+
+def json_default(obj: Any) -> Any:
+    """``default=`` hook for json.dump so reports can hold records directly."""
+    if isinstance(obj, Record):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,104 @@
+import hashlib
+import json
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+class Cassette:
+    """Recorded HTTP interactions keyed by method, path, query and body.
+
+    Keys ignore the host, so a cassette recorded against api.github.com
+    replays against any ``base_url``. Repeated requests replay their
+    recorded responses in order, then keep returning the last one.
+    """
+
+    def __init__(self, interactions: Optional[Dict[str, List[Dict[str, Any]]]] = None):
+        self.interactions: Dict[str, List[Dict[str, Any]]] = defaultdict(list, interactions or {})
+        self._cursor: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(request: requests.PreparedRequest) -> str:
+        parts = urlsplit(request.url)
+        query = urlencode(sorted(parse_qsl(parts.query)))
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:16] if body else "-"
+        return f"{request.method} {parts.path}?{query} {digest}"
+
+    def record(self, request: requests.PreparedRequest, resp: requests.Response):
+        entry = {
+            "status": resp.status_code,
+            "headers": {k: v for k, v in resp.headers.items() if k.lower() not in ("set-cookie", "content-encoding", "transfer-encoding")},
+            "body": resp.content.decode("utf-8", errors="replace"),
+        }
+        with self._lock:
+            self.interactions[self.key(request)].append(entry)
+
+    def play(self, request: requests.PreparedRequest) -> Optional[Dict[str, Any]]:
+        key = self.key(request)
+        with self._lock:
+            entries = self.interactions.get(key)
+            if not entries:
+                return None
+            index = min(self._cursor[key], len(entries) - 1)
+            self._cursor[key] += 1
+            return entries[index]
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def save(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.interactions, f, indent=1, sort_keys=True)
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport that performs real requests and records them into a cassette."""
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        resp = super().send(request, **kwargs)
+        self.cassette.record(request, resp)
+        return resp
+
+class ReplayAdapter(BaseAdapter):
+    """Transport that answers only from a cassette, never touching the network."""
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        entry = self.cassette.play(request)
+        if entry is None:
+            raise requests.ConnectionError(f"No recorded response for {Cassette.key(request)}", request=request)
+        resp = requests.Response()
+        resp.status_code = entry["status"]
+        resp.headers = CaseInsensitiveDict(entry["headers"])
+        resp._content = entry["body"].encode("utf-8")
+        resp.encoding = "utf-8"
+        resp.url = request.url
+        resp.request = request
+        resp.reason = "Replayed"
+        return resp
+
+    def close(self):
+        pass
+
+def use_cassette(session: requests.Session, cassette: Cassette, mode: str = "replay") -> Cassette:
+    """Mount a record or replay transport on ``session`` (e.g. ``client.session``)."""
+    adapter = RecordingAdapter(cassette) if mode == "record" else ReplayAdapter(cassette)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return cassette
@@ -1,12 +1,18 @@
 import json
 import os
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-def write_json(report_dir: str, name: str, data: Dict[str, Any]) -> str:
+from caretaker.core.records import json_default
+
+def write_json(report_dir: str, name: str, data: Dict[str, Any], api: Optional[Dict[str, Any]] = None) -> str:
+    """Write a report; ``api`` is the request/latency profile of the run that produced it."""
     os.makedirs(report_dir, exist_ok=True)
     path = os.path.join(report_dir, f"{name}.json")
+    report: Dict[str, Any] = {"generated_at": datetime.utcnow().isoformat() + "Z", "data": data}
+    if api is not None:
+        report["api"] = api
     with open(path, "w", encoding="utf-8") as f:
-        json.dump({"generated_at": datetime.utcnow().isoformat() + "Z", "data": data}, f, indent=2)
+        json.dump(report, f, indent=2, default=json_default)
     return path
 
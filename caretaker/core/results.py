@@ -0,0 +1,72 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+# Repo fields whose change means a plugin's per-repo result may have changed
+FINGERPRINT_FIELDS: Tuple[str, ...] = ("pushed_at", "updated_at")
+
+def fingerprint(repo: Dict[str, Any], plugin: Any, params: Optional[Dict[str, Any]] = None, extra: Any = None) -> str:
+    """Hash of what a plugin's result for ``repo`` depends on.
+
+    Covers the repo's push/update timestamps, the plugin's ``version`` and
+    ``params``, plus any ``extra`` state the plugin reads that those
+    timestamps don't move with (e.g. its issues).
+    """
+    material = {
+        "repo": {field: repo.get(field) for field in FINGERPRINT_FIELDS},
+        "plugin": [plugin.name, plugin.version],
+        "params": params or {},
+        "extra": extra,
+    }
+    return hashlib.sha1(json.dumps(material, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+class ResultCache:
+    """Last per-repo result of each plugin, keyed by repo name with its fingerprint.
+
+    With ``results_dir`` each ``(owner, plugin)`` is a JSON file that
+    survives restarts; without it results live in memory.
+    """
+
+    def __init__(self, results_dir: Optional[str] = None):
+        self.results_dir = results_dir
+        self._memory: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, owner: str, plugin: str) -> str:
+        return os.path.join(self.results_dir, owner, f"{plugin}.json")
+
+    def load(self, owner: str, plugin: str) -> Dict[str, Dict[str, Any]]:
+        """``{repo: {"fingerprint", "value"}}``; empty when the plugin never ran for ``owner``."""
+        if self.results_dir is None:
+            with self._lock:
+                return dict(self._memory.get((owner, plugin)) or {})
+        try:
+            with open(self._path(owner, plugin), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, owner: str, plugin: str, entries: Dict[str, Dict[str, Any]]):
+        if self.results_dir is None:
+            with self._lock:
+                self._memory[(owner, plugin)] = dict(entries)
+            return
+        path = self._path(owner, plugin)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(entries, f, default=str)
+        os.replace(tmp, path)
+
+    def forget(self, owner: str, plugin: str):
+        """Drop a plugin's results so its next run recomputes every repo."""
+        if self.results_dir is None:
+            with self._lock:
+                self._memory.pop((owner, plugin), None)
+            return
+        try:
+            os.remove(self._path(owner, plugin))
+        except OSError:
+            pass
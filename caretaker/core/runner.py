@@ -0,0 +1,173 @@
+import contextvars
+import multiprocessing
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from caretaker.core.github_client import GitHubAPIError
+
+# Per-repo datasets a plugin may declare in ``needs``, read through the mirror
+REPO_DATASETS: Dict[str, Callable[[Any, str], Any]] = {
+    "issues": lambda ctx, name: ctx.store.issues(ctx.owner, name),
+    "files": lambda ctx, name: ctx.store.files(ctx.owner, name),
+}
+# The repo inventory carries default branches, so "default_branches" is served by "repos"
+DATASETS = {"repos", "default_branches"} | set(REPO_DATASETS)
+
+def union_needs(plugins: Iterable[Any]) -> Set[str]:
+    needs: Set[str] = set()
+    for p in plugins:
+        unknown = set(p.needs) - DATASETS
+        if unknown:
+            raise ValueError(f"Plugin {p.name} needs unknown datasets: {sorted(unknown)}")
+        needs.update(p.needs)
+    return needs
+
+def prefetch(ctx, needs: Set[str]) -> Dict[str, int]:
+    """Sync each needed dataset into the mirror once, fanning per-repo syncs out with ``ctx.map_repos``.
+
+    Returns how many repos each dataset was fetched for. Repos that cannot
+    be read (e.g. empty ones) are skipped; plugins see them as they would
+    without a prefetch.
+    """
+    if not needs:
+        return {}
+    repos = ctx.repos()
+    counts = {"repos": len(repos)}
+    jobs = [(dataset, r["name"]) for dataset in sorted(needs & set(REPO_DATASETS)) for r in repos]
+    for outcome in ctx.map_repos(lambda job: REPO_DATASETS[job[0]](ctx, job[1]), jobs, ordered=False):
+        dataset, name = outcome.item
+        if isinstance(outcome.error, GitHubAPIError):
+            print(f"Prefetch of {dataset} for {name} skipped: {outcome.error}")
+        elif outcome.error:
+            raise outcome.error
+        else:
+            counts[dataset] = counts.get(dataset, 0) + 1
+    return counts
+
+def topological_order(plugins: List[Any]) -> List[Any]:
+    """``plugins`` ordered so each comes after the plugins it ``depends_on``; raises ValueError on a cycle."""
+    by_name = {p.name: p for p in plugins}
+    ordered: List[Any] = []
+    state: Dict[str, str] = {}
+
+    def visit(p, path):
+        if state.get(p.name) == "done":
+            return
+        if state.get(p.name) == "visiting":
+            raise ValueError(f"Plugin dependency cycle: {' -> '.join(path + [p.name])}")
+        state[p.name] = "visiting"
+        for dep in p.depends_on:
+            if dep in by_name:
+                visit(by_name[dep], path + [p.name])
+        state[p.name] = "done"
+        ordered.append(p)
+
+    for p in plugins:
+        visit(p, [])
+    return ordered
+
+def _run_in_process(plugin_cls, owner: str, inputs: Dict[str, Any]) -> Any:
+    # CPU-bound plugins get a context without a client: they work on local data and upstream results
+    from caretaker.core.context import CareContext
+    ctx = CareContext(owner, None)
+    ctx.results.update(inputs)
+    return plugin_cls().run(ctx)
+
+def run_dag(ctx, plugins: List[Any], timings: Optional[Dict[str, Dict[str, Any]]] = None,
+            max_processes: Optional[int] = None) -> Dict[str, Any]:
+    """Run ``plugins`` as soon as the plugins they ``depends_on`` have finished.
+
+    ``io`` plugins share a thread pool of ``ctx.max_concurrency`` workers;
+    ``cpu`` plugins run in worker processes so they don't hold the GIL
+    against API-bound ones. Each result lands in ``ctx.results`` before its
+    dependents start, so a sweep takes as long as its critical path. A
+    plugin that raises reports ``{"plugin", "error"}`` and its dependents
+    are skipped. ``timings`` is filled with start offset, duration and kind
+    per plugin. On an interruption (Ctrl-C) ``ctx.cancel`` is set, so
+    running plugins start no further repos, and queued plugins are dropped.
+    """
+    order = topological_order(plugins)
+    names = {p.name for p in order}
+    timings = {} if timings is None else timings
+    results: Dict[str, Any] = {}
+    failed: Set[str] = set()
+    waiting = list(order)
+    running: Dict[Future, Any] = {}
+    started_at = time.monotonic()
+    ctx.cancel.clear()
+    threads = ThreadPoolExecutor(max_workers=ctx.max_concurrency)
+    processes = None
+    if any(p.kind == "cpu" for p in order):
+        # Spawned, not forked: the parent has request and pool threads running
+        processes = ProcessPoolExecutor(max_workers=max_processes, mp_context=multiprocessing.get_context("spawn"))
+
+    def finish(p, result, error: Optional[str] = None):
+        if error:
+            failed.add(p.name)
+            result = {"plugin": p.name, "error": error}
+        elif ctx.journal is not None:
+            # Completed: nothing left to resume
+            ctx.journal.clear(ctx.owner, p.name)
+        results[p.name] = result
+        ctx.results[p.name] = result
+
+    try:
+        while waiting or running:
+            for p in list(waiting):
+                # Dependencies outside this sweep must have run earlier (e.g. in a previous reset window)
+                in_sweep = [d for d in p.depends_on if d in names]
+                broken = [d for d in in_sweep if d in failed] + [d for d in p.depends_on if d not in names and d not in ctx.results]
+                if broken:
+                    waiting.remove(p)
+                    finish(p, None, f"skipped: dependency {', '.join(broken)} failed or did not run")
+                    print(f"Plugin {p.name} {results[p.name]['error']}")
+                    continue
+                if any(d not in results for d in in_sweep):
+                    continue
+                waiting.remove(p)
+                timings[p.name] = {"kind": p.kind, "start": round(time.monotonic() - started_at, 4)}
+                if p.kind == "cpu":
+                    inputs = {d: ctx.results[d] for d in p.depends_on}
+                    future = processes.submit(_run_in_process, type(p), ctx.owner, inputs)
+                else:
+                    future = threads.submit(contextvars.copy_context().run, p.run, ctx)
+                running[future] = p
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                p = running.pop(future)
+                timings[p.name]["seconds"] = round(time.monotonic() - started_at - timings[p.name]["start"], 4)
+                try:
+                    finish(p, future.result())
+                except Exception as e:
+                    print(f"Plugin {p.name} failed: {e}")
+                    finish(p, None, str(e))
+    except BaseException:
+        ctx.cancel.set()
+        raise
+    finally:
+        # Everything has finished unless we are unwinding; then don't wait for work that is being abandoned
+        threads.shutdown(wait=False, cancel_futures=True)
+        if processes:
+            processes.shutdown(wait=False, cancel_futures=True)
+    return {p.name: results[p.name] for p in plugins}
+
+def run_plugins(ctx, plugins: List[Any], timings: Optional[Dict[str, Dict[str, Any]]] = None,
+                resume: bool = False) -> Dict[str, Any]:
+    """Run ``plugins`` as one sweep: shared datasets are fetched once up front, then the DAG runs.
+
+    The mirror is pinned for the sweep, so the union of the plugins' needs is
+    read from GitHub once instead of once per plugin. Plugins checkpoint
+    their per-repo progress to ``ctx.journal``; with ``resume`` they pick up
+    the checkpoints an interrupted sweep left instead of starting over.
+    """
+    previous = ctx.checkpoint, ctx.resume
+    ctx.checkpoint, ctx.resume = True, resume or previous[1]
+    try:
+        with ctx.store.pinned():
+            prefetch(ctx, union_needs(plugins))
+            return run_dag(ctx, plugins, timings)
+    finally:
+        ctx.checkpoint, ctx.resume = previous
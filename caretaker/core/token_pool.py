@@ -0,0 +1,41 @@
+from typing import Dict, List, Optional
+
+from caretaker.core.rate_limit import RateLimitGovernor, get_governor
+
+class TokenPool:
+    """A set of tokens whose combined rate budget GitHubClient draws on.
+
+    Reads go to the token with the most headroom left for the resource being
+    called; writes are pinned to ``write_token`` so every change is made by
+    one identity. Each token keeps its own shared governor.
+    """
+
+    def __init__(self, tokens: List[str], write_token: Optional[str] = None):
+        self.tokens: List[str] = []
+        for token in list(tokens) + ([write_token] if write_token else []):
+            if token and token not in self.tokens:
+                self.tokens.append(token)
+        if not self.tokens:
+            raise ValueError("TokenPool needs at least one token")
+        self.write_token = write_token or self.tokens[0]
+        self._governors: Dict[str, RateLimitGovernor] = {t: get_governor(t) for t in self.tokens}
+
+    def governor(self, token: str) -> RateLimitGovernor:
+        return self._governors[token]
+
+    def select(self, write: bool, resource: str = "core") -> str:
+        if write:
+            return self.write_token
+        return max(self.tokens, key=lambda t: self._governors[t].headroom(resource))
+
+    def label(self, token: str) -> str:
+        """Report-safe name: position in the pool, ``w`` for the write token, last four characters."""
+        tail = token[-4:] if len(token) > 8 else "***"
+        role = "w" if token == self.write_token else "r"
+        return f"{self.tokens.index(token)}{role}...{tail}"
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        return {self.label(t): self._governors[t].snapshot() for t in self.tokens}
+
+    def __len__(self) -> int:
+        return len(self.tokens)
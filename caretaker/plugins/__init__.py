@@ -1,51 +1,166 @@
+import ast
 import importlib
+import json
 import os
-import inspect
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Dict, Iterator, List, Optional, Tuple, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from caretaker.core.context import CareContext
+    from caretaker.core.planner import Estimate
 
 class Plugin:
     name: str = "plugin"
+    # Shared datasets the runner prefetches once per sweep (see caretaker.core.runner.DATASETS)
+    needs: Tuple[str, ...] = ()
+    # Plugins whose results (ctx.results[name]) this one reads; they run first
+    depends_on: Tuple[str, ...] = ()
+    # "io" plugins run on threads, "cpu" ones in worker processes without a GitHub client
+    kind: str = "io"
+    # Bump when run() changes what it reports, so per-repo results cached by ctx.map_changed_repos are recomputed
+    version: str = "1"
     def run(self, ctx: 'CareContext') -> Dict:
         return {}
 
-# Registry of available plugins mapping name -> class
-PLUGIN_REGISTRY = {}
-
-def _discover_plugins():
-    """Scans the plugins directory and populates the registry"""
-    plugins_dir = os.path.dirname(__file__)
-    print(f"DEBUG: Scanning plugins in {plugins_dir}")
-    
-    for filename in os.listdir(plugins_dir):
-        if filename.endswith(".py") and not filename.startswith("__"):
-            module_name = f"caretaker.plugins.{filename[:-3]}"
-            try:
-                module = importlib.import_module(module_name)
-                
-                # Check for 'register' function (User Requirement)
-                if hasattr(module, 'register'):
-                    try:
-                        # Assuming register returns a Plugin instance or class
-                        # But for now, let's stick to finding the class to be safe with existing code
-                        pass 
-                    except Exception:
-                        pass
-                
-                # Fallback: Look for Plugin subclasses
-                for name, obj in inspect.getmembers(module):
-                    if inspect.isclass(obj) and issubclass(obj, Plugin) and obj is not Plugin:
-                        # Use the class's 'name' attribute if available, else filename
-                        plugin_name = getattr(obj, 'name', filename[:-3])
-                        PLUGIN_REGISTRY[plugin_name] = obj
-                        print(f"DEBUG: Registered plugin {plugin_name} from {module_name}")
-            except Exception as e:
-                print(f"Error loading plugin {module_name}: {e}")
-
-# Initial discovery
-_discover_plugins()
+    def stream(self, ctx: 'CareContext') -> Iterator[Dict]:
+        """Yield result records as they are produced.
+
+        Per-repo plugins override this to yield one record per repo and build
+        ``run`` from it; by default the whole ``run`` result is one record.
+        """
+        yield self.run(ctx)
+
+    def estimate(self, ctx: 'CareContext') -> 'Estimate':
+        """Requests ``run`` is expected to make, for dry runs and budget planning."""
+        from caretaker.core.planner import Estimate
+        return Estimate()
+
+PLUGIN_DIR = os.path.dirname(__file__)
+INDEX_PATH = os.path.join(PLUGIN_DIR, "__pycache__", "plugin_index.json")
+
+def _scan(path: str) -> List[Dict]:
+    """Classes defined in a plugin file, read from its AST without importing it."""
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), filename=path)
+    classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [b.id if isinstance(b, ast.Name) else b.attr for b in node.bases if isinstance(b, (ast.Name, ast.Attribute))]
+        name = None
+        for stmt in node.body:
+            targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target] if isinstance(stmt, ast.AnnAssign) else []
+            value = getattr(stmt, "value", None)
+            if any(isinstance(t, ast.Name) and t.id == "name" for t in targets) and isinstance(value, ast.Constant):
+                name = value.value
+        classes.append({"class": node.name, "bases": bases, "name": name})
+    return classes
+
+class PluginRegistry:
+    """Maps plugin name -> class, importing a plugin's module only when it is asked for.
+
+    The name -> module index comes from parsing the plugin files, cached in
+    ``__pycache__`` and re-read only for files whose mtime or size changed,
+    so listing or picking one plugin never imports the others.
+    """
+
+    def __init__(self, plugin_dir: str = PLUGIN_DIR, index_path: Optional[str] = INDEX_PATH,
+                 package: str = __name__):
+        self.plugin_dir = plugin_dir
+        self.index_path = index_path
+        self.package = package
+        self._index: Optional[Dict[str, Tuple[str, str]]] = None
+        self._classes: Dict[str, Type[Plugin]] = {}
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if not self.index_path:
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, files: Dict[str, Dict]) -> None:
+        if not self.index_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            tmp = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(files, f)
+            os.replace(tmp, self.index_path)
+        except OSError:
+            # A read-only install still works, it just re-parses on each start
+            pass
+
+    def index(self) -> Dict[str, Tuple[str, str]]:
+        """Plugin name -> (module, class name), refreshed from files whose mtime changed."""
+        if self._index is not None:
+            return self._index
+        cached = self._load_cache()
+        files: Dict[str, Dict] = {}
+        for filename in sorted(os.listdir(self.plugin_dir)):
+            if not filename.endswith(".py") or filename.startswith("__"):
+                continue
+            st = os.stat(os.path.join(self.plugin_dir, filename))
+            entry = cached.get(filename)
+            if not entry or entry["mtime_ns"] != st.st_mtime_ns or entry["size"] != st.st_size:
+                try:
+                    classes = _scan(os.path.join(self.plugin_dir, filename))
+                except SyntaxError as e:
+                    print(f"Error indexing plugin {filename}: {e}")
+                    classes = []
+                entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "classes": classes}
+            files[filename] = entry
+        if files != cached:
+            self._save_cache(files)
+
+        # A class is a plugin if it derives from Plugin, directly or through another indexed plugin class
+        plugin_classes = {"Plugin"}
+        changed = True
+        while changed:
+            changed = False
+            for entry in files.values():
+                for c in entry["classes"]:
+                    if c["class"] not in plugin_classes and plugin_classes.intersection(c["bases"]):
+                        plugin_classes.add(c["class"])
+                        changed = True
+        self._index = {}
+        for filename, entry in files.items():
+            for c in entry["classes"]:
+                if c["class"] in plugin_classes:
+                    self._index[c["name"] or filename[:-3]] = (f"{self.package}.{filename[:-3]}", c["class"])
+        return self._index
+
+    def names(self) -> List[str]:
+        return list(self.index())
+
+    def get(self, name: str) -> Optional[Type[Plugin]]:
+        if name in self._classes:
+            return self._classes[name]
+        target = self.index().get(name)
+        if not target:
+            return None
+        module_name, class_name = target
+        try:
+            cls = getattr(importlib.import_module(module_name), class_name)
+        except Exception as e:
+            print(f"Error loading plugin {module_name}: {e}")
+            return None
+        self._classes[name] = cls
+        return cls
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index())
+
+    def __len__(self) -> int:
+        return len(self.index())
+
+# Registry of available plugins mapping name -> class; modules are imported on first lookup
+PLUGIN_REGISTRY = PluginRegistry()
 
 def get_plugin_class(name: str):
     """Returns the plugin class from registry"""
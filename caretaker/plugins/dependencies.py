@@ -1,19 +1,36 @@
-from typing import Dict, List
+from typing import Dict, Iterator
 
 from . import Plugin
 from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubAPIError
+from caretaker.core.planner import Estimate
 
 class DependenciesPlugin(Plugin):
     name = "dependencies"
+    needs = ("repos", "files")
 
-    def run(self, ctx: CareContext) -> Dict:
-        repos = ctx.client.list_user_repos(ctx.owner)
-        alerts: List[Dict] = []
-        for r in repos:
-            default = ctx.client.get_default_branch(ctx.owner, r["name"]) or r.get("default_branch") or "main"
-            has_req = ctx.client.get_repo_file(ctx.owner, r["name"], "requirements.txt", ref=default) is not None
-            has_pkg = ctx.client.get_repo_file(ctx.owner, r["name"], "package.json", ref=default) is not None
-            if has_req or has_pkg:
-                alerts.append({"repo": r["name"], "python": has_req, "node": has_pkg})
-        return {"plugin": self.name, "repos": alerts}
+    def manifests(self, ctx: CareContext, repo: str) -> Dict[str, bool]:
+        # One tree listing per repo (served from the mirror when fresh) instead of a probe per manifest
+        files = ctx.store.files(ctx.owner, repo)
+        return {"python": "requirements.txt" in files, "node": "package.json" in files}
+
+    def estimate(self, ctx: CareContext) -> Estimate:
+        estimate = Estimate().mirror_repos(ctx)
+        for r in ctx.repos():
+            estimate.mirror_files(ctx, r)
+        return estimate
 
+    def stream(self, ctx: CareContext) -> Iterator[Dict]:
+        # Manifests only change with a push, so unchanged repos reuse their last result
+        for outcome in ctx.map_changed_repos(self, lambda r: self.manifests(ctx, r["name"])):
+            if isinstance(outcome.error, GitHubAPIError):
+                # Unreadable tree (e.g. an empty repo): report it rather than list the repo as manifest-free
+                print(f"Dependencies of {outcome.item['name']} skipped: {outcome.error}")
+                continue
+            if outcome.error:
+                raise outcome.error
+            if outcome.value["python"] or outcome.value["node"]:
+                yield {"repo": outcome.item["name"], **outcome.value}
+
+    def run(self, ctx: CareContext) -> Dict:
+        return {"plugin": self.name, "repos": list(self.stream(ctx))}
@@ -3,6 +3,7 @@ from difflib import SequenceMatcher
 
 from . import Plugin
 from caretaker.core.context import CareContext
+from caretaker.core.planner import Estimate
 
 def normalize(name: str) -> str:
     return ''.join(ch.lower() for ch in name if ch.isalnum())
@@ -12,6 +13,7 @@ def similar(a: str, b: str) -> float:
 
 class DuplicatesPlugin(Plugin):
     name = "duplicates"
+    needs = ("repos",)
 
     def group(self, repos: List[Dict]) -> Dict[str, List[Dict]]:
         groups: Dict[str, List[Dict]] = {}
@@ -29,8 +31,11 @@ class DuplicatesPlugin(Plugin):
     def choose_hero(self, group: List[Dict]) -> Dict:
         return sorted(group, key=lambda x: x.get("pushed_at") or x.get("updated_at"), reverse=True)[0]
 
+    def estimate(self, ctx: CareContext) -> Estimate:
+        return Estimate().mirror_repos(ctx)
+
     def run(self, ctx: CareContext) -> Dict:
-        repos = ctx.client.list_user_repos(ctx.owner)
+        repos = ctx.repos()
         groups = self.group(repos)
         actions: List[Dict] = []
         for name, items in groups.items():
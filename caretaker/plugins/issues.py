@@ -1,28 +1,39 @@
-from typing import Dict, List
+from typing import Dict, Iterator
 from datetime import datetime, timedelta
 
 from . import Plugin
 from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubAPIError
+from caretaker.core.planner import Estimate
 
 class IssuesPlugin(Plugin):
     name = "issues"
+    needs = ("repos", "issues")
 
-    def run(self, ctx: CareContext) -> Dict:
-        repos = ctx.client.list_user_repos(ctx.owner)
-        cutoff = datetime.utcnow() - timedelta(days=60)
-        results: List[Dict] = []
-        for r in repos:
-            issues = ctx.client.list_issues(ctx.owner, r["name"], state="open")
-            stale = []
-            for i in issues:
-                updated = i.get("updated_at") or i.get("created_at")
-                try:
-                    dt = datetime.strptime(updated, "%Y-%m-%dT%H:%M:%SZ")
-                except Exception:
-                    continue
-                if dt < cutoff:
-                    stale.append(i)
-            if stale:
-                results.append({"repo": r["name"], "stale_count": len(stale)})
-        return {"plugin": self.name, "repos": results}
+    def stale_count(self, ctx: CareContext, repo: str, cutoff: datetime) -> int:
+        # The mirror holds every issue and pulls only those updated since its last sync
+        stale = ctx.store.issues(ctx.owner, repo, state="open", updated_before=cutoff.strftime("%Y-%m-%dT%H:%M:%SZ"))
+        return len(stale)
+
+    def estimate(self, ctx: CareContext) -> Estimate:
+        estimate = Estimate().mirror_repos(ctx)
+        for r in ctx.repos():
+            estimate.mirror_issues(ctx, r)
+        return estimate
 
+    def stream(self, ctx: CareContext) -> Iterator[Dict]:
+        # Day-aligned, so a repo's count only changes with its issues or the date and can be reused until then
+        cutoff = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=60)
+        outcomes = ctx.map_changed_repos(self, lambda r: self.stale_count(ctx, r["name"], cutoff),
+                                         params={"cutoff": cutoff.strftime("%Y-%m-%d")},
+                                         extra=lambda r: ctx.store.issues_updated_at(ctx.owner, r["name"]))
+        for outcome in outcomes:
+            if isinstance(outcome.error, GitHubAPIError):
+                continue
+            if outcome.error:
+                raise outcome.error
+            if outcome.value:
+                yield {"repo": outcome.item["name"], "stale_count": outcome.value}
+
+    def run(self, ctx: CareContext) -> Dict:
+        return {"plugin": self.name, "repos": list(self.stream(ctx))}
@@ -7,14 +7,18 @@ Recovers broken issue-to-commit links (42.2% of GitHub issues lack proper links)
 Uses lazy-access to handle long commit histories without token overflow
 """
 
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 from . import Plugin
 from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubAPIError
+from caretaker.core.planner import Estimate
 
 class LinkRecoveryAgent(Plugin):
     name = "link_recovery"
+    # Only the first few repos are processed, so their issues and commits are read lazily rather than prefetched fleet-wide
+    needs = ("repos",)
     
     def __init__(self):
         super().__init__()
@@ -93,43 +97,25 @@ class LinkRecoveryAgent(Plugin):
         Lazy-access pattern: only load commits on-demand
         Prevents token overflow on large repos
         """
-        commits = []
-        page = 1
-        per_page = 30
-        
-        while len(commits) < max_commits:
-            try:
-                batch = ctx.client.list_commits(
-                    owner=ctx.owner,
-                    repo=repo,
-                    page=page,
-                    per_page=per_page
-                )
-                
-                if not batch:
-                    break
-                
-                commits.extend(batch)
-                page += 1
-                
-            except Exception as e:
-                print(f"Error fetching commits: {e}")
-                break
-        
-        return commits[:max_commits]
+        try:
+            return ctx.store.commits(ctx.owner, repo, limit=max_commits)
+        except GitHubAPIError as e:
+            # Empty repositories answer 409 on the commits endpoint
+            print(f"Error fetching commits: {e}")
+            return []
     
     def recover_links_for_repo(self, ctx: CareContext, repo_name: str) -> Dict:
         """Recover missing issue-commit links for a single repository"""
         
-        # Get issues without linked commits
-        issues = ctx.client.list_issues(owner=ctx.owner, repo=repo_name, state="all")
-        
         # Get recent commits (lazy load)
         commits = self.lazy_access_commit_history(ctx, repo_name, max_commits=200)
         
         recovered = []
+        total_issues = 0
         
-        for issue in issues:
+        # Served from the mirror, which fetches only issues updated since its last sync
+        for issue in ctx.store.issues(ctx.owner, repo_name):
+            total_issues += 1
             issue_num = issue.get("number")
             issue_title = issue.get("title", "")
             issue_body = issue.get("body", "")
@@ -188,30 +174,41 @@ class LinkRecoveryAgent(Plugin):
         
         return {
             "repo": repo_name,
-            "total_issues": len(issues),
+            "total_issues": total_issues,
             "links_recovered": len(recovered),
-            "recovery_rate": f"{(len(recovered)/len(issues))*100:.1f}%" if issues else "0%",
+            "recovery_rate": f"{(len(recovered)/total_issues)*100:.1f}%" if total_issues else "0%",
             "recovered_links": recovered
         }
     
+    def estimate(self, ctx: CareContext) -> Estimate:
+        estimate = Estimate().mirror_repos(ctx)
+        for repo in ctx.repos()[:5]:
+            if not repo.get("archived"):
+                estimate.mirror_commits(ctx, repo, limit=200).mirror_issues(ctx, repo)
+        return estimate
+
+    def stream(self, ctx: CareContext) -> Iterator[Dict]:
+        """Yield each repository's recovery result as soon as it is ready"""
+        repos = ctx.repos()
+        
+        # Process first 5 repos (add full processing later), skipping archived ones
+        targets = [repo for repo in repos[:5] if not repo.get("archived")]
+        # Commits move pushed_at but issue activity doesn't, so the newest issue update is fingerprinted too
+        outcomes = ctx.map_changed_repos(self, lambda repo: self.recover_links_for_repo(ctx, repo.get("name")), targets,
+                                         params={"confidence_threshold": self.confidence_threshold},
+                                         extra=lambda repo: ctx.store.issues_updated_at(ctx.owner, repo.get("name")))
+        for outcome in outcomes:
+            if isinstance(outcome.error, GitHubAPIError):
+                print(f"Skipping {outcome.item.get('name')}: {outcome.error}")
+                continue
+            if outcome.error:
+                raise outcome.error
+            yield outcome.value
+
     def run(self, ctx: CareContext) -> Dict:
         """Run link recovery across all repositories"""
-        repos = ctx.client.list_user_repos(ctx.owner)
-        
-        results = []
-        total_recovered = 0
-        
-        # Process first 5 repos (add full processing later)
-        for repo in repos[:5]:
-            repo_name = repo.get("name")
-            
-            # Skip archived repos
-            if repo.get("archived"):
-                continue
-            
-            result = self.recover_links_for_repo(ctx, repo_name)
-            results.append(result)
-            total_recovered += result["links_recovered"]
+        results = list(self.stream(ctx))
+        total_recovered = sum(r["links_recovered"] for r in results)
         
         return {
             "plugin": self.name,
@@ -20,6 +20,7 @@ from caretaker.core.context import CareContext
 
 class RepoExplorerAgent(Plugin):
     name = "repo_explorer"
+    kind = "cpu"
     
     def __init__(self):
         super().__init__()
@@ -2,23 +2,42 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from datetime import datetime
 import os
 
-from caretaker.core.config import get_username
-from caretaker.core.github_client import GitHubClient
-from caretaker.core.config import get_token, get_base_url
-from caretaker.plugins import load_plugins, CareContext
+from caretaker.plugins import load_plugins
+from caretaker.core.context import build_context
 from caretaker.core.reporting import write_json
+from caretaker.core.lanes import SCHEDULED, request_lane
+from caretaker.core.planner import format_plan, plan_run, run_plan
 
 def start():
-    client = GitHubClient(get_token(), get_base_url())
-    ctx = CareContext(client, get_username())
+    ctx = build_context()
     scheduler = BackgroundScheduler()
 
     def job():
-        for p in load_plugins():
-            data = p.run(ctx)
-            write_json(os.path.join(os.getcwd(), "reports"), f"scheduled_{p.name}", data)
+        with request_lane(SCHEDULED):
+            run_all()
+
+    def run_all():
+        # Plugins that do not fit the remaining budget wait for the next reset instead of stalling mid-run
+        plugins = load_plugins()
+        plan = plan_run(ctx, plugins)
+        if not plan["fits_now"]:
+            for line in format_plan(plan):
+                print(f"📊 {line}")
+        if ctx.client.cache:
+            ctx.client.cache.reset_stats()
+        before = ctx.client.api_profile()
+        timings = {}
+        # A sweep that was killed part-way leaves checkpoints behind; pick up where it stopped
+        pending = ctx.journal.pending(ctx.owner) if ctx.journal else []
+        if pending:
+            print(f"↻ Resuming interrupted sweep: {', '.join(pending)}")
+        results = run_plan(ctx, plan, plugins, timings=timings, resume=bool(pending))
+        # Plugins run concurrently, so API usage is reported for the sweep as a whole
+        reports = os.path.join(os.getcwd(), "reports")
+        for name, data in results.items():
+            write_json(reports, f"scheduled_{name}", data)
+        write_json(reports, "scheduled_sweep", {"timings": timings, "reuse": ctx.reuse}, api=ctx.client.api_profile(since=before))
 
     scheduler.add_job(job, "cron", hour=3)
     scheduler.start()
     return scheduler
-
@@ -1,9 +1,41 @@
+async function streamPlugin(name, out){
+  // Records arrive as server-sent events while the plugin is still running, one per repo
+  const r=await fetch(`/stream/${name}`)
+  if(!r.ok){
+    out.textContent=await r.text()
+    return
+  }
+  const reader=r.body.getReader()
+  const decoder=new TextDecoder()
+  let buffer=''
+  for(;;){
+    const {value,done}=await reader.read()
+    if(done) break
+    buffer+=decoder.decode(value,{stream:true})
+    const frames=buffer.split('\n\n')
+    buffer=frames.pop()
+    for(const frame of frames){
+      const event=(frame.match(/^event: (.*)$/m)||[])[1]||'message'
+      const data=(frame.match(/^data: (.*)$/m)||[])[1]
+      if(!data) continue
+      out.textContent+=(event==='message'?'':`${event}: `)+data+'\n'
+    }
+  }
+}
+
 document.querySelectorAll('button[data-plugin]').forEach(b=>{
   b.addEventListener('click', async ()=>{
     const name=b.getAttribute('data-plugin')
+    const out=document.getElementById('result')
+    out.textContent=''
+    const stream=document.getElementById('stream')
+    if(stream && stream.checked){
+      await streamPlugin(name, out)
+      return
+    }
+    // A full run also writes reports/<name>.json with its API profile
     const r=await fetch(`/run/${name}`)
     const j=await r.json()
-    document.getElementById('result').textContent=JSON.stringify(j,null,2)
+    out.textContent=JSON.stringify(j,null,2)
   })
 })
-
@@ -2,10 +2,35 @@
 """Enhanced CareTaker CLI with v2.0 agents"""
 
 import click
+import json
 import shutil
 import os
 from caretaker.plugins import get_plugin
-from caretaker.core.context import build_context
+
+# The context, planner and HTTP stack are imported inside the commands so --help and
+# argument errors don't pay for them.
+
+def planned_run(ctx, agent, dry_run, resume=False):
+    """Run ``agent`` if its estimated requests fit the rate budget, waiting for a reset when needed.
+
+    With ``resume`` an interrupted run's checkpointed repos are kept. Returns None for dry runs.
+    """
+    from caretaker.core.planner import format_plan, plan_run, run_plan
+    plan = plan_run(ctx, [agent])
+    if dry_run or not plan["fits_now"]:
+        click.echo("📊 Estimated API usage:")
+        for line in format_plan(plan):
+            click.echo(f"   {line}")
+    if dry_run:
+        return None
+    if plan["refused"]:
+        raise click.ClickException(f"{agent.name} needs more requests than one rate-limit window allows")
+    if resume and ctx.journal and agent.name in ctx.journal.pending(ctx.owner):
+        click.echo(f"↻ Resuming {agent.name} from its last checkpoint")
+    result = run_plan(ctx, plan, [agent], resume=resume)[agent.name]
+    if set(result) == {"plugin", "error"}:
+        raise click.ClickException(f"{agent.name} failed: {result['error']}")
+    return result
 
 @click.group()
 def cli():
@@ -14,12 +39,16 @@ def cli():
 
 @cli.command()
 @click.option('--owner', required=True, help='GitHub username or org')
-def monitor(owner):
+@click.option('--dry-run', is_flag=True, help='Only estimate the API requests the run would make')
+def monitor(owner, dry_run):
     """Run Monitor Agent to check multi-agent system health"""
+    from caretaker.core.context import build_context
     ctx = build_context(owner)
     
     agent = get_plugin('monitor')
-    result = agent.run(ctx)
+    result = planned_run(ctx, agent, dry_run)
+    if result is None:
+        return
     
     click.echo(f"🔍 Monitor Agent Report:")
     click.echo(f"   Health Score: {result['health_score']:.1f}%")
@@ -29,12 +58,16 @@ def monitor(owner):
 @cli.command()
 @click.option('--owner', required=True)
 @click.option('--output', required=False, help='Optional output file path for report')
-def explore(owner, output):
+@click.option('--dry-run', is_flag=True, help='Only estimate the API requests the run would make')
+def explore(owner, output, dry_run):
     """Run Repository Explorer to analyze code structure"""
+    from caretaker.core.context import build_context
     ctx = build_context(owner)
     
     agent = get_plugin('repo_explorer')
-    result = agent.run(ctx)
+    result = planned_run(ctx, agent, dry_run)
+    if result is None:
+        return
     
     click.echo(f"🗺️  Repository Explorer:")
     click.echo(f"   Analyzed Path: {result['analyzed_path']}")
@@ -53,16 +86,38 @@ def explore(owner, output):
 
 @cli.command()
 @click.option('--owner', required=True)
-def recover_links(owner):
+@click.option('--dry-run', is_flag=True, help='Only estimate the API requests the run would make')
+@click.option('--resume', is_flag=True, help='Skip repos an interrupted run already finished and reuse their results')
+def recover_links(owner, dry_run, resume):
     """Run Link Recovery Agent to fix broken issue-commit links"""
+    from caretaker.core.context import build_context
     ctx = build_context(owner)
     
     agent = get_plugin('link_recovery')
-    result = agent.run(ctx)
+    result = planned_run(ctx, agent, dry_run, resume)
+    if result is None:
+        return
     
     click.echo(f"🔗 Link Recovery Agent:")
     click.echo(f"   Repositories: {result['repositories_analyzed']}")
     click.echo(f"   Links Recovered: {result['total_links_recovered']}")
 
+@cli.command()
+@click.argument('name')
+@click.option('--owner', required=True)
+def stream(name, owner):
+    """Run a plugin and print its records as NDJSON as they are produced"""
+    from caretaker.core.context import build_context
+    from caretaker.core.records import json_default
+    ctx = build_context(owner)
+    
+    agent = get_plugin(name)
+    if agent is None:
+        raise click.ClickException(f"Unknown plugin: {name}")
+    # Each scope is read from GitHub at most once; no up-front prefetch, so the first record comes early
+    with ctx.store.pinned():
+        for record in agent.stream(ctx):
+            click.echo(json.dumps(record, default=json_default))
+
 if __name__ == '__main__':
     cli()
@@ -180,9 +180,10 @@ def phase_2_agents():
     run_command(["git", "push", "origin", "main"], cwd=target_dir, check=False)
     
     # Archive sources
-    for repo in sources:
-        print(f"   Archiving {repo}...")
-        client.update_repo(GITHUB_USER, repo, description=f"🗄️ ARCHIVED - Merged into {target}/archive/agents/{repo}", archived=True)
+    with client.batch_writes() as batch:
+        for repo in sources:
+            print(f"   Archiving {repo}...")
+            batch.update_repo(GITHUB_USER, repo, description=f"🗄️ ARCHIVED - Merged into {target}/archive/agents/{repo}", archived=True)
 
 def phase_3_adhd_tools():
     print("\n🔵 [Phase 3] ADHD Tools Consolidation")
@@ -217,9 +218,10 @@ def phase_3_adhd_tools():
     run_command(["git", "push", "origin", "main"], cwd=target_dir, check=False)
     
     # Archive sources
-    for repo in sources:
-        print(f"   Archiving {repo}...")
-        client.update_repo(GITHUB_USER, repo, description=f"🗄️ ARCHIVED - Merged into {target}/archive/legacy-tools/{repo}", archived=True)
+    with client.batch_writes() as batch:
+        for repo in sources:
+            print(f"   Archiving {repo}...")
+            batch.update_repo(GITHUB_USER, repo, description=f"🗄️ ARCHIVED - Merged into {target}/archive/legacy-tools/{repo}", archived=True)
 
 def phase_4_archive_only():
     print("\n🔵 [Phase 4] Archive Empty/Experimental Repos")
@@ -230,9 +232,12 @@ def phase_4_archive_only():
         "BROski-system",
         "HyperCodingApp"
     ]
+    # Description and archive flag for every repo go out as one GraphQL mutation request
+    batch = client.batch_writes()
     for repo in repos:
-        print(f"   Archiving {repo}...")
-        client.update_repo(GITHUB_USER, repo, description="🗄️ ARCHIVED - Early experiment, superseded by newer implementations", archived=True)
+        batch.update_repo(GITHUB_USER, repo, description="🗄️ ARCHIVED - Early experiment, superseded by newer implementations", archived=True)
+    for op in batch.flush():
+        print(f"   Archiving {op.repo}... {'✅' if op.ok else '⚠️ ' + str(op.error)}")
 
 def main():
     print(f"🚀 Starting GitHub Cleanup for {GITHUB_USER}...")
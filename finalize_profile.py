@@ -18,44 +18,31 @@ client = GitHubClient(token=TOKEN)
 
 def finalize_profile():
     print("🚀 Starting Final Profile Polish...")
-    
+    # All description and topic changes are sent together as one batched GraphQL mutation
+    batch = client.batch_writes()
+
     # 1. Update Descriptions
-    print("\n📝 Updating Repository Descriptions...")
-    
-    # GitHub-Hyper-Agent-BROski
     desc_broski = "AI agent crew for GitHub automation – issues, PRs, repo management for neurodivergent devs"
-    print(f"   → Updating GitHub-Hyper-Agent-BROski...")
-    if client.update_repo(GITHUB_USER, "GitHub-Hyper-Agent-BROski", description=desc_broski):
-        print("      ✅ Done.")
-    else:
-        print("      ⚠️ Failed.")
-
-    # My-GitHub-CareTaker
     desc_caretaker = "AI-powered GitHub manager that scans repos, finds duplicates, generates cleanup scripts"
-    print(f"   → Updating My-GitHub-CareTaker...")
-    if client.update_repo(GITHUB_USER, "My-GitHub-CareTaker", description=desc_caretaker):
-        print("      ✅ Done.")
-    else:
-        print("      ⚠️ Failed.")
+    descriptions = [
+        ("Updating GitHub-Hyper-Agent-BROski", batch.update_repo(GITHUB_USER, "GitHub-Hyper-Agent-BROski", description=desc_broski)),
+        ("Updating My-GitHub-CareTaker", batch.update_repo(GITHUB_USER, "My-GitHub-CareTaker", description=desc_caretaker)),
+    ]
 
     # 2. Add Topics
-    print("\n🏷️  Adding Topics...")
-
-    # THE-HYPERCODE
     topics_hypercode = ["hypercode", "programming-language", "neurodivergent", "adhd", "quantum-computing"]
-    print(f"   → Tagging THE-HYPERCODE: {topics_hypercode}")
-    if client.update_topics(GITHUB_USER, "THE-HYPERCODE", topics_hypercode):
-         print("      ✅ Done.")
-    else:
-         print("      ⚠️ Failed (Repo might not exist or name differs).")
-
-    # My-GitHub-CareTaker
     topics_caretaker = ["github-management", "ai-agents", "repo-cleanup", "automation", "python"]
-    print(f"   → Tagging My-GitHub-CareTaker: {topics_caretaker}")
-    if client.update_topics(GITHUB_USER, "My-GitHub-CareTaker", topics_caretaker):
-         print("      ✅ Done.")
-    else:
-         print("      ⚠️ Failed.")
+    topics = [
+        (f"Tagging THE-HYPERCODE: {topics_hypercode}", batch.update_topics(GITHUB_USER, "THE-HYPERCODE", topics_hypercode)),
+        (f"Tagging My-GitHub-CareTaker: {topics_caretaker}", batch.update_topics(GITHUB_USER, "My-GitHub-CareTaker", topics_caretaker)),
+    ]
+    batch.flush()
+
+    for heading, ops in (("\n📝 Updating Repository Descriptions...", descriptions), ("\n🏷️  Adding Topics...", topics)):
+        print(heading)
+        for label, op in ops:
+            print(f"   → {label}...")
+            print("      ✅ Done." if op.ok else f"      ⚠️ Failed ({op.error}).")
 
     print("\n✅ Final Polish Complete! Your profile is ready for pinning.")
 
@@ -5,6 +5,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from caretaker.core.config import load_config
 from caretaker.core.github_client import GitHubClient
+from caretaker.core.context import build_context
 
 def step_1_profile_repo(client: GitHubClient, username: str):
     print(f"🚀 Starting Step 1: Profile Repository for {username}...")
@@ -90,23 +91,24 @@ def step_2_hygiene(client: GitHubClient, username: str):
         "my-costellation-of-repos"
     ]
     
-    # Verify existence and get IDs
+    # Verify existence and get IDs from a single inventory sweep
     repo_ids = []
     print("  🔍 Verifying target repositories...")
+    inventory = {r["name"]: r for r in client.repo_inventory(username)}
     for name in target_names:
-        repo = client.get_repo(username, name)
+        repo = inventory.get(name)
         if repo:
             repo_ids.append(repo["node_id"])
             print(f"    ✅ Found {name} ({repo['node_id']})")
             
             # Check files
             # Check README
-            if not client.get_repo_file(username, name, "README.md"):
+            if not client.file_exists(username, name, "README.md"):
                 print(f"      ⚠️ Missing README.md in {name}. Creating default...")
                 client.create_or_update_file(username, name, "README.md", f"# {name}\n\n{repo.get('description', 'No description.')}", "docs: add default readme")
             
             # Check LICENSE
-            if not client.get_repo_file(username, name, "LICENSE"):
+            if not client.file_exists(username, name, "LICENSE"):
                 print(f"      ⚠️ Missing LICENSE in {name}. Creating MIT...")
                 license_content = "MIT License\n\nCopyright (c) 2026 " + username
                 client.create_or_update_file(username, name, "LICENSE", license_content, "chore: add MIT license")
@@ -132,11 +134,12 @@ def step_2_hygiene(client: GitHubClient, username: str):
 
     # 3. Archive Old Repos
     print("  📦 Checking for stale repositories to archive...")
-    repos = client.list_user_repos(username)
+    repos = inventory.values()
     import datetime
     # Fix: pushed_at might be None or string. It returns ISO string.
     one_year_ago = (datetime.datetime.now() - datetime.timedelta(days=365)).isoformat()
     
+    batch = client.batch_writes()
     for r in repos:
         if r["private"]: continue
         if r["archived"]: continue
@@ -145,10 +148,12 @@ def step_2_hygiene(client: GitHubClient, username: str):
         pushed_at = r.get("pushed_at")
         if pushed_at and pushed_at < one_year_ago:
             print(f"    ARCHIVING {r['name']} (Last push: {pushed_at})")
-            if client.archive_repo(username, r["name"]):
-                print(f"      ✅ Archived {r['name']}")
-            else:
-                print(f"      ❌ Failed to archive {r['name']}")
+            batch.archive_repo(username, r["name"], node_id=r["node_id"])
+    for op in batch.flush():
+        if op.ok:
+            print(f"      ✅ Archived {op.repo}")
+        else:
+            print(f"      ❌ Failed to archive {op.repo}: {op.error}")
 
 def step_3_activity(client: GitHubClient, username: str):
     print(f"🚀 Starting Step 3: Activity Graph...")
@@ -277,36 +282,25 @@ jobs:
     for name in target_names:
         print(f"  🔧 Adding CI to {name}...")
         # Check if repo exists
-        if not client.get_repo(username, name):
+        repo = client.get_repo(username, name)
+        if not repo:
             print(f"    ⚠️ Repo {name} not found. Skipping.")
             continue
-            
-        success = client.create_or_update_file(
-            username, 
-            name, 
-            ".github/workflows/ci.yml", 
-            ci_content, 
-            "ci: add unified CI workflow"
-        )
-        if success:
-            print(f"    ✅ CI added to {name}.")
-            
-            # Now update README with badge
-            print(f"    🏷️ Updating README badge in {name}...")
-            # We need to prepend the badge.
-            # Get current README
-            file_data = client.get_repo_file(username, name, "README.md")
-            if file_data:
-                import base64
-                current_content = base64.b64decode(file_data["content"]).decode("utf-8")
-                badge = f"![CI](https://github.com/{username}/{name}/actions/workflows/ci.yml/badge.svg)"
-                
-                if badge not in current_content:
-                    new_content = f"{badge}\n\n{current_content}"
-                    client.create_or_update_file(username, name, "README.md", new_content, "docs: add CI badge")
-                    print(f"    ✅ Badge added.")
-                else:
-                    print(f"    ✨ Badge already exists.")
+
+        # Workflow and README badge land together as one commit
+        files = {".github/workflows/ci.yml": ci_content}
+        badge = f"![CI](https://github.com/{username}/{name}/actions/workflows/ci.yml/badge.svg)"
+        readme = client.get_file_bytes(username, name, "README.md")
+        if readme is not None:
+            current_content = readme.decode("utf-8")
+            if badge not in current_content:
+                files["README.md"] = f"{badge}\n\n{current_content}"
+            else:
+                print(f"    ✨ Badge already exists.")
+
+        branch = repo.get("default_branch") or "main"
+        if client.commit_files(username, name, branch, files, "ci: add unified CI workflow and badge"):
+            print(f"    ✅ CI{' and badge' if 'README.md' in files else ''} added to {name}.")
         else:
             print(f"    ❌ Failed to add CI to {name}.")
 
@@ -317,6 +311,8 @@ def step_4_issues(client: GitHubClient, username: str):
         "GitHub-Hyper-Agent-BROski"
     ]
     
+    # Stale issues of every target repo are closed together in batched GraphQL mutations
+    batch = client.batch_writes()
     for name in target_names:
         print(f"  🔍 Processing {name}...")
         # Check if repo exists
@@ -344,10 +340,13 @@ def step_4_issues(client: GitHubClient, username: str):
             if issue.get("pull_request"): continue # Skip PRs
             if issue["updated_at"] < ninety_days_ago:
                 print(f"    🔒 Closing stale issue #{issue['number']}: {issue['title']}")
-                client.close_issue(username, name, issue["number"], "Stale issue closed by CareTaker.")
+                batch.close_issue(username, name, issue["number"], "Stale issue closed by CareTaker.", node_id=issue.get("node_id"))
                 count += 1
         if count == 0:
             print("    ✨ No stale issues found.")
+    failed = [op for op in batch.flush() if not op.ok]
+    for op in failed:
+        print(f"    ❌ Could not close {op.repo}#{op.number}: {op.error}")
 
 def step_6_website(client: GitHubClient, username: str):
     print(f"🚀 Starting Step 6: Documentation Website...")
@@ -440,11 +439,10 @@ def step_9_verify(client: GitHubClient, username: str):
     
     # Check Profile README links
     print("  🔍 Verifying Profile README links...")
-    readme = client.get_repo_file(username, username, "README.md")
-    if readme:
-        import base64
+    readme = client.get_file_bytes(username, username, "README.md")
+    if readme is not None:
         import re
-        content = base64.b64decode(readme["content"]).decode("utf-8")
+        content = readme.decode("utf-8")
         links = re.findall(r'href="(https?://[^"]+)"', content) + re.findall(r'\((https?://[^)]+)\)', content)
         
         print(f"    Found {len(links)} links. Checking sample...")
@@ -472,7 +470,8 @@ def main():
         # caretaker/core/config.py usually loads dotenv.
         return
 
-    client = GitHubClient(config.github_token)
+    # Shared context wiring: HTTP cache, token pool and the on-disk blob store persist across runs
+    client = build_context().client
     
     # Get authenticated user
     user_resp = client._request("GET", "/user")
@@ -0,0 +1,51 @@
+import json
+import os
+import sys
+import unittest
+from typing import Dict
+
+import requests
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.fake_github import FakeGitHub, FakeGitHubServer
+
+class FakeClock:
+    """Manual clock: tests advance ``now``; ``sleep`` records and advances it."""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self.slept = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+def make_response(status=200, body=None, headers=None, url="https://api.github.com/x"):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.url = url
+    resp.encoding = "utf-8"
+    resp._content = json.dumps(body).encode("utf-8") if body is not None else b""
+    resp.headers.update({"X-RateLimit-Remaining": "4999", "X-RateLimit-Reset": "0"})
+    resp.headers.update(headers or {})
+    return resp
+
+class FakeServerTestCase(unittest.TestCase):
+    """Serves a FakeGitHub built from ``fleet`` for the whole test class."""
+
+    fleet: Dict = {}
+
+    @classmethod
+    def setUpClass(cls):
+        cls.github = FakeGitHub(owner="octocat", **cls.fleet)
+        cls.server = FakeGitHubServer(cls.github)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
@@ -0,0 +1,104 @@
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.adaptive import AIMDLimiter, CircuitBreaker, backoff
+from caretaker.core.github_client import CircuitOpenError, GitHubAPIError, GitHubClient
+from tests.helpers import FakeClock, make_response
+
+class TestAIMDLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(start=100.0)
+        self.limiter = AIMDLimiter(initial=4, maximum=6, latency_target=1.0, cooldown=1.0, clock=self.clock.time)
+
+    def test_grows_by_one_per_window_of_healthy_responses(self):
+        for _ in range(4):
+            self.limiter.on_success(0.1)
+        self.assertEqual(self.limiter.snapshot()["limit"], 5)
+        for _ in range(20):
+            self.limiter.on_success(0.1)
+        self.assertEqual(self.limiter.snapshot()["limit"], 6)
+
+    def test_slow_responses_do_not_grow(self):
+        for _ in range(10):
+            self.limiter.on_success(2.0)
+        self.assertEqual(self.limiter.snapshot()["limit"], 4)
+
+    def test_congestion_halves_once_per_cooldown(self):
+        self.limiter.on_congestion()
+        self.limiter.on_congestion()
+        self.assertEqual(self.limiter.snapshot()["limit"], 2)
+        self.clock.now += 1.5
+        self.limiter.on_congestion()
+        self.limiter.on_congestion()
+        self.clock.now += 1.5
+        self.limiter.on_congestion()
+        self.assertEqual(self.limiter.snapshot()["limit"], 1)
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(start=100.0)
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=self.clock.time)
+
+    def test_opens_then_probes(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+        self.clock.now += 10
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())  # one probe at a time
+        self.breaker.record_success()
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_probe_doubles_timeout(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now += 10
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_failure()
+        self.clock.now += 10
+        self.assertFalse(self.breaker.allow())
+        self.clock.now += 10
+        self.assertTrue(self.breaker.allow())
+
+    def test_backoff_is_jittered_and_capped(self):
+        delays = [backoff(5, cap=4) for _ in range(50)]
+        self.assertTrue(all(0 <= d <= 4 for d in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+class TestClientAdaptive(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(start=100.0)
+        self.breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30, clock=self.clock.time)
+        self.limiter = AIMDLimiter(initial=8, clock=self.clock.time)
+        self.client = GitHubClient("token", limiter=self.limiter, breaker=self.breaker)
+
+    @patch('caretaker.core.github_client.time.sleep')
+    def test_outage_opens_circuit_and_fails_fast(self, _sleep):
+        self.client.session.request = MagicMock(side_effect=requests.ConnectionError("down"))
+        with self.assertRaises(requests.ConnectionError):
+            self.client.get_repo("o", "r")
+        self.client.session.request.reset_mock()
+        with self.assertRaises(CircuitOpenError) as err:
+            self.client.get_repo("o", "other")
+        self.assertIsInstance(err.exception, GitHubAPIError)
+        self.client.session.request.assert_not_called()
+
+    @patch('caretaker.core.github_client.time.sleep')
+    def test_throttling_cuts_concurrency(self, _sleep):
+        self.client.session.request = MagicMock(side_effect=[
+            make_response(429, {}, {"Retry-After": "0"}),
+            make_response(200, {"name": "r"}),
+        ])
+        self.client.get_repo("o", "r")
+        self.assertEqual(self.client.api_profile()["adaptive"]["concurrency"]["limit"], 4)
+        self.assertEqual(self.breaker.snapshot()["state"], "closed")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+
+import asyncio
+import inspect
+import sys
+import os
+import unittest
+from unittest.mock import MagicMock
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.async_client import AsyncGitHubClient
+from caretaker.core.github_client import GitHubClient
+from tests.helpers import make_response
+
+class TestAsyncGitHubClient(unittest.TestCase):
+    def setUp(self):
+        self.client = GitHubClient("token")
+        self.client.session.request = MagicMock(side_effect=self.fake_request)
+        self.aclient = AsyncGitHubClient(self.client, max_concurrency=4)
+
+    def fake_request(self, method, url, params=None, json=None, headers=None, timeout=None):
+        page = params["page"]
+        link = '<https://api.github.com/users/u/repos?per_page=100&page=3>; rel="last"'
+        body = [{"name": f"repo-{page}-{i}"} for i in range(100 if page < 3 else 5)]
+        return make_response(200, body, {"Link": link})
+
+    def test_paginate_fans_out_after_first_page(self):
+        repos = asyncio.run(self.aclient.list_user_repos("u"))
+        self.assertEqual(len(repos), 205)
+        self.assertEqual(repos[0]["name"], "repo-1-0")
+        self.assertEqual(repos[-1]["name"], "repo-3-4")
+        pages = sorted(c.kwargs["params"]["page"] for c in self.client.session.request.call_args_list)
+        self.assertEqual(pages, [1, 2, 3])
+
+    def test_unwrapped_methods_delegate_to_sync_client(self):
+        self.client.session.request = MagicMock(return_value=make_response(200, {}))
+        ok = asyncio.run(self.aclient.update_topics("o", "r", ["a"]))
+        self.assertTrue(ok)
+
+    def test_reads_share_the_sync_implementation(self):
+        content = {"sha": "95d09f2b10159347eece71399a7e2e907ea3df4f", "encoding": "base64", "content": "aGVsbG8gd29ybGQ="}
+        self.client.session.request = MagicMock(return_value=make_response(200, content))
+        data = asyncio.run(self.aclient.get_repo_file("o", "r", "README.md"))
+        self.assertEqual(data["sha"], content["sha"])
+        # The sync client's blob store and sha memo are filled the same way
+        self.assertEqual(self.client.blobs.get(content["sha"]), b"hello world")
+        self.assertEqual(self.client.memo.get(self.client._sha_key("o", "r", "README.md", None)), content["sha"])
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    def test_list_issues_matches_sync_signature(self):
+        self.assertEqual(inspect.signature(self.aclient.list_issues), inspect.signature(self.client.list_issues))
+        issues = [{"number": n, "updated_at": f"2024-01-0{n}T00:00:00Z"} for n in (1, 2, 3)]
+        self.client.session.request = MagicMock(return_value=make_response(200, issues))
+        found = asyncio.run(self.aclient.list_issues("o", "r", since="2024-01-01T00:00:00Z", until="2024-01-02T00:00:00Z"))
+        self.assertEqual([i["number"] for i in found], [1, 2])
+        self.assertEqual(self.client.session.request.call_args.kwargs["params"]["since"], "2024-01-01T00:00:00Z")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caretaker.core.blob_store import BlobStore, git_blob_sha
+
+class TestBlobStore(unittest.TestCase):
+    def test_memory_is_bounded_lru(self):
+        store = BlobStore(max_bytes=10)
+        a, b = store.put(b"aaaa"), store.put(b"bbbb")
+        self.assertEqual(store.get(a), b"aaaa")
+        c = store.put(b"cccc")
+        # "b" was least recently used
+        self.assertIsNone(store.get(b))
+        self.assertEqual(store.get(a), b"aaaa")
+        self.assertEqual(store.get(c), b"cccc")
+        self.assertLessEqual(store._memory_bytes, 10)
+
+    def test_oversized_blob_is_not_kept(self):
+        store = BlobStore(max_bytes=4)
+        sha = store.put(b"too large")
+        self.assertEqual(sha, git_blob_sha(b"too large"))
+        self.assertIsNone(store.get(sha))
+
+    def test_mismatched_sha_is_rejected(self):
+        self.assertIsNone(BlobStore().put(b"data", sha="0" * 40))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.blob_store import BlobStore, git_blob_sha
+from caretaker.core.context import CareContext
+from caretaker.core.fake_github import FakeGitHub
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.http_cache import ResponseCache
+from caretaker.core.replay import Cassette, use_cassette
+from caretaker.plugins.dependencies import DependenciesPlugin
+from caretaker.plugins.issues import IssuesPlugin
+from tests.helpers import FakeServerTestCase
+
+class TestFakeGitHubServer(FakeServerTestCase):
+    fleet = dict(repos=150, issues_per_repo=3, commits_per_repo=5, seed=1)
+
+    def client(self, **kwargs):
+        return GitHubClient("fake-token", self.server.url, **kwargs)
+
+    def test_fixtures_are_deterministic(self):
+        again = FakeGitHub(owner="octocat", repos=150, issues_per_repo=3, commits_per_repo=5, seed=1)
+        self.assertEqual(list(again.repos), list(self.github.repos))
+
+    def test_rest_listing_paginates(self):
+        repos = self.client().list_user_repos("octocat")
+        self.assertEqual(len(repos), 150)
+        self.assertIn("Link", self.client()._request("GET", "/users/octocat/repos", params={"per_page": 100}).headers)
+
+    def test_graphql_inventory_matches_rest(self):
+        inventory = self.client().repo_inventory("octocat")
+        self.assertEqual(sorted(r["name"] for r in inventory), sorted(self.github.repos))
+        self.assertTrue(all(r["default_branch"] in ("main", "master") for r in inventory))
+
+    def test_inventory_leaves_out_private_repos(self):
+        name = sorted(self.github.repos)[0]
+        self.github.repos[name]["private"] = True
+        try:
+            self.assertNotIn(name, [r["name"] for r in self.client().repo_inventory("octocat")])
+            private = self.client(include_private=True).repo_inventory("octocat")
+            self.assertIn(name, [r["name"] for r in private])
+        finally:
+            self.github.repos[name]["private"] = False
+
+    def test_plugins_run_offline(self):
+        ctx = CareContext("octocat", self.client())
+        deps = DependenciesPlugin().run(ctx)
+        expected = sum(1 for files in self.github.files.values() if "requirements.txt" in files or "package.json" in files)
+        self.assertEqual(len(deps["repos"]), expected)
+        self.assertEqual(IssuesPlugin().run(ctx)["plugin"], "issues")
+
+    def test_conditional_requests_are_free(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            self.client(cache=ResponseCache(cache_dir)).get_repo_file("octocat", next(iter(self.github.repos)), "README.md")
+            before = self.github.remaining["core"]
+            client = self.client(cache=ResponseCache(cache_dir))
+            client.get_repo_file("octocat", next(iter(self.github.repos)), "README.md")
+            self.assertEqual(client.cache_stats()["hits"], 1)
+            self.assertEqual(self.github.remaining["core"], before)
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_commit_files_writes_one_commit(self):
+        name = next(n for n, r in self.github.repos.items() if r["default_branch"] == "main")
+        client = self.client()
+        before = sum(self.github.requests.values())
+        head = self.github.head(name)
+        sha = client.commit_files("octocat", name, "main",
+                                  {"ci.yml": "on: push\n", "README.md": "# new\n", "LICENSE": None, "logo.bin": b"\xff\x00"},
+                                  "ci: add workflow")
+
+        self.assertEqual(self.github.heads[name], sha)
+        self.assertEqual(self.github.git_commits[sha]["parents"], [{"sha": head}])
+        files = self.github.files[name]
+        self.assertEqual(files["ci.yml"], b"on: push\n")
+        self.assertEqual(files["README.md"], b"# new\n")
+        self.assertEqual(files["logo.bin"], b"\xff\x00")
+        self.assertNotIn("LICENSE", files)
+        # branch + tree + commit + ref, plus one blob for the binary file
+        self.assertEqual(sum(self.github.requests.values()) - before, 5)
+
+    def test_identical_files_download_once(self):
+        names = [n for n, files in self.github.files.items() if "LICENSE" in files][:2]
+        blob_dir = tempfile.mkdtemp()
+        try:
+            client = self.client(blobs=BlobStore(blob_dir))
+            first = client.get_file_bytes("octocat", names[0], "LICENSE")
+            self.assertEqual(first, self.github.files[names[0]]["LICENSE"])
+
+            # Same content in another repo: the tree call names a blob already on disk
+            before = sum(self.github.requests.values())
+            again = self.client(blobs=BlobStore(blob_dir))
+            self.assertEqual(again.get_file_bytes("octocat", names[1], "LICENSE"), first)
+            self.assertEqual(sum(self.github.requests.values()) - before, 1)
+            self.assertEqual(again.blob_stats()["bytes_saved"], len(first))
+
+            self.assertTrue(again.file_exists("octocat", names[1], "LICENSE"))
+            self.assertFalse(again.file_exists("octocat", names[1], "NOPE.md"))
+            self.assertIsNone(again.get_file_bytes("octocat", names[1], "NOPE.md"))
+        finally:
+            shutil.rmtree(blob_dir)
+
+    def test_blob_store_rejects_mismatched_content(self):
+        store = BlobStore()
+        self.assertIsNone(store.put(b"tampered", sha=git_blob_sha(b"original")))
+        self.assertEqual(store.put(b"original"), git_blob_sha(b"original"))
+        self.assertEqual(store.get(git_blob_sha(b"original")), b"original")
+
+    def test_record_then_replay_without_server(self):
+        cassette = Cassette()
+        recorder = self.client()
+        use_cassette(recorder.session, cassette, mode="record")
+        recorded = recorder.list_user_repos("octocat")
+
+        path = os.path.join(tempfile.mkdtemp(), "cassette.json")
+        cassette.save(path)
+        replayer = GitHubClient("fake-token", "https://api.github.com")
+        use_cassette(replayer.session, Cassette.load(path))
+        self.assertEqual(replayer.list_user_repos("octocat"), recorded)
+        shutil.rmtree(os.path.dirname(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caretaker.core.context import CareContext
+from caretaker.core.fanout import fan_out
+from caretaker.core.lanes import BULK_WRITE, current_lane, request_lane
+
+class TestFanOut(unittest.TestCase):
+    def test_ordered_results_overlap(self):
+        started = time.monotonic()
+        results = list(fan_out(lambda n: (time.sleep(0.05 * (5 - n)), n * n)[1], range(5), max_workers=5))
+        # Serially this would take 0.75s; the slowest item alone takes 0.25s
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual([r.item for r in results], list(range(5)))
+        self.assertEqual([r.value for r in results], [0, 1, 4, 9, 16])
+
+    def test_unordered_streams_as_completed(self):
+        results = list(fan_out(lambda n: (time.sleep(0.05 * (3 - n)), n)[1], range(3), max_workers=3, ordered=False))
+        self.assertEqual([r.value for r in results], [2, 1, 0])
+
+    def test_errors_are_captured_per_item(self):
+        def fn(n):
+            if n == 2:
+                raise RuntimeError("bad repo")
+            return n
+        results = list(fan_out(fn, range(4), max_workers=2))
+        self.assertEqual([r.ok for r in results], [True, True, False, True])
+        self.assertEqual(str(results[2].error), "bad repo")
+        self.assertEqual(results[3].value, 3)
+
+    def test_cancel_stops_new_items(self):
+        cancel = threading.Event()
+        calls = []
+
+        def fn(n):
+            calls.append(n)
+            time.sleep(0.01)
+            return n
+        seen = []
+        for result in fan_out(fn, range(100), max_workers=4, cancel=cancel):
+            seen.append(result.item)
+            if len(seen) == 3:
+                cancel.set()
+        # Only what was already in flight finishes after the cancel
+        self.assertLessEqual(len(calls), 3 + 4)
+        self.assertEqual(seen, list(range(len(seen))))
+
+    def test_workers_keep_callers_lane(self):
+        ctx = CareContext("octocat", None, max_concurrency=3)
+        with request_lane(BULK_WRITE):
+            lanes = {r.value for r in ctx.map_repos(lambda repo: current_lane(), [{"name": f"r{i}"} for i in range(6)])}
+        self.assertEqual(lanes, {BULK_WRITE})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,209 @@
+
+import shutil
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.github_client import GitHubAPIError, GitHubClient, older_than
+from caretaker.core.http_cache import ResponseCache
+from tests.helpers import make_response
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.client = GitHubClient("token", cache=ResponseCache(self.cache_dir))
+        self.client.session.request = MagicMock()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_etag_revalidation_serves_cached_body(self):
+        self.client.session.request.side_effect = [
+            make_response(200, {"default_branch": "main"}, {"ETag": '"abc"'}),
+            make_response(304, None, {"ETag": '"abc"'}),
+        ]
+        self.assertEqual(self.client.get_default_branch("o", "r"), "main")
+        self.client.memo.clear()  # next run
+        self.assertEqual(self.client.get_default_branch("o", "r"), "main")
+
+        second_headers = self.client.session.request.call_args_list[1].kwargs["headers"]
+        self.assertEqual(second_headers["If-None-Match"], '"abc"')
+        self.assertEqual(self.client.cache_stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5})
+
+    def test_cache_persists_across_clients(self):
+        self.client.session.request.return_value = make_response(200, {"name": "r"}, {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+        self.client.get_repo("o", "r")
+
+        other = GitHubClient("token", cache=ResponseCache(self.cache_dir))
+        other.session.request = MagicMock(return_value=make_response(304))
+        self.assertEqual(other.get_repo("o", "r"), {"name": "r"})
+        headers = other.session.request.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-Modified-Since"], "Mon, 01 Jan 2024 00:00:00 GMT")
+
+    def test_writes_are_not_cached(self):
+        self.client.session.request.return_value = make_response(200, {}, {"ETag": '"w"'})
+        self.client.update_repo("o", "r", description="x")
+        self.assertIsNone(self.client.session.request.call_args.kwargs["headers"])
+        self.assertEqual(self.client.cache_stats()["misses"], 0)
+
+    def test_volatile_and_blob_reads_stay_off_disk(self):
+        self.client.session.request.return_value = make_response(200, [], {"ETag": '"v"'})
+        self.client.list_issues("o", "r", state="all", since="2024-01-01T00:00:00Z")
+        self.client.session.request.return_value = make_response(200, {"content": ""}, {"ETag": '"b"'})
+        self.client._request("GET", "/repos/o/r/git/blobs/abc")
+        self.assertEqual([files for _, _, files in os.walk(self.cache_dir) if files], [])
+
+    def test_least_recently_used_entries_are_pruned(self):
+        cache = ResponseCache(self.cache_dir, max_bytes=1000)
+        keys = [cache.key("GET", f"https://api.github.com/repos/o/r{i}") for i in range(3)]
+        for i, key in enumerate(keys[:2]):
+            cache.store(key, make_response(200, {"pad": "x" * 300}, {"ETag": f'"{i}"'}))
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+        # Reading the older entry makes it the most recently used
+        self.assertIsNotNone(cache.get(keys[0]))
+        cache.store(keys[2], make_response(200, {"pad": "x" * 300}, {"ETag": '"2"'}))
+
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+
+class TestStreamingPagination(unittest.TestCase):
+    def setUp(self):
+        self.client = GitHubClient("token")
+        self.pages = {
+            1: [{"n": i, "updated_at": "2024-03-01T00:00:00Z"} for i in range(100)],
+            2: [{"n": 100 + i, "updated_at": "2023-01-01T00:00:00Z"} for i in range(40)],
+        }
+        self.client.session.request = MagicMock(side_effect=self.fake_request)
+
+    def fake_request(self, method, url, params=None, json=None, headers=None, timeout=None):
+        return make_response(200, self.pages.get(params["page"], []))
+
+    def test_iter_pages_stops_on_short_page(self):
+        pages = [page for page, _ in self.client.iter_pages("/repos/o/r/issues")]
+        self.assertEqual(pages, [1, 2])
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+    def test_iter_items_limit_stops_fetching(self):
+        items = list(self.client.iter_items("/repos/o/r/issues", limit=10))
+        self.assertEqual(len(items), 10)
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    def test_iter_items_stop_when_and_resume(self):
+        from datetime import datetime
+        fresh = list(self.client.iter_items("/repos/o/r/issues", stop_when=older_than(datetime(2024, 1, 1))))
+        self.assertEqual(len(fresh), 100)
+        resumed = list(self.client.iter_items("/repos/o/r/issues", start_page=2))
+        self.assertEqual(resumed[0]["n"], 100)
+
+    def test_strict_iteration_raises_on_error(self):
+        self.client.session.request = MagicMock(return_value=make_response(404, {"message": "Not Found"}))
+        with self.assertRaises(GitHubAPIError):
+            list(self.client.iter_items("/repos/o/missing/issues"))
+        self.assertEqual(self.client.paginate("/repos/o/missing/issues"), [])
+
+class TestRepoInventory(unittest.TestCase):
+    def node(self, name):
+        return {
+            "id": f"R_{name}", "name": name, "nameWithOwner": f"o/{name}", "isArchived": False, "isFork": True,
+            "pushedAt": "2024-01-01T00:00:00Z", "diskUsage": 12,
+            "defaultBranchRef": {"name": "trunk", "target": {"committedDate": "2024-01-02T00:00:00Z"}},
+            "repositoryTopics": {"nodes": [{"topic": {"name": "python"}}]},
+            "languages": {"edges": [{"size": 300, "node": {"name": "Python"}}]},
+            "issues": {"totalCount": 3}, "pullRequests": {"totalCount": 1},
+        }
+
+    def page(self, names, cursor=None):
+        return {"data": {"repositoryOwner": {"repositories": {
+            "pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor},
+            "nodes": [self.node(n) for n in names],
+        }}}}
+
+    def test_inventory_pages_and_normalizes(self):
+        client = GitHubClient("token")
+        client.graphql = MagicMock(side_effect=[self.page(["a", "b"], cursor="c1"), self.page(["c"])])
+        repos = client.repo_inventory("o")
+
+        self.assertEqual([r["name"] for r in repos], ["a", "b", "c"])
+        self.assertEqual(client.graphql.call_args_list[1].args[1], {"owner": "o", "cursor": "c1", "privacy": "PUBLIC"})
+        repo = repos[0]
+        self.assertEqual(repo["default_branch"], "trunk")
+        self.assertEqual(repo["last_commit_at"], "2024-01-02T00:00:00Z")
+        self.assertEqual(repo["topics"], ["python"])
+        self.assertEqual(repo["languages"], {"Python": 300})
+        self.assertEqual(repo["open_issues_count"], 4)
+        self.assertTrue(repo["fork"])
+
+    def test_inventory_raises_on_graphql_errors(self):
+        client = GitHubClient("token")
+        client.graphql = MagicMock(return_value={"errors": [{"message": "Could not resolve"}]})
+        with self.assertRaises(GitHubAPIError):
+            client.repo_inventory("ghost")
+
+class TestMemoization(unittest.TestCase):
+    def setUp(self):
+        self.client = GitHubClient("token")
+        self.client.session.request = MagicMock(side_effect=self.fake_request)
+
+    def fake_request(self, method, url, params=None, json=None, headers=None, timeout=None):
+        if url.endswith("/contents/README.md") and method == "GET":
+            return make_response(200, {"sha": "s1", "content": ""})
+        if method == "PUT":
+            return make_response(200, {"content": {"sha": "s2"}})
+        return make_response(200, {"name": "r", "default_branch": "main"})
+
+    def test_repeated_reads_hit_memo(self):
+        self.client.get_repo("o", "r")
+        self.client.get_default_branch("o", "r")
+        self.client.get_repo_file("o", "r", "README.md")
+        self.client.get_repo_file("o", "r", "README.md")
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+    def test_writes_invalidate_repo_scope(self):
+        self.client.get_repo("o", "r")
+        self.client.get_repo("o", "other")
+        self.client.update_repo("o", "r", description="new")
+        self.client.get_repo("o", "r")
+        self.client.get_repo("o", "other")
+        methods = [c.args[0] for c in self.client.session.request.call_args_list]
+        self.assertEqual(methods, ["GET", "GET", "PATCH", "GET"])
+
+    def test_gets_charge_the_given_cost(self):
+        self.client.governor = MagicMock(wraps=self.client.governor)
+        # /rate_limit is never memoized; /repos/o/r goes through the memo
+        self.client._request("GET", "/rate_limit", cost=3)
+        self.client._request("GET", "/repos/o/r", cost=4)
+        costs = [c.args[1] for c in self.client.governor.acquire.call_args_list]
+        self.assertEqual(costs, [3, 4])
+
+    def test_concurrent_identical_reads_share_one_request(self):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            release.wait(1)
+            return make_response(200, {"name": "r"})
+        self.client.session.request = MagicMock(side_effect=slow_request)
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(self.client.get_repo, "o", "r") for _ in range(4)]
+            release.set()
+            results = [f.result() for f in futures]
+        self.assertEqual(results, [{"name": "r"}] * 4)
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+    def test_create_or_update_file_reuses_known_sha(self):
+        self.client.get_repo_file("o", "r", "README.md", ref="main")
+        self.client.create_or_update_file("o", "r", "README.md", "a", "msg")
+        self.client.create_or_update_file("o", "r", "README.md", "b", "msg")
+        puts = [c for c in self.client.session.request.call_args_list if c.args[0] == "PUT"]
+        self.assertEqual([c.kwargs["json"]["sha"] for c in puts], ["s1", "s2"])
+        self.assertEqual(self.client.session.request.call_count, 3)
+
+if __name__ == '__main__':
+    unittest.main()
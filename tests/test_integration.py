@@ -36,7 +36,7 @@ class TestAppIntegration(unittest.TestCase):
     @patch('caretaker.app.ctx')
     def test_index_route(self, mock_ctx):
         # Mock the client response (though index doesn't use it directly in template currently)
-        mock_ctx.client.list_user_repos.return_value = [{'name': 'repo1'}]
+        mock_ctx.store.repos.return_value = [{'name': 'repo1'}]
         mock_ctx.owner = 'test_user'
         
         response = self.app.get('/', headers=self.headers)
@@ -45,7 +45,7 @@ class TestAppIntegration(unittest.TestCase):
 
     @patch('caretaker.app.ctx')
     def test_repos_route(self, mock_ctx):
-        mock_ctx.client.list_user_repos.return_value = [{'name': 'repo1', 'html_url': 'http://github.com/u/repo1'}]
+        mock_ctx.store.repos.return_value = [{'name': 'repo1', 'html_url': 'http://github.com/u/repo1'}]
         mock_ctx.owner = 'test_user'
         
         response = self.app.get('/repos', headers=self.headers)
@@ -56,5 +56,31 @@ class TestAppIntegration(unittest.TestCase):
         # If repos.html iterates, it likely shows the name.
         self.assertIn(b'repo1', response.data)
 
+    @patch('caretaker.app.ctx')
+    def test_sweeps_leave_the_interactive_lane(self, mock_ctx):
+        from caretaker.core.lanes import BULK_WRITE, INTERACTIVE, SCHEDULED, current_lane
+        seen = {}
+
+        def lane_of(step, result):
+            def call(*args):
+                seen[step] = current_lane()
+                return result
+            return call
+
+        groups = {"groups": {"r": [{"name": "a", "pushed_at": "2024"}, {"name": "b", "pushed_at": "2023"}]}}
+        mock_ctx.store.repos.side_effect = lane_of("page", [])
+        mock_ctx.client.batch_writes.return_value.flush.side_effect = lane_of("flush", [])
+        mock_ctx.client.api_profile.return_value = {}
+        plugin = MagicMock()
+        plugin.run.side_effect = lane_of("sweep", groups)
+
+        with patch('caretaker.app.get_plugin', return_value=plugin), patch('caretaker.app.write_json'):
+            self.app.get('/', headers=self.headers)
+            self.app.get('/run/duplicates', headers=self.headers)
+            self.assertEqual(seen.pop("sweep"), SCHEDULED)
+            self.app.post('/cleanup/duplicates', headers=self.headers)
+
+        self.assertEqual(seen, {"page": INTERACTIVE, "sweep": SCHEDULED, "flush": BULK_WRITE})
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,97 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.journal import Journal
+from caretaker.core.mirror import Mirror
+from caretaker.core.results import ResultCache
+from caretaker.core.runner import run_plugins
+from caretaker.plugins import Plugin
+from tests.helpers import FakeServerTestCase
+
+class Flaky(Plugin):
+    """Per-repo plugin that dies (like a dropped connection) once it reaches ``fail_at``."""
+    name = "flaky"
+
+    def __init__(self, fail_at=None):
+        self.fail_at = fail_at
+        self.calls = []
+
+    def run(self, ctx):
+        def check(repo):
+            self.calls.append(repo["name"])
+            if repo["name"] == self.fail_at:
+                raise ConnectionError("connection reset")
+            return {"repo": repo["name"], "letters": len(repo["name"])}
+        values = []
+        for outcome in ctx.map_changed_repos(self, check, max_workers=1):
+            if outcome.error:
+                raise outcome.error
+            values.append(outcome.value)
+        return {"plugin": self.name, "repos": values}
+
+class TestJournal(FakeServerTestCase):
+    fleet = dict(repos=10, issues_per_repo=1, commits_per_repo=1, seed=11)
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.names = sorted(self.github.repos, key=str.lower)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def context(self) -> CareContext:
+        # A new process each time: only the mirror and the journal are on disk
+        client = GitHubClient("fake-token", self.server.url)
+        return CareContext("octocat", client, store=Mirror(os.path.join(self.tmp, "mirror.sqlite3"), client),
+                           result_cache=ResultCache(), journal=Journal(os.path.join(self.tmp, "journal")))
+
+    def test_resume_skips_completed_repos(self):
+        ctx = self.context()
+        failed = run_plugins(ctx, [Flaky(fail_at=self.names[6])])["flaky"]
+        self.assertEqual(failed["error"], "connection reset")
+        self.assertEqual(ctx.journal.pending("octocat"), ["flaky"])
+        self.assertEqual(len(ctx.journal.completed("octocat", "flaky")), 6)
+
+        ctx = self.context()
+        plugin = Flaky()
+        result = run_plugins(ctx, [plugin], resume=True)["flaky"]
+        self.assertEqual(plugin.calls, self.names[6:])
+        self.assertEqual([r["repo"] for r in result["repos"]], self.names)
+        self.assertEqual(ctx.reuse["flaky"], {"reused": 0, "resumed": 6, "computed": 4})
+        # Completed, so there is nothing left to resume
+        self.assertEqual(ctx.journal.pending("octocat"), [])
+
+    def test_without_resume_starts_over(self):
+        run_plugins(self.context(), [Flaky(fail_at=self.names[3])])
+        plugin = Flaky()
+        run_plugins(self.context(), [plugin])
+        self.assertEqual(plugin.calls, self.names)
+
+    def test_direct_run_leaves_no_checkpoints(self):
+        # Dashboard and CLI streams call the plugin directly, outside a sweep
+        ctx = self.context()
+        Flaky().run(ctx)
+        self.assertEqual(ctx.journal.pending("octocat"), [])
+        ctx = self.context()
+        with self.assertRaises(ConnectionError):
+            Flaky(fail_at=self.names[2]).run(ctx)
+        self.assertEqual(ctx.journal.pending("octocat"), [])
+
+    def test_torn_line_is_ignored(self):
+        journal = Journal(os.path.join(self.tmp, "journal"))
+        journal.record("octocat", "flaky", "a", {"n": 1}, "fp")
+        with open(journal._path("octocat", "flaky"), "a", encoding="utf-8") as f:
+            f.write('{"unit": "b", "val')
+        self.assertEqual(journal.completed("octocat", "flaky"), {"a": {"fingerprint": "fp", "value": {"n": 1}}})
+        journal.clear("octocat", "flaky")
+        self.assertEqual(journal.pending("octocat"), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.metrics import route_template
+from caretaker.core.reporting import write_json
+from tests.helpers import make_response
+
+class TestRouteTemplate(unittest.TestCase):
+    def test_templates(self):
+        self.assertEqual(route_template("/users/welshDog/repos"), "/users/{u}/repos")
+        self.assertEqual(route_template("/repos/o/r"), "/repos/{o}/{r}")
+        self.assertEqual(route_template("/repos/o/r/issues/42/comments"), "/repos/{o}/{r}/issues/{n}/comments")
+        self.assertEqual(route_template("/repos/o/r/contents/docs/index.html"), "/repos/{o}/{r}/contents/{path}")
+        self.assertEqual(route_template("/repos/o/r/git/refs/heads/main"), "/repos/{o}/{r}/git/refs/{ref}")
+        self.assertEqual(route_template("/graphql"), "/graphql")
+
+class TestRequestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.client = GitHubClient("token")
+        self.client.session.request = MagicMock(side_effect=[
+            make_response(200, [{"number": 1}]),
+            make_response(502, {}),
+            make_response(200, {"name": "r"}),
+        ])
+
+    @patch('caretaker.core.github_client.time.sleep')
+    def test_profile_counts_per_route(self, sleep):
+        before = self.client.api_profile()
+        self.client.list_issues("o", "a")
+        self.client.get_repo("o", "b")
+        self.client.get_repo("o", "b")
+
+        profile = self.client.api_profile(since=before)
+        issues = profile["routes"]["GET /repos/{o}/{r}/issues"]
+        repo = profile["routes"]["GET /repos/{o}/{r}"]
+        self.assertEqual(issues["calls"], 1)
+        self.assertEqual(repo["calls"], 2)
+        self.assertEqual(repo["statuses"], {"502": 1, "200": 1})
+        self.assertEqual(repo["retries"], 1)
+        self.assertEqual(repo["memo_hits"], 1)
+        # Backoff is jittered; the profile records exactly what was slept
+        self.assertEqual(repo["rate_sleep"], sleep.call_args[0][0])
+        self.assertLessEqual(repo["rate_sleep"], 1)
+        self.assertEqual(profile["totals"]["cost"], 3)
+
+    def test_profile_is_embedded_in_reports(self):
+        report_dir = tempfile.mkdtemp()
+        try:
+            self.client.list_issues("o", "a")
+            path = write_json(report_dir, "issues", {"plugin": "issues"}, api=self.client.api_profile())
+            with open(path, encoding="utf-8") as f:
+                report = json.load(f)
+            self.assertEqual(report["api"]["totals"]["calls"], 1)
+            self.assertEqual(report["data"], {"plugin": "issues"})
+        finally:
+            shutil.rmtree(report_dir)
+
+if __name__ == '__main__':
+    unittest.main()
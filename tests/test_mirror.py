@@ -0,0 +1,124 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubAPIError, GitHubClient
+from caretaker.core.mirror import Mirror
+from caretaker.plugins.issues import IssuesPlugin
+from tests.helpers import FakeClock, FakeServerTestCase
+
+class TestMirror(FakeServerTestCase):
+    fleet = dict(repos=30, issues_per_repo=4, commits_per_repo=5, seed=2)
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.clock = FakeClock()
+        self.client = GitHubClient("fake-token", self.server.url)
+        self.mirror = Mirror(os.path.join(self.tmp, "mirror.sqlite3"), self.client, max_age=600, clock=self.clock.time)
+
+    def tearDown(self):
+        self.mirror.close()
+        shutil.rmtree(self.tmp)
+
+    def requests(self):
+        return sum(self.github.requests.values())
+
+    def test_fresh_reads_are_local(self):
+        repos = self.mirror.repos("octocat")
+        self.assertEqual(sorted(r.name for r in repos), sorted(self.github.repos))
+        name = repos[0].name
+        self.mirror.issues("octocat", name)
+        self.mirror.files("octocat", name)
+
+        before = self.requests()
+        self.assertEqual(len(self.mirror.repos("octocat")), 30)
+        self.assertEqual(len(self.mirror.issues("octocat", name)), len(self.github.issues[name]))
+        self.assertEqual(set(self.mirror.files("octocat", name)), set(self.github.files[name]))
+        self.assertEqual(self.requests(), before)
+
+    def test_stale_scope_refreshes(self):
+        self.mirror.repos("octocat")
+        self.clock.now += 601
+        before = self.requests()
+        self.mirror.repos("octocat")
+        self.assertGreater(self.requests(), before)
+
+    def test_survives_reopen(self):
+        self.mirror.repos("octocat")
+        reopened = Mirror(self.mirror.path, self.client, max_age=600, clock=self.clock.time)
+        before = self.requests()
+        self.assertEqual(len(reopened.repos("octocat", include_archived=False)),
+                         sum(1 for r in self.github.repos.values() if not r["archived"]))
+        self.assertEqual(self.requests(), before)
+        reopened.close()
+
+    def test_refresh_upserts_only_changes(self):
+        name = next(n for n, issues in self.github.issues.items() if len(issues) >= 3)
+        stored = self.mirror.issues("octocat", name)
+        self.mirror.commits("octocat", name)
+        self.client.close_issue("octocat", name, stored[-1]["number"])
+
+        self.clock.now += 601
+        changes = self.mirror._db.total_changes
+        # ``since`` is inclusive, so the newest stored issue comes back along with the closed one
+        self.assertEqual(self.mirror.sync_issues("octocat", name), 2)
+        # Those two and the sync mark, not the whole history again
+        self.assertLessEqual(self.mirror._db.total_changes - changes, 3)
+        self.assertEqual(self.mirror.issues("octocat", name)[-1]["state"], "closed")
+        self.assertEqual(len(self.mirror.issues("octocat", name)), len(stored))
+
+    def test_tree_is_refetched_only_after_a_push(self):
+        trees = lambda: sum(n for (method, route), n in self.github.requests.items() if "/git/trees/" in route)
+        # Without the in-process memo, which would serve the branch's tree for its TTL regardless
+        self.mirror.client = GitHubClient("fake-token", self.server.url, memo_size=0)
+        name = self.mirror.repos("octocat")[0].name
+        self.mirror.files("octocat", name)
+
+        self.clock.now += 601
+        self.mirror.repos("octocat")
+        before = trees()
+        self.assertEqual(set(self.mirror.files("octocat", name)), set(self.github.files[name]))
+        self.assertEqual(trees(), before)
+
+        self.github.files[name]["CHANGELOG.md"] = b"# Changes\n"
+        self.github.advance(name, "Add changelog")
+        self.clock.now += 601
+        self.mirror.repos("octocat")
+        self.assertIn("CHANGELOG.md", self.mirror.files("octocat", name))
+        self.assertEqual(trees(), before + 1)
+
+    def test_failed_tree_read_keeps_stored_files(self):
+        self.mirror.client = GitHubClient("fake-token", self.server.url, memo_size=0)
+        # Not the repo the other tree test pushes to, whose push could land in the same second
+        name = self.mirror.repos("octocat")[-1].name
+        stored = self.mirror.files("octocat", name)
+        self.github.advance(name, "Touch")
+        self.clock.now += 601
+        self.mirror.repos("octocat")
+
+        for tree in (None, {"tree": [], "truncated": True}):
+            with patch.object(self.mirror.client, "get_tree", return_value=tree):
+                with self.assertRaises(GitHubAPIError):
+                    self.mirror.files("octocat", name)
+            self.assertEqual(self.mirror.query("SELECT COUNT(*) AS n FROM files WHERE repo = ?", (name,))[0]["n"], len(stored))
+            # Neither marked synced nor pinned to the new push, so the next read tries the tree again
+            self.assertTrue(self.mirror.is_stale("octocat", f"files:{name}"))
+            self.assertFalse(self.mirror.files_unchanged("octocat", name))
+        self.assertEqual(self.mirror.files("octocat", name), stored)
+
+    def test_plugin_rerun_is_local(self):
+        ctx = CareContext("octocat", self.client, store=self.mirror)
+        IssuesPlugin().run(ctx)
+        before = self.requests()
+        IssuesPlugin().run(ctx)
+        self.assertEqual(self.requests(), before)
+
+if __name__ == '__main__':
+    unittest.main()
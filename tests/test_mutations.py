@@ -0,0 +1,92 @@
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caretaker.core.fake_github import FakeGitHub, FakeGitHubServer
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.rate_limit import RateLimitGovernor
+from tests.helpers import FakeClock
+
+class TestMutationBatcher(unittest.TestCase):
+    def setUp(self):
+        self.github = FakeGitHub(owner="octocat", repos=40, issues_per_repo=5, commits_per_repo=1, seed=3)
+        self.server = FakeGitHubServer(self.github)
+        self.server.start()
+        # Each batch is charged 5 points per mutation; a roomy minute budget keeps the test from pacing
+        self.client = GitHubClient("fake-token", self.server.url, governor=RateLimitGovernor(per_minute=100000))
+
+    def tearDown(self):
+        self.server.stop()
+
+    def graphql_requests(self) -> int:
+        return sum(n for (method, pattern), n in self.github.requests.items() if "graphql" in pattern)
+
+    def rest_requests(self) -> int:
+        return sum(n for (method, pattern), n in self.github.requests.items() if "graphql" not in pattern)
+
+    def test_close_issues_in_few_requests(self):
+        targets = [(name, i["number"]) for name, issues in self.github.issues.items() for i in issues if i["state"] == "open"]
+        self.assertGreater(len(targets), 60)
+        with self.client.batch_writes() as batch:
+            ops = [batch.close_issue("octocat", name, number, "Stale issue closed by CareTaker.") for name, number in targets]
+
+        self.assertTrue(all(op.ok for op in ops))
+        # One lookup per 100 issues, then comment + close for each issue, 50 mutations per request
+        expected = -(-len(targets) // 100) + -(-len(targets) * 2 // 50)
+        self.assertEqual(self.graphql_requests(), expected)
+        self.assertEqual(self.rest_requests(), 0)
+        for name, number in targets:
+            issue = next(i for i in self.github.issues[name] if i["number"] == number)
+            self.assertEqual(issue["state"], "closed")
+            self.assertEqual(self.github.comments[(name, number)][-1]["body"], "Stale issue closed by CareTaker.")
+
+    def test_failures_map_to_their_operation(self):
+        name = next(iter(self.github.repos))
+        batch = self.client.batch_writes()
+        good = batch.close_issue("octocat", name, 1)
+        missing = batch.close_issue("octocat", name, 999)
+        stale_id = batch.close_issue("octocat", name, 2, node_id="I_gone")
+        ops = batch.flush()
+
+        self.assertEqual(ops, [good, missing, stale_id])
+        self.assertTrue(good.ok)
+        self.assertFalse(missing.ok)
+        self.assertIn("#999", missing.error)
+        self.assertFalse(stale_id.ok)
+        self.assertIn("I_gone", stale_id.error)
+        self.assertEqual(len(batch), 0)
+
+    def test_repo_updates(self):
+        names = list(self.github.repos)[:3]
+        with self.client.batch_writes(batch_size=2) as batch:
+            archived = batch.update_repo("octocat", names[0], description="ARCHIVED", archived=True)
+            topics = batch.update_topics("octocat", names[1], ["python", "automation"])
+            # Not settable through GraphQL: sent as a REST PATCH instead
+            private = batch.update_repo("octocat", names[2], private=True)
+
+        self.assertTrue(archived.ok and topics.ok and private.ok)
+        self.assertEqual(self.github.repos[names[0]]["description"], "ARCHIVED")
+        self.assertTrue(self.github.repos[names[0]]["archived"])
+        self.assertEqual(self.github.repos[names[1]]["topics"], ["python", "automation"])
+        self.assertTrue(self.github.repos[names[2]]["private"])
+        # The two steps of the archive stay in one document; the topics update goes in the next
+        self.assertEqual(self.graphql_requests(), 3)
+        self.assertEqual(self.rest_requests(), 1)
+
+    def test_batches_fit_the_minute_budget(self):
+        clock = FakeClock()
+        # 100 points a minute less a 10% reserve admits 18 mutations of 5 points per document
+        self.client.governor = RateLimitGovernor(per_minute=100, reserve_budget=0.1, clock=clock.time, sleep=clock.sleep)
+        targets = [(name, i["number"]) for name in list(self.github.repos)[:3] for i in self.github.issues[name]]
+        with self.client.batch_writes(batch_size=500) as batch:
+            ops = [batch.close_issue("octocat", name, number, "Closed.") for name, number in targets]
+
+        self.assertTrue(all(op.ok for op in ops))
+        # One lookup, then comment + close per issue in documents of at most 9 issues
+        self.assertGreater(len(ops), 9)
+        self.assertEqual(self.graphql_requests(), 1 + -(-len(ops) // 9))
+
+if __name__ == "__main__":
+    unittest.main()
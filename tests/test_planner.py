@@ -0,0 +1,101 @@
+import os
+import sys
+import time
+import unittest
+
+import requests
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.mirror import Mirror
+from caretaker.core.planner import ISSUES, Estimate, format_plan, plan_run, run_plan
+from caretaker.plugins import Plugin
+from caretaker.plugins.issues import IssuesPlugin
+from caretaker.plugins.link_recovery import LinkRecoveryAgent
+from tests.helpers import FakeServerTestCase
+
+class FixedPlugin(Plugin):
+    def __init__(self, name: str, core: int):
+        self.name = name
+        self.core = core
+        self.runs = 0
+
+    def estimate(self, ctx):
+        return Estimate().add(ISSUES, self.core)
+
+    def run(self, ctx):
+        self.runs += 1
+        return {"plugin": self.name}
+
+class TestPlanner(FakeServerTestCase):
+    fleet = dict(repos=25, issues_per_repo=4, commits_per_repo=5, seed=4)
+
+    def setUp(self):
+        self.client = GitHubClient("fake-token", self.server.url)
+        self.ctx = CareContext("octocat", self.client, store=Mirror(":memory:", self.client, max_age=600))
+
+    def test_estimate_matches_actual_requests(self):
+        for plugin in (IssuesPlugin(), LinkRecoveryAgent()):
+            estimate = plugin.estimate(self.ctx)
+            before = self.client.api_profile()
+            plugin.run(self.ctx)
+            actual = {route: r["calls"] for route, r in self.client.api_profile(since=before)["routes"].items()}
+            # The estimate itself read the inventory, so the run makes every call but that one
+            expected = dict(estimate.routes)
+            expected.pop("POST /graphql", None)
+            self.assertEqual(set(actual), set(expected))
+            # Commit history length is unknown up front, so its pages are an upper bound
+            self.assertEqual(actual.get(ISSUES), expected.get(ISSUES))
+            self.assertTrue(all(actual[route] <= n for route, n in expected.items()))
+            # Everything is in the fresh mirror now
+            self.assertEqual(plugin.estimate(self.ctx).total, 0)
+
+    def test_live_budget(self):
+        budget = self.client.rate_limit()
+        self.assertEqual(budget["core"]["limit"], self.github.rate_limit)
+        self.assertIn("graphql", budget)
+
+    def test_split_across_windows_and_refuse(self):
+        reset = time.time() + 600
+        budget = {"core": {"limit": 1000, "remaining": 400, "reset": reset}}
+        plugins = [FixedPlugin("a", 250), FixedPlugin("b", 250), FixedPlugin("c", 2000)]
+        plan = plan_run(self.ctx, plugins, budget=budget)
+
+        # 400 left minus the 10% interactive reserve holds one 250-request plugin
+        self.assertEqual(plan["windows"], [["a"], ["b"]])
+        self.assertEqual([r["plugin"] for r in plan["refused"]], ["c"])
+        self.assertFalse(plan["fits_now"])
+        self.assertTrue(any(line.startswith("refused c") for line in format_plan(plan)))
+
+        slept = []
+        # What "a" leaves behind: not enough for "b" until the reset
+        self.client.rate_limit = lambda: {"core": dict(budget["core"], remaining=150)}
+        results = run_plan(self.ctx, plan, plugins, sleep=slept.append)
+        self.assertEqual(list(results), ["a", "b"])
+        self.assertEqual(plugins[2].runs, 0)
+        self.assertEqual(len(slept), 1)
+        self.assertAlmostEqual(slept[0], 600, delta=5)
+
+    def test_no_budget_lookup_without_api_calls(self):
+        def unreachable():
+            raise requests.ConnectionError("GitHub unreachable")
+        self.client.rate_limit = unreachable
+        plan = plan_run(self.ctx, [FixedPlugin("offline", 0)])
+        self.assertTrue(plan["fits_now"])
+        self.assertEqual(plan["budget"], {})
+
+        # With API calls to make, an unreachable budget endpoint means running unplanned rather than failing
+        plan = plan_run(self.ctx, [FixedPlugin("a", 100)])
+        self.assertTrue(plan["fits_now"])
+        self.assertEqual(plan["windows"], [["a"]])
+
+    def test_fits_without_waiting(self):
+        budget = {"core": {"limit": 5000, "remaining": 5000, "reset": time.time() + 3600}}
+        plan = plan_run(self.ctx, [FixedPlugin("a", 100), FixedPlugin("b", 100)], budget=budget)
+        self.assertTrue(plan["fits_now"])
+        self.assertEqual(plan["windows"], [["a", "b"]])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from caretaker.plugins import PLUGIN_REGISTRY, Plugin, PluginRegistry, _scan, load_plugins
+
+PLUGIN_SOURCE = '''from caretaker.plugins import Plugin
+
+class Base(Plugin):
+    name = "{name}"
+
+class Child(Base):
+    name = "{name}_child"
+
+class NotAPlugin:
+    name = "helper"
+'''
+
+class TestPluginRegistry(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.plugin_dir = os.path.join(self.tmp.name, "extra_plugins")
+        os.makedirs(self.plugin_dir)
+        open(os.path.join(self.plugin_dir, "__init__.py"), "w").close()
+        self.write("alpha.py", PLUGIN_SOURCE.format(name="alpha"))
+        self.index_path = os.path.join(self.plugin_dir, "__pycache__", "plugin_index.json")
+        sys.path.insert(0, self.tmp.name)
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        for name in [m for m in sys.modules if m.startswith("extra_plugins")]:
+            del sys.modules[name]
+        self.tmp.cleanup()
+
+    def write(self, filename, source):
+        with open(os.path.join(self.plugin_dir, filename), "w") as f:
+            f.write(source)
+
+    def registry(self):
+        return PluginRegistry(self.plugin_dir, self.index_path, package="extra_plugins")
+
+    def test_index_does_not_import(self):
+        registry = self.registry()
+        self.assertEqual(registry.names(), ["alpha", "alpha_child"])
+        self.assertNotIn("extra_plugins.alpha", sys.modules)
+        cls = registry.get("alpha_child")
+        self.assertTrue(issubclass(cls, Plugin))
+        self.assertEqual(cls.__name__, "Child")
+        self.assertIsNone(registry.get("helper"))
+
+    def test_cache_is_reused_until_mtime_changes(self):
+        self.registry().index()
+        self.assertTrue(os.path.exists(self.index_path))
+
+        import caretaker.plugins as plugins
+        scanned = []
+        original = plugins._scan
+        plugins._scan = lambda path: scanned.append(os.path.basename(path)) or original(path)
+        try:
+            self.assertEqual(self.registry().names(), ["alpha", "alpha_child"])
+            self.assertEqual(scanned, [])
+
+            self.write("alpha.py", PLUGIN_SOURCE.format(name="renamed"))
+            later = time.time() + 5
+            os.utime(os.path.join(self.plugin_dir, "alpha.py"), (later, later))
+            self.write("beta.py", PLUGIN_SOURCE.format(name="beta"))
+            self.assertEqual(self.registry().names(), ["renamed", "renamed_child", "beta", "beta_child"])
+            self.assertEqual(sorted(scanned), ["alpha.py", "beta.py"])
+        finally:
+            plugins._scan = original
+
+    def test_scan_reads_class_names(self):
+        path = os.path.join(self.plugin_dir, "alpha.py")
+        self.assertEqual([c["name"] for c in _scan(path)], ["alpha", "alpha_child", "helper"])
+
+    def test_builtin_plugins(self):
+        names = set(PLUGIN_REGISTRY.names())
+        self.assertTrue({"monitor", "issues", "dependencies", "duplicates", "link_recovery", "repo_explorer"} <= names)
+        self.assertEqual({p.name for p in load_plugins()}, names)
+
+    def test_getting_one_plugin_imports_only_its_module(self):
+        code = ("import sys; from caretaker.plugins import get_plugin; get_plugin('monitor'); "
+                "print(sorted(m for m in sys.modules if m.startswith('caretaker.plugins.')))")
+        out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "['caretaker.plugins.monitor']")
+
+if __name__ == "__main__":
+    unittest.main()
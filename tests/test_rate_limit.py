@@ -0,0 +1,140 @@
+
+import sys
+import os
+import threading
+import unittest
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.lanes import BULK_WRITE, INTERACTIVE, SCHEDULED, current_lane, request_lane
+from caretaker.core.rate_limit import RateLimitGovernor, get_governor
+from tests.helpers import FakeClock
+
+class TestRateLimitGovernor(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.governor = RateLimitGovernor(per_minute=60, clock=self.clock.time, sleep=self.clock.sleep)
+
+    def headers(self, remaining, reset_in=1000, limit=5000):
+        return {"X-RateLimit-Limit": str(limit), "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(int(self.clock.now + reset_in))}
+
+    def send(self, status=200, headers=None):
+        waited = self.governor.acquire()
+        self.governor.release()
+        self.governor.observe(status, headers or {})
+        return waited
+
+    def test_no_pacing_with_plenty_of_budget(self):
+        self.governor.observe(200, self.headers(4000))
+        self.assertEqual(self.send(), 0)
+        self.assertEqual(self.send(), 0)
+
+    def test_paces_evenly_when_budget_is_low(self):
+        self.governor.observe(200, self.headers(100))
+        self.send()
+        # 100 requests over 1000 seconds -> one every ~10 seconds
+        self.assertAlmostEqual(self.send(), 1000 / 99, places=3)
+
+    def test_retry_after_blocks_next_request(self):
+        throttled = self.governor.observe(429, {"Retry-After": "30"})
+        self.assertTrue(throttled)
+        self.assertEqual(self.send(), 30)
+
+    def test_secondary_limit_without_guidance_backs_off(self):
+        self.assertTrue(self.governor.observe(403, self.headers(4000), "You have exceeded a secondary rate limit"))
+        self.assertEqual(self.send(), 60)
+
+    def test_exhausted_budget_waits_for_reset(self):
+        self.governor.observe(200, self.headers(0, reset_in=120))
+        self.assertEqual(self.send(), 120)
+
+    def test_per_minute_bucket_refills(self):
+        for _ in range(60):
+            self.send()
+        self.assertAlmostEqual(self.send(), 1.0)
+
+    def test_governor_shared_per_token(self):
+        self.assertIs(get_governor("abc"), get_governor("abc"))
+        self.assertIsNot(get_governor("abc"), get_governor("xyz"))
+
+class TestLanes(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def governor(self, **kwargs):
+        return RateLimitGovernor(per_minute=600, clock=self.clock.time, sleep=self.clock.sleep, **kwargs)
+
+    def headers(self, remaining, reset_in=1000):
+        return {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(int(self.clock.now + reset_in))}
+
+    def test_background_leaves_reserved_budget(self):
+        governor = self.governor(reserve_budget=0.1)
+        governor.observe(200, self.headers(400))
+        self.assertEqual(governor.acquire(lane=INTERACTIVE), 0)
+        governor.release(INTERACTIVE)
+        self.assertEqual(governor.acquire(lane=SCHEDULED), 1000)
+        governor.release(SCHEDULED)
+
+    def test_interactive_skips_pacing(self):
+        governor = self.governor()
+        governor.observe(200, self.headers(100))
+        governor.acquire()
+        governor.release()
+        self.assertEqual(governor.acquire(lane=INTERACTIVE), 0)
+        governor.release(INTERACTIVE)
+        self.assertGreater(governor.acquire(), 0)
+        governor.release()
+
+    def enter_in_thread(self, governor, lane):
+        entered = threading.Event()
+
+        def run():
+            governor.acquire(lane=lane)
+            entered.set()
+            governor.release(lane)
+        threading.Thread(target=run, daemon=True).start()
+        return entered
+
+    def test_reserved_slots_stay_free_for_interactive(self):
+        governor = self.governor(max_concurrent=2, reserved_slots=1)
+        governor.acquire(lane=SCHEDULED)
+        background = self.enter_in_thread(governor, SCHEDULED)
+        self.assertFalse(background.wait(0.1))
+        self.assertTrue(self.enter_in_thread(governor, INTERACTIVE).wait(1))
+        governor.release(SCHEDULED)
+        self.assertTrue(background.wait(1))
+
+    def test_bulk_writes_run_one_at_a_time(self):
+        governor = self.governor(bulk_write_slots=1)
+        governor.acquire(lane=BULK_WRITE)
+        second = self.enter_in_thread(governor, BULK_WRITE)
+        self.assertFalse(second.wait(0.1))
+        self.assertTrue(self.enter_in_thread(governor, SCHEDULED).wait(1))
+        governor.release(BULK_WRITE)
+        self.assertTrue(second.wait(1))
+
+    def test_cost_above_the_minute_budget_is_rejected(self):
+        governor = self.governor(reserve_budget=0.1)
+        self.assertEqual(governor.max_cost(BULK_WRITE), 540)
+        with self.assertRaises(ValueError):
+            governor.acquire("graphql", cost=541, lane=BULK_WRITE)
+        self.assertEqual(self.clock.slept, [])
+        # Nothing was admitted, so the lane is still free
+        self.assertEqual(governor.acquire("graphql", cost=540, lane=BULK_WRITE), 0)
+        governor.release(BULK_WRITE)
+
+    def test_client_classifies_requests(self):
+        client = GitHubClient("token")
+        self.assertEqual(current_lane(), SCHEDULED)
+        self.assertEqual(client._lane("PATCH", "/repos/o/r", None), BULK_WRITE)
+        self.assertEqual(client._lane("POST", "/graphql", {"query": "query { viewer { login } }"}), SCHEDULED)
+        with request_lane(INTERACTIVE):
+            self.assertEqual(client._lane("PATCH", "/repos/o/r", None), INTERACTIVE)
+        self.assertEqual(current_lane(), SCHEDULED)
+
+if __name__ == '__main__':
+    unittest.main()
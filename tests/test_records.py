@@ -0,0 +1,75 @@
+import json
+import sys
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.records import IssueRecord, RepoRecord, json_default
+from caretaker.core.reporting import write_json
+from caretaker.plugins.duplicates import DuplicatesPlugin
+from tests.helpers import make_response
+
+REST_REPO = {
+    "id": 1, "name": "caretaker", "full_name": "octocat/caretaker", "private": False, "visibility": "public",
+    "owner": {"login": "octocat", "id": 9, "avatar_url": "https://x", "repos_url": "https://x/repos"},
+    "archived": False, "default_branch": "main", "pushed_at": "2024-01-02T00:00:00Z",
+    "topics": ["python", "github"], "hooks_url": "https://x/hooks", "issues_url": "https://x/issues{/number}",
+}
+
+class TestRecords(unittest.TestCase):
+    def test_repo_keeps_only_known_fields(self):
+        r = RepoRecord(REST_REPO)
+        self.assertEqual(r.name, "caretaker")
+        self.assertEqual(r["owner"], "octocat")
+        self.assertEqual(r.get("default_branch"), "main")
+        self.assertIsNone(r.get("hooks_url"))
+        with self.assertRaises(KeyError):
+            r["hooks_url"]
+        self.assertFalse(hasattr(r, "__dict__"))
+
+    def test_get_default_applies_to_missing_values(self):
+        issue = IssueRecord({"number": 3, "title": "x", "body": None, "labels": [{"name": "bug"}],
+                             "user": {"login": "octocat"}, "pull_request": {"url": "https://x"}})
+        self.assertEqual(issue.get("body", ""), "")
+        self.assertEqual(issue.labels, ["bug"])
+        self.assertEqual(issue.user, "octocat")
+        self.assertTrue(issue.get("pull_request"))
+
+    def test_strings_are_interned(self):
+        a = RepoRecord(dict(REST_REPO, owner={"login": "".join(["octo", "cat"])}))
+        b = RepoRecord(REST_REPO)
+        self.assertIs(a.owner, b.owner)
+
+    def test_records_serialize_in_reports(self):
+        groups = DuplicatesPlugin().group([RepoRecord(REST_REPO), RepoRecord(dict(REST_REPO, name="care-taker"))])
+        with tempfile.TemporaryDirectory() as tmp:
+            path = write_json(tmp, "duplicates", {"groups": groups})
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)["data"]
+        self.assertEqual([r["name"] for r in data["groups"]["caretaker"]], ["caretaker", "care-taker"])
+
+    def test_web_output_matches_reports(self):
+        from caretaker.app import app
+        record = {"repo": RepoRecord(REST_REPO)}
+        self.assertEqual(json.loads(app.json.dumps(record)), json.loads(json.dumps(record, default=json_default)))
+
+class TestClientConversion(unittest.TestCase):
+    def setUp(self):
+        self.client = GitHubClient("token")
+        self.client.session.request = MagicMock(return_value=make_response(200, [REST_REPO]))
+
+    def test_listing_returns_records(self):
+        repos = self.client.list_user_repos("octocat")
+        self.assertIsInstance(repos[0], RepoRecord)
+
+    def test_raw_opt_in(self):
+        repos = self.client.list_user_repos("octocat", raw=True)
+        self.assertEqual(repos[0]["hooks_url"], "https://x/hooks")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.mirror import Mirror
+from caretaker.core.results import ResultCache, fingerprint
+from caretaker.core.runner import run_plugins
+from caretaker.plugins import Plugin
+from caretaker.plugins.dependencies import DependenciesPlugin
+from tests.helpers import FakeServerTestCase
+
+class Counting(Plugin):
+    name = "counting"
+
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+
+    def run(self, ctx):
+        def check(repo):
+            self.calls.append(repo["name"])
+            if repo["name"] in self.fail:
+                raise RuntimeError("unreadable")
+            return {"size": len(repo["name"])}
+        return [o.value for o in ctx.map_changed_repos(self, check, params={"threshold": 3}) if o.ok]
+
+class TestResultCache(FakeServerTestCase):
+    fleet = dict(repos=12, issues_per_repo=2, commits_per_repo=2, seed=9)
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.mirror_path = os.path.join(self.tmp, "mirror.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def context(self) -> CareContext:
+        # A nightly run: fresh process (no memo), persistent mirror that is stale by now, persistent results
+        client = GitHubClient("fake-token", self.server.url, memo_size=0)
+        return CareContext("octocat", client, store=Mirror(self.mirror_path, client, max_age=0),
+                           result_cache=ResultCache(os.path.join(self.tmp, "results")))
+
+    def trees(self) -> int:
+        return sum(n for (method, route), n in self.github.requests.items() if "/git/trees/" in route)
+
+    def test_unchanged_repos_reuse_results(self):
+        repos = len(self.github.repos)
+        ctx = self.context()
+        first = run_plugins(ctx, [DependenciesPlugin()])["dependencies"]
+        self.assertEqual(ctx.reuse["dependencies"], {"reused": 0, "resumed": 0, "computed": repos})
+
+        before = self.trees()
+        ctx = self.context()
+        second = run_plugins(ctx, [DependenciesPlugin()])["dependencies"]
+        self.assertEqual(second, first)
+        self.assertEqual(ctx.reuse["dependencies"], {"reused": repos, "resumed": 0, "computed": 0})
+        self.assertEqual(self.trees(), before)
+
+        name = sorted(self.github.repos)[0]
+        self.github.files[name] = {"README.md": b"# moved to node\n", "package.json": b"{}"}
+        self.github.advance(name, "Switch to node")
+        ctx = self.context()
+        third = run_plugins(ctx, [DependenciesPlugin()])["dependencies"]
+        self.assertEqual(ctx.reuse["dependencies"], {"reused": repos - 1, "resumed": 0, "computed": 1})
+        self.assertEqual(self.trees(), before + 1)
+        self.assertIn({"repo": name, "python": False, "node": True}, third["repos"])
+
+    def test_version_and_params_change_fingerprint(self):
+        repo = {"name": "a", "pushed_at": "2024-01-01T00:00:00Z", "updated_at": "2024-01-02T00:00:00Z"}
+        plugin = Counting()
+        base = fingerprint(repo, plugin, {"threshold": 3})
+        self.assertEqual(base, fingerprint(dict(repo), Counting(), {"threshold": 3}))
+        self.assertNotEqual(base, fingerprint(repo, plugin, {"threshold": 4}))
+        self.assertNotEqual(base, fingerprint(dict(repo, pushed_at="2024-02-01T00:00:00Z"), plugin, {"threshold": 3}))
+        plugin.version = "2"
+        self.assertNotEqual(base, fingerprint(repo, plugin, {"threshold": 3}))
+
+    def test_errors_are_not_cached(self):
+        ctx = self.context()
+        broken = sorted(self.github.repos)[1]
+        Counting(fail=[broken]).run(ctx)
+        rerun = Counting()
+        results = rerun.run(ctx)
+        self.assertEqual(rerun.calls, [broken])
+        self.assertEqual(len(results), len(self.github.repos))
+
+if __name__ == "__main__":
+    unittest.main()
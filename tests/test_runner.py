@@ -0,0 +1,153 @@
+import os
+import sys
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.lanes import INTERACTIVE, current_lane, request_lane
+from caretaker.core.runner import prefetch, run_dag, run_plugins, topological_order, union_needs
+from caretaker.plugins import Plugin
+from caretaker.plugins.dependencies import DependenciesPlugin
+from caretaker.plugins.duplicates import DuplicatesPlugin
+from caretaker.plugins.issues import IssuesPlugin
+from caretaker.plugins.link_recovery import LinkRecoveryAgent
+from tests.helpers import FakeServerTestCase
+
+class Step(Plugin):
+    def __init__(self, name: str, depends_on=(), delay: float = 0.0, fail: bool = False):
+        self.name = name
+        self.depends_on = tuple(depends_on)
+        self.delay = delay
+        self.fail = fail
+
+    def run(self, ctx):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"plugin": self.name, "inputs": sorted(d for d in self.depends_on if d in ctx.results)}
+
+class SumCpu(Plugin):
+    """Runs in a worker process; only sees its dependencies' results."""
+    name = "sum_cpu"
+    kind = "cpu"
+    depends_on = ("numbers",)
+
+    def run(self, ctx):
+        return {"plugin": self.name, "total": sum(ctx.results["numbers"]["values"]), "pid": os.getpid()}
+
+class Numbers(Plugin):
+    name = "numbers"
+
+    def run(self, ctx):
+        return {"plugin": self.name, "values": list(range(10))}
+
+class Interrupt(Plugin):
+    name = "interrupt"
+
+    def run(self, ctx):
+        time.sleep(0.1)
+        raise KeyboardInterrupt
+
+class SlowFleet(Plugin):
+    name = "slow_fleet"
+
+    def __init__(self):
+        self.done = []
+
+    def run(self, ctx):
+        for outcome in ctx.map_repos(lambda n: time.sleep(0.05) or self.done.append(n), list(range(40)), max_workers=2):
+            pass
+        return {"plugin": self.name, "repos": len(self.done)}
+
+class TestRunner(FakeServerTestCase):
+    fleet = dict(repos=20, issues_per_repo=3, commits_per_repo=3, seed=5)
+
+    def sweep_calls(self, sweep) -> dict:
+        # No mirror configured: the in-memory default refreshes on every read
+        ctx = CareContext("octocat", GitHubClient("fake-token", self.server.url))
+        plugins = [DuplicatesPlugin(), IssuesPlugin(), DependenciesPlugin(), LinkRecoveryAgent()]
+        sweep(ctx, plugins)
+        return {route: r["calls"] for route, r in ctx.client.api_profile()["routes"].items()}
+
+    def test_sweep_costs_union_of_needs(self):
+        serial = self.sweep_calls(lambda ctx, plugins: [p.run(ctx) for p in plugins])
+        shared = self.sweep_calls(run_plugins)
+
+        repos = len(self.github.repos)
+        self.assertEqual(shared["POST /graphql"], 1)
+        self.assertEqual(shared["GET /repos/{o}/{r}/issues"], repos)
+        self.assertEqual(shared["GET /repos/{o}/{r}/git/trees/{ref}"], repos)
+        self.assertGreater(serial["POST /graphql"], 1)
+        self.assertGreater(serial["GET /repos/{o}/{r}/issues"], repos)
+        self.assertLess(sum(shared.values()), sum(serial.values()))
+
+    def test_link_recovery_reads_only_its_repos(self):
+        calls = self.sweep_calls(lambda ctx, plugins: run_plugins(ctx, [LinkRecoveryAgent()]))
+        self.assertLessEqual(calls["GET /repos/{o}/{r}/issues"], 5)
+
+    def test_prefetch_keeps_callers_lane(self):
+        ctx = CareContext("octocat", GitHubClient("fake-token", self.server.url))
+        lanes = []
+        original = ctx.store.sync_files
+
+        def spy(owner, repo, ref=None):
+            lanes.append(current_lane())
+            return original(owner, repo, ref)
+        ctx.store.sync_files = spy
+        with request_lane(INTERACTIVE):
+            counts = prefetch(ctx, {"repos", "files"})
+        self.assertEqual(counts, {"repos": len(self.github.repos), "files": len(self.github.repos)})
+        self.assertEqual(set(lanes), {INTERACTIVE})
+
+    def test_unknown_need_is_rejected(self):
+        class Broken(Plugin):
+            name = "broken"
+            needs = ("pull_requests",)
+        with self.assertRaises(ValueError):
+            union_needs([Broken()])
+
+class TestDag(unittest.TestCase):
+    def setUp(self):
+        self.ctx = CareContext("octocat", None)
+
+    def test_independent_plugins_overlap(self):
+        timings = {}
+        started = time.monotonic()
+        results = run_dag(self.ctx, [Step("a", delay=0.3), Step("b", delay=0.3), Step("c", ["a", "b"])], timings)
+        self.assertLess(time.monotonic() - started, 0.55)
+        self.assertEqual(results["c"]["inputs"], ["a", "b"])
+        self.assertGreaterEqual(timings["c"]["start"], max(timings["a"]["seconds"], timings["b"]["seconds"]))
+        self.assertEqual(timings["a"]["kind"], "io")
+
+    def test_failure_skips_dependents(self):
+        results = run_dag(self.ctx, [Step("a", fail=True), Step("b", ["a"]), Step("c")])
+        self.assertEqual(results["a"]["error"], "boom")
+        self.assertIn("skipped", results["b"]["error"])
+        self.assertEqual(results["c"]["plugin"], "c")
+
+    def test_cpu_plugin_runs_in_process(self):
+        timings = {}
+        results = run_dag(self.ctx, [SumCpu(), Numbers()], timings)
+        self.assertEqual(results["sum_cpu"]["total"], 45)
+        self.assertNotEqual(results["sum_cpu"]["pid"], os.getpid())
+        self.assertEqual(timings["sum_cpu"]["kind"], "cpu")
+
+    def test_interrupt_stops_the_sweep(self):
+        slow = SlowFleet()
+        started = time.monotonic()
+        with self.assertRaises(KeyboardInterrupt):
+            run_dag(self.ctx, [slow, Interrupt()])
+        self.assertLess(time.monotonic() - started, 0.5)
+        # The running plugin finishes only the repos already in flight
+        time.sleep(0.2)
+        self.assertLess(len(slow.done), 10)
+
+    def test_cycle_is_rejected(self):
+        with self.assertRaises(ValueError):
+            topological_order([Step("a", ["b"]), Step("b", ["a"])])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jwt
+from click.testing import CliRunner
+
+from caretaker.core.context import CareContext
+from caretaker.core.github_client import GitHubClient
+from caretaker.plugins import Plugin
+from caretaker.plugins.dependencies import DependenciesPlugin
+from tests.helpers import FakeServerTestCase
+
+class Whole(Plugin):
+    name = "whole"
+
+    def run(self, ctx):
+        return {"plugin": self.name, "ok": True}
+
+def sse_events(body: str):
+    events = []
+    for frame in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((fields.get("event", "message"), json.loads(fields["data"])))
+    return events
+
+class TestStreaming(FakeServerTestCase):
+    fleet = dict(repos=40, issues_per_repo=1, commits_per_repo=1, seed=13)
+
+    def context(self, max_concurrency: int = 8) -> CareContext:
+        return CareContext("octocat", GitHubClient("stream-token", self.server.url), max_concurrency=max_concurrency)
+
+    def trees(self) -> int:
+        return sum(n for (method, route), n in self.github.requests.items() if "/git/trees/" in route)
+
+    def test_first_record_before_fleet_is_done(self):
+        ctx = self.context(max_concurrency=2)
+        before = self.trees()
+        records = DependenciesPlugin().stream(ctx)
+        first = next(records)
+        self.assertIn("repo", first)
+        # Only the repos up to the first hit, plus the in-flight window, have been listed
+        self.assertLess(self.trees() - before, len(self.github.repos))
+        records.close()
+
+    def test_run_collects_stream(self):
+        plugin = DependenciesPlugin()
+        streamed = list(plugin.stream(self.context()))
+        self.assertEqual(plugin.run(self.context()), {"plugin": "dependencies", "repos": streamed})
+        self.assertEqual(list(Whole().stream(self.context())), [{"plugin": "whole", "ok": True}])
+
+    def test_sse_endpoint(self):
+        from caretaker.app import app
+        client = app.test_client()
+        token = jwt.encode({"user": "test_user"}, app.config["SECRET_KEY"], algorithm="HS256")
+        headers = {"Authorization": f"Bearer {token}"}
+        with patch("caretaker.app.ctx", self.context()):
+            response = client.get("/stream/dependencies", headers=headers)
+            self.assertEqual(response.mimetype, "text/event-stream")
+            events = sse_events(response.get_data(as_text=True))
+            self.assertEqual(client.get("/stream/nope", headers=headers).status_code, 404)
+        self.assertEqual(events[-1], ("done", {"records": len(events) - 1}))
+        self.assertTrue(all(kind == "message" and "repo" in data for kind, data in events[:-1]))
+
+    def test_cli_prints_ndjson(self):
+        from caretaker_cli import cli
+        tmp = tempfile.mkdtemp()
+        try:
+            env = {"GH_API": self.server.url, "GH_TOKEN": "stream-token", "GH_CACHE_DIR": tmp}
+            result = CliRunner().invoke(cli, ["stream", "dependencies", "--owner", "octocat"], env=env)
+        finally:
+            shutil.rmtree(tmp)
+        self.assertEqual(result.exit_code, 0, result.output)
+        records = [json.loads(line) for line in result.output.splitlines()]
+        self.assertEqual(records, list(DependenciesPlugin().stream(self.context())))
+
+if __name__ == "__main__":
+    unittest.main()
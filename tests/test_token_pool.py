@@ -0,0 +1,79 @@
+import sys
+import os
+import time
+import unittest
+import uuid
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from caretaker.core.config import Config
+from caretaker.core.github_client import GitHubClient
+from caretaker.core.token_pool import TokenPool
+from tests.helpers import make_response
+
+def rate_headers(remaining, resource="core"):
+    return {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset": str(int(time.time()) + 3600), "X-RateLimit-Resource": resource}
+
+class TestTokenPool(unittest.TestCase):
+    def setUp(self):
+        # Governors are process-wide per token, so every test uses fresh tokens
+        run = uuid.uuid4().hex[:8]
+        self.read_a, self.read_b, self.writer = f"a-{run}", f"b-{run}", f"w-{run}"
+        self.pool = TokenPool([self.read_a, self.read_b], write_token=self.writer)
+        self.pool.governor(self.read_a).observe(200, rate_headers(2000))
+        self.pool.governor(self.read_b).observe(200, rate_headers(4000))
+        self.pool.governor(self.read_a).observe(200, rate_headers(4000, "graphql"))
+        self.pool.governor(self.read_b).observe(200, rate_headers(200, "graphql"))
+        self.pool.governor(self.writer).observe(200, rate_headers(1000))
+        self.pool.governor(self.writer).observe(200, rate_headers(1000, "graphql"))
+        self.client = GitHubClient(self.writer, pool=self.pool)
+        self.client.session.request = MagicMock(return_value=make_response(200, {}))
+
+    def sent_with(self):
+        return self.client.session.request.call_args.kwargs["headers"]["Authorization"]
+
+    def test_reads_use_token_with_most_headroom(self):
+        self.client.get_repo("o", "r")
+        self.assertEqual(self.sent_with(), f"Bearer {self.read_b}")
+
+    def test_writes_are_pinned(self):
+        self.client.update_repo("o", "r", description="x")
+        self.assertEqual(self.sent_with(), f"Bearer {self.writer}")
+
+    def test_graphql_queries_are_reads_and_mutations_writes(self):
+        self.client.graphql("query { viewer { login } }")
+        self.assertEqual(self.sent_with(), f"Bearer {self.read_a}")
+        self.client.graphql("mutation { closeIssue(input: {issueId: \"1\"}) { clientMutationId } }")
+        self.assertEqual(self.sent_with(), f"Bearer {self.writer}")
+
+    def test_throttled_token_hands_over(self):
+        used = []
+
+        def fake_request(method, url, params=None, json=None, headers=None, timeout=None):
+            used.append(headers["Authorization"])
+            if headers["Authorization"] == f"Bearer {self.read_b}":
+                return make_response(429, {}, {"Retry-After": "600"})
+            return make_response(200, {"ok": True})
+        self.client.session.request = MagicMock(side_effect=fake_request)
+        resp = self.client._request("GET", "/repos/o/r")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(used, [f"Bearer {self.read_b}", f"Bearer {self.read_a}"])
+
+    def test_profile_reports_each_token(self):
+        profile = self.client.api_profile()
+        self.assertEqual(len(profile["rate_limit"]), 3)
+        self.assertNotIn(self.writer, profile["rate_limit"])
+
+class TestConfigTokens(unittest.TestCase):
+    def test_extra_tokens_and_write_token(self):
+        env = {"GH_TOKEN": "main", "GH_TOKENS": "extra1, extra2,main", "GH_WRITE_TOKEN": ""}
+        with patch.dict(os.environ, env):
+            cfg = Config()
+        self.assertEqual(cfg.github_tokens, ["main", "extra1", "extra2"])
+        self.assertEqual(cfg.write_token, "main")
+
+if __name__ == '__main__':
+    unittest.main()
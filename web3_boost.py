@@ -43,12 +43,15 @@ def boost_web3_profile():
         "HyperCode-V2.0"
     ]
 
+    batch = client.batch_writes()
     for repo in target_repos:
-        print(f"   → Updating homepage for {repo}...")
-        if client.update_repo(GITHUB_USER, repo, homepage=IPFS_LINK):
+        batch.update_repo(GITHUB_USER, repo, homepage=IPFS_LINK)
+    for op in batch.flush():
+        print(f"   → Updating homepage for {op.repo}...")
+        if op.ok:
             print("      ✅ Done.")
         else:
-            print(f"      ⚠️ Failed (Repo might not exist).")
+            print(f"      ⚠️ Failed ({op.error}).")
 
     print("\n✨ Web3 Integration Complete! You are now decentralized.")
 